@@ -1,10 +1,63 @@
 from __future__ import annotations
 
+import socket
+from http.cookiejar import DefaultCookiePolicy
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 
 from .errors import KitErrorPayload, AiKitError, classify_status
+from .jsonlib import dumps_bytes, loads
+
+
+# A larger receive buffer lets one recv drain many SSE events from a fast stream.
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_RCVBUF, 256 * 1024),
+]
+
+
+class _PooledAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("socket_options", _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> Any:
+        proxy_kwargs.setdefault("socket_options", _SOCKET_OPTIONS)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+def create_session() -> requests.Session:
+    session = requests.Session()
+    adapter = _PooledAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Fallback for callers that don't bring their own session, so back-to-back
+# calls to the same host keep their connection instead of a fresh TLS handshake.
+# Every adapter and API key may share it, so it never stores cookies: a
+# Set-Cookie from one tenant's response must not ride along on another's request.
+_SESSION = create_session()
+_SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+
+@lru_cache(maxsize=64)
+def default_headers(api_key: Optional[str] = None, organization: Optional[str] = None) -> Dict[str, str]:
+    """Bearer-auth JSON headers, memoized per key so adapters share one dict.
+
+    The result is shared: pass it straight to request_json/request_stream and
+    never mutate it.
+    """
+    headers = {"Content-Type": "application/json"}
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+    if organization:
+        headers["OpenAI-Organization"] = organization
+    return headers
 
 
 def request_json(
@@ -13,12 +66,14 @@ def request_json(
     headers: Dict[str, str],
     json_body: Optional[Dict[str, Any]] = None,
     timeout: Optional[float] = None,
+    session: Optional[requests.Session] = None,
 ) -> Dict[str, Any]:
-    response = requests.request(
+    headers, body = _encode_json_body(headers, json_body)
+    response = (session or _SESSION).request(
         method,
         url,
         headers=headers,
-        json=json_body,
+        data=body,
         timeout=timeout,
     )
     if response.status_code >= 400:
@@ -31,7 +86,7 @@ def request_json(
                 upstreamStatus=response.status_code,
             )
         )
-    return response.json()
+    return loads(response.content)
 
 
 def request_stream(
@@ -40,12 +95,14 @@ def request_stream(
     headers: Dict[str, str],
     json_body: Optional[Dict[str, Any]] = None,
     timeout: Optional[float] = None,
+    session: Optional[requests.Session] = None,
 ):
-    response = requests.request(
+    headers, body = _encode_json_body(headers, json_body)
+    response = (session or _SESSION).request(
         method,
         url,
         headers=headers,
-        json=json_body,
+        data=body,
         timeout=timeout,
         stream=True,
     )
@@ -62,6 +119,19 @@ def request_stream(
     return response
 
 
+def _encode_json_body(
+    headers: Dict[str, str], json_body: Optional[Dict[str, Any]]
+) -> Tuple[Dict[str, str], Optional[bytes]]:
+    # Encode with jsonlib (orjson when installed) rather than letting the HTTP
+    # client run stdlib json; add the content type the json= path used to set.
+    if json_body is None:
+        return headers, None
+    if "Content-Type" not in headers and "content-type" not in headers:
+        if not any(key.lower() == "content-type" for key in headers):
+            headers = {**headers, "Content-Type": "application/json"}
+    return headers, dumps_bytes(json_body)
+
+
 def request_multipart(
     method: str,
     url: str,
@@ -70,12 +140,13 @@ def request_multipart(
     file_field: Optional[Tuple[str, Tuple[str, bytes, str]]] = None,
     timeout: Optional[float] = None,
     expect_json: bool = True,
+    session: Optional[requests.Session] = None,
 ) -> Any:
     files = None
     if file_field:
         field_name, file_tuple = file_field
         files = {field_name: file_tuple}
-    response = requests.request(
+    response = (session or _SESSION).request(
         method,
         url,
         headers=headers,
@@ -94,5 +165,97 @@ def request_multipart(
             )
         )
     if expect_json:
-        return response.json()
+        return loads(response.content)
     return response.text
+
+
+def require_httpx():
+    try:
+        import httpx
+    except ImportError as exc:  # pragma: no cover - dependency issue
+        raise RuntimeError(
+            "httpx is required for async provider calls. "
+            "Install it with `pip install ai-kit-inference[async]`."
+        ) from exc
+    return httpx
+
+
+_ASYNC_CLIENT: Any = None
+
+
+def shared_async_client() -> Any:
+    """Process-wide httpx.AsyncClient used when a caller doesn't pass its own.
+
+    HTTP/2 lets concurrent requests to one host multiplex over a single
+    connection; it needs the optional ``h2`` package and is skipped without it.
+    """
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None:
+        httpx = require_httpx()
+        limits = httpx.Limits(max_connections=256, max_keepalive_connections=64)
+        try:
+            _ASYNC_CLIENT = httpx.AsyncClient(http2=True, limits=limits, timeout=None)
+        except ImportError:
+            _ASYNC_CLIENT = httpx.AsyncClient(limits=limits, timeout=None)
+    return _ASYNC_CLIENT
+
+
+async def request_json_async(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    json_body: Optional[Dict[str, Any]] = None,
+    timeout: Optional[float] = None,
+    client: Any = None,
+) -> Dict[str, Any]:
+    headers, body = _encode_json_body(headers, json_body)
+    response = await (client or shared_async_client()).request(
+        method,
+        url,
+        headers=headers,
+        content=body,
+        timeout=timeout,
+    )
+    if response.status_code >= 400:
+        body = (response.text or "").strip()
+        message = body or f"Upstream HTTP {response.status_code} for {url}"
+        raise AiKitError(
+            KitErrorPayload(
+                kind=classify_status(response.status_code),
+                message=message,
+                upstreamStatus=response.status_code,
+            )
+        )
+    return loads(response.content)
+
+
+async def request_stream_async(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    json_body: Optional[Dict[str, Any]] = None,
+    timeout: Optional[float] = None,
+    client: Any = None,
+):
+    client = client or shared_async_client()
+    headers, body = _encode_json_body(headers, json_body)
+    request = client.build_request(
+        method,
+        url,
+        headers=headers,
+        content=body,
+        timeout=timeout,
+    )
+    response = await client.send(request, stream=True)
+    if response.status_code >= 400:
+        body = (await response.aread()).decode("utf-8", errors="replace").strip()
+        await response.aclose()
+        message = body or f"Upstream HTTP {response.status_code} for {url}"
+        raise AiKitError(
+            KitErrorPayload(
+                kind=classify_status(response.status_code),
+                message=message,
+                upstreamStatus=response.status_code,
+            )
+        )
+    return response
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-import json
-from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
-from urllib.parse import parse_qs
+import asyncio
+import threading
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote_plus
 
 from .errors import ErrorKind, KitErrorPayload, AiKitError, to_kit_error
+from .jsonlib import dumps_bytes, loads
 from .hub import Kit
 from .types import (
     GenerateInput,
@@ -14,6 +18,7 @@ from .types import (
     VideoGenerateInput,
     TranscribeInput,
     as_json_dict,
+    to_json_bytes,
 )
 
 ASGIApp = Callable[[Dict[str, Any], Callable[..., Awaitable[Dict[str, Any]]], Callable[..., Awaitable[None]]], Awaitable[None]]
@@ -35,60 +40,41 @@ def create_asgi_app(kit: Kit, base_path: str = "") -> ASGIApp:
                     return
                 path = path[len(base) :] or "/"
 
-        if path == "/provider-models":
-            if method != "GET":
-                await _respond_text(send, 405, "method not allowed")
-                return
-            await _handle_models(kit, scope, send)
-            return
-        if path == "/generate":
-            if method != "POST":
-                await _respond_text(send, 405, "method not allowed")
-                return
-            await _handle_generate(kit, receive, send)
-            return
-        if path == "/image":
-            if method != "POST":
-                await _respond_text(send, 405, "method not allowed")
-                return
-            await _handle_image(kit, receive, send)
-            return
-        if path == "/mesh":
-            if method != "POST":
-                await _respond_text(send, 405, "method not allowed")
-                return
-            await _handle_mesh(kit, receive, send)
+        route = _ROUTES.get(path)
+        if route is None:
+            await _respond_text(send, 404, "not found")
             return
-        if path == "/video":
-            if method != "POST":
-                await _respond_text(send, 405, "method not allowed")
-                return
-            await _handle_video(kit, receive, send)
+        allowed, handler = route
+        if method != allowed:
+            await _respond_text(send, 405, "method not allowed")
             return
-        if path == "/speech":
-            if method != "POST":
-                await _respond_text(send, 405, "method not allowed")
-                return
-            await _handle_speech(kit, receive, send)
-            return
-        if path == "/transcribe":
-            if method != "POST":
-                await _respond_text(send, 405, "method not allowed")
-                return
-            await _handle_transcribe(kit, receive, send)
-            return
-        if path == "/generate/stream":
-            if method != "POST":
-                await _respond_text(send, 405, "method not allowed")
-                return
-            await _handle_stream(kit, receive, send)
-            return
-
-        await _respond_text(send, 404, "not found")
+        await handler(kit, scope, receive, send)
 
     return app
 
 
+def serve(kit: Kit, host: str = "127.0.0.1", port: int = 8000, base_path: str = "", **options: Any) -> None:
+    """Serve create_asgi_app(kit) with uvicorn.
+
+    uvicorn's default ``loop="auto"`` and ``http="auto"`` pick uvloop and
+    httptools when installed (the ``server`` extra pulls both in), which cuts
+    per-frame overhead on SSE streams. Extra keyword options go to uvicorn.run.
+    """
+    uvicorn = require_uvicorn()
+    uvicorn.run(create_asgi_app(kit, base_path), host=host, port=port, **options)
+
+
+def require_uvicorn():
+    try:
+        import uvicorn
+    except ImportError as exc:  # pragma: no cover - dependency issue
+        raise RuntimeError(
+            "uvicorn is required for ai_kit.http_asgi.serve. "
+            "Install it with `pip install ai-kit-inference[server]`."
+        ) from exc
+    return uvicorn
+
+
 def _normalize_base_path(value: str) -> str:
     if not value:
         return ""
@@ -98,86 +84,88 @@ def _normalize_base_path(value: str) -> str:
     return base
 
 
-async def _handle_models(kit: Kit, scope: Dict[str, Any], send) -> None:
+async def _handle_models(kit: Kit, scope: Dict[str, Any], receive, send) -> None:
     try:
-        query = _parse_query(scope)
-        providers = _parse_providers(_first_query_value(query, "providers"))
-        refresh = _should_refresh(query.get("refresh", []))
-        models = kit.list_models(providers=providers, refresh=refresh)
-        await _respond_json(send, 200, as_json_dict(models))
+        if not scope.get("query_string"):
+            # Plain GET /provider-models: all providers, cached.
+            await _respond_body(send, 200, kit.list_models_json())
+            return
+        query = _first_query_values(scope, _MODELS_QUERY_KEYS)
+        providers = _parse_providers(query.get("providers"))
+        refresh = _should_refresh(query.get("refresh"))
+        await _respond_body(send, 200, kit.list_models_json(providers=providers, refresh=refresh))
     except Exception as err:
         await _send_json_error(send, err)
 
 
-async def _handle_generate(kit: Kit, receive, send) -> None:
+async def _handle_generate(kit: Kit, scope: Dict[str, Any], receive, send) -> None:
     try:
         payload = await _read_json(receive)
         input_data = _normalize_generate_input(payload)
         output = kit.generate(input_data)
-        await _respond_json(send, 200, as_json_dict(output))
+        await _respond_json(send, 200, output)
     except Exception as err:
         await _send_json_error(send, err)
 
 
-async def _handle_image(kit: Kit, receive, send) -> None:
+async def _handle_image(kit: Kit, scope: Dict[str, Any], receive, send) -> None:
     try:
         payload = await _read_json(receive)
         input_data = _normalize_image_input(payload)
         output = kit.generate_image(input_data)
-        await _respond_json(send, 200, as_json_dict(output))
+        await _respond_json(send, 200, output)
     except Exception as err:
         await _send_json_error(send, err)
 
 
-async def _handle_mesh(kit: Kit, receive, send) -> None:
+async def _handle_mesh(kit: Kit, scope: Dict[str, Any], receive, send) -> None:
     try:
         payload = await _read_json(receive)
         input_data = _normalize_mesh_input(payload)
         output = kit.generate_mesh(input_data)
-        await _respond_json(send, 200, as_json_dict(output))
+        await _respond_json(send, 200, output)
     except Exception as err:
         await _send_json_error(send, err)
 
 
-async def _handle_video(kit: Kit, receive, send) -> None:
+async def _handle_video(kit: Kit, scope: Dict[str, Any], receive, send) -> None:
     try:
         payload = await _read_json(receive)
         input_data = _normalize_video_input(payload)
         output = kit.generate_video(input_data)
-        await _respond_json(send, 200, as_json_dict(output))
+        await _respond_json(send, 200, output)
     except Exception as err:
         await _send_json_error(send, err)
 
 
-async def _handle_speech(kit: Kit, receive, send) -> None:
+async def _handle_speech(kit: Kit, scope: Dict[str, Any], receive, send) -> None:
     try:
         payload = await _read_json(receive)
         input_data = _normalize_speech_input(payload)
         output = kit.generate_speech(input_data)
-        await _respond_json(send, 200, as_json_dict(output))
+        await _respond_json(send, 200, output)
     except Exception as err:
         await _send_json_error(send, err)
 
 
-async def _handle_transcribe(kit: Kit, receive, send) -> None:
+async def _handle_transcribe(kit: Kit, scope: Dict[str, Any], receive, send) -> None:
     try:
         payload = await _read_json(receive)
         input_data = _normalize_transcribe_input(payload)
         output = kit.transcribe(input_data)
-        await _respond_json(send, 200, as_json_dict(output))
+        await _respond_json(send, 200, output)
     except Exception as err:
         await _send_json_error(send, err)
 
 
-async def _handle_stream(kit: Kit, receive, send) -> None:
+async def _handle_stream(kit: Kit, scope: Dict[str, Any], receive, send) -> None:
     started = False
     try:
         payload = await _read_json(receive)
         input_data = _normalize_generate_input(payload, force_stream=True)
         await _start_sse(send)
         started = True
-        for chunk in kit.stream_generate(input_data):
-            await _send_sse_event(send, "chunk", as_json_dict(chunk), more_body=True)
+        await _send_coalesced_frames(send, kit.stream_generate(input_data))
         await _send_sse_event(send, "done", {"ok": True}, more_body=False)
     except Exception as err:
         kit_err = to_kit_error(err)
@@ -189,23 +177,43 @@ async def _handle_stream(kit: Kit, receive, send) -> None:
             "error",
             {
                 "kind": kit_err.kind.value,
-                "message": kit_err.message,
+                "message": str(kit_err),
                 "requestId": kit_err.requestId,
             },
             more_body=False,
         )
 
 
+_MODELS_QUERY_KEYS = ("providers", "refresh")
+
+# path -> (method, handler); every handler takes (kit, scope, receive, send).
+_ROUTES: Dict[str, Tuple[str, Callable[..., Awaitable[None]]]] = {
+    "/provider-models": ("GET", _handle_models),
+    "/generate": ("POST", _handle_generate),
+    "/image": ("POST", _handle_image),
+    "/mesh": ("POST", _handle_mesh),
+    "/video": ("POST", _handle_video),
+    "/speech": ("POST", _handle_speech),
+    "/transcribe": ("POST", _handle_transcribe),
+    "/generate/stream": ("POST", _handle_stream),
+}
+
+
 async def _read_body(receive) -> bytes:
-    body = b""
+    parts: List[bytes] = []
     while True:
         message = await receive()
         if message.get("type") != "http.request":
             continue
-        body += message.get("body", b"")
+        chunk = message.get("body", b"")
         if not message.get("more_body"):
-            break
-    return body
+            if not parts:
+                # Typical JSON request: the whole body arrives in one message.
+                return chunk
+            parts.append(chunk)
+            return b"".join(parts)
+        if chunk:
+            parts.append(chunk)
 
 
 async def _read_json(receive) -> Any:
@@ -215,191 +223,123 @@ async def _read_json(receive) -> Any:
             KitErrorPayload(kind=ErrorKind.VALIDATION, message="Body must be valid JSON")
         )
     try:
-        return json.loads(body.decode("utf-8"))
-    except json.JSONDecodeError as exc:
+        return loads(body)
+    except ValueError as exc:
         raise AiKitError(
             KitErrorPayload(kind=ErrorKind.VALIDATION, message="Body must be valid JSON")
         ) from exc
 
 
-def _parse_query(scope: Dict[str, Any]) -> Dict[str, List[str]]:
+def _first_query_values(scope: Dict[str, Any], keys: Tuple[str, ...]) -> Dict[str, str]:
+    # First non-blank value for each wanted key, matching parse_qs' defaults
+    # (``&`` separators, blank values and bare names skipped) without building
+    # the full query dict. Only segments with escapes pay for unquoting.
     raw = scope.get("query_string") or b""
-    parsed = parse_qs(raw.decode("utf-8"))
-    return {k: [str(v) for v in values] for k, values in parsed.items()}
+    found: Dict[str, str] = {}
+    if not raw:
+        return found
+    for segment in raw.split(b"&"):
+        name, sep, value = segment.partition(b"=")
+        if not sep or not value:
+            continue
+        key = _unquote_query(name)
+        if key in keys and key not in found:
+            found[key] = _unquote_query(value)
+            if len(found) == len(keys):
+                break
+    return found
 
 
-def _first_query_value(query: Dict[str, List[str]], key: str) -> Optional[str]:
-    values = query.get(key)
-    if not values:
-        return None
-    return values[0]
+def _unquote_query(part: bytes) -> str:
+    text = part.decode("utf-8")
+    if "%" in text or "+" in text:
+        return unquote_plus(text)
+    return text
 
 
 def _parse_providers(raw: Optional[str]) -> Optional[List[str]]:
     if not raw:
         return None
-    providers = [entry.strip() for entry in raw.split(",") if entry.strip()]
+    providers = [entry for entry in map(str.strip, raw.split(",")) if entry]
     return providers or None
 
 
-def _should_refresh(values: Iterable[str]) -> bool:
-    value = next(iter(values), None)
+def _should_refresh(value: Optional[str]) -> bool:
     if value is None:
         return False
     normalized = value.strip().lower()
     return normalized in ("", "1", "true", "yes", "on")
 
 
-def _normalize_generate_input(payload: Any, force_stream: bool = False) -> GenerateInput:
+def _required(field: str, expected: type, description: str) -> Tuple[str, type, KitErrorPayload]:
+    # The rejection payload is constant per field, so it is built once here;
+    # AiKitError copies its fields, so sharing it across raises is safe.
+    message = f"{field} is required and must be {description}"
+    return field, expected, KitErrorPayload(kind=ErrorKind.VALIDATION, message=message)
+
+
+_PROVIDER_REQUIRED = _required("provider", str, "a string")
+_MODEL_REQUIRED = _required("model", str, "a string")
+_GENERATE_REQUIRED = (_PROVIDER_REQUIRED, _MODEL_REQUIRED, _required("messages", list, "an array"))
+_PROMPT_REQUIRED = (_PROVIDER_REQUIRED, _MODEL_REQUIRED, _required("prompt", str, "a string"))
+_SPEECH_REQUIRED = (_PROVIDER_REQUIRED, _MODEL_REQUIRED, _required("text", str, "a string"))
+_TRANSCRIBE_REQUIRED = (_PROVIDER_REQUIRED, _MODEL_REQUIRED, _required("audio", dict, "an object"))
+
+# Input types whose fields are all copied from the body as-is (None when
+# absent), in dataclass field order so they can be passed positionally.
+_GENERATE_FIELDS = tuple(field.name for field in fields(GenerateInput))
+_IMAGE_FIELDS = tuple(field.name for field in fields(ImageGenerateInput))
+_MESH_FIELDS = tuple(field.name for field in fields(MeshGenerateInput))
+_VIDEO_FIELDS = tuple(field.name for field in fields(VideoGenerateInput))
+
+
+def _check_body(payload: Any, type_name: str) -> None:
     if not isinstance(payload, dict):
-        raise AiKitError(
-            KitErrorPayload(
-                kind=ErrorKind.VALIDATION,
-                message="Request body must be a GenerateInput object",
-            )
-        )
-    provider = payload.get("provider")
-    model = payload.get("model")
-    messages = payload.get("messages")
-    if not isinstance(provider, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="provider is required and must be a string")
-        )
-    if not isinstance(model, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="model is required and must be a string")
-        )
-    if not isinstance(messages, list):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="messages is required and must be an array")
-        )
-    return GenerateInput(
-        provider=provider,
-        model=model,
-        messages=messages,
-        tools=payload.get("tools"),
-        toolChoice=payload.get("toolChoice"),
-        responseFormat=payload.get("responseFormat"),
-        temperature=payload.get("temperature"),
-        topP=payload.get("topP"),
-        maxTokens=payload.get("maxTokens"),
-        stream=True if force_stream else payload.get("stream"),
-        metadata=payload.get("metadata"),
-    )
+        raise AiKitError(_body_error(type_name))
+
+
+@lru_cache(maxsize=None)
+def _body_error(type_name: str) -> KitErrorPayload:
+    return KitErrorPayload(kind=ErrorKind.VALIDATION, message=f"Request body must be {type_name} object")
+
+
+def _check_required(
+    payload: Dict[str, Any], required: Tuple[Tuple[str, type, KitErrorPayload], ...]
+) -> None:
+    for field, expected, error in required:
+        if not isinstance(payload.get(field), expected):
+            raise AiKitError(error)
+
+
+def _normalize_generate_input(payload: Any, force_stream: bool = False) -> GenerateInput:
+    _check_body(payload, "a GenerateInput")
+    _check_required(payload, _GENERATE_REQUIRED)
+    input = GenerateInput(*map(payload.get, _GENERATE_FIELDS))
+    if force_stream:
+        input.stream = True
+    return input
 
 
 def _normalize_image_input(payload: Any) -> ImageGenerateInput:
-    if not isinstance(payload, dict):
-        raise AiKitError(
-            KitErrorPayload(
-                kind=ErrorKind.VALIDATION,
-                message="Request body must be an ImageGenerateInput object",
-            )
-        )
-    provider = payload.get("provider")
-    model = payload.get("model")
-    prompt = payload.get("prompt")
-    if not isinstance(provider, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="provider is required and must be a string")
-        )
-    if not isinstance(model, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="model is required and must be a string")
-        )
-    if not isinstance(prompt, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="prompt is required and must be a string")
-        )
-    return ImageGenerateInput(
-        provider=provider,
-        model=model,
-        prompt=prompt,
-        size=payload.get("size"),
-        inputImages=payload.get("inputImages"),
-        parameters=payload.get("parameters"),
-    )
+    _check_body(payload, "an ImageGenerateInput")
+    _check_required(payload, _PROMPT_REQUIRED)
+    return ImageGenerateInput(*map(payload.get, _IMAGE_FIELDS))
 
 
 def _normalize_mesh_input(payload: Any) -> MeshGenerateInput:
-    if not isinstance(payload, dict):
-        raise AiKitError(
-            KitErrorPayload(
-                kind=ErrorKind.VALIDATION,
-                message="Request body must be a MeshGenerateInput object",
-            )
-        )
-    provider = payload.get("provider")
-    model = payload.get("model")
-    prompt = payload.get("prompt")
-    if not isinstance(provider, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="provider is required and must be a string")
-        )
-    if not isinstance(model, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="model is required and must be a string")
-        )
-    if not isinstance(prompt, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="prompt is required and must be a string")
-        )
-    return MeshGenerateInput(
-        provider=provider,
-        model=model,
-        prompt=prompt,
-        inputImages=payload.get("inputImages"),
-        format=payload.get("format"),
-    )
+    _check_body(payload, "a MeshGenerateInput")
+    _check_required(payload, _PROMPT_REQUIRED)
+    return MeshGenerateInput(*map(payload.get, _MESH_FIELDS))
 
 
 def _normalize_video_input(payload: Any) -> VideoGenerateInput:
-    if not isinstance(payload, dict):
-        raise AiKitError(
-            KitErrorPayload(
-                kind=ErrorKind.VALIDATION,
-                message="Request body must be a VideoGenerateInput object",
-            )
-        )
-    provider = payload.get("provider")
-    model = payload.get("model")
-    prompt = payload.get("prompt")
-    if not isinstance(provider, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="provider is required and must be a string")
-        )
-    if not isinstance(model, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="model is required and must be a string")
-        )
-    if not isinstance(prompt, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="prompt is required and must be a string")
-        )
-    return VideoGenerateInput(
-        provider=provider,
-        model=model,
-        prompt=prompt,
-        startImage=payload.get("startImage"),
-        inputImages=payload.get("inputImages"),
-        audioUrl=payload.get("audioUrl"),
-        audioBase64=payload.get("audioBase64"),
-        duration=payload.get("duration"),
-        aspectRatio=payload.get("aspectRatio"),
-        negativePrompt=payload.get("negativePrompt"),
-        generateAudio=payload.get("generateAudio"),
-        parameters=payload.get("parameters"),
-    )
+    _check_body(payload, "a VideoGenerateInput")
+    _check_required(payload, _PROMPT_REQUIRED)
+    return VideoGenerateInput(*map(payload.get, _VIDEO_FIELDS))
 
 
 def _normalize_speech_input(payload: Any) -> SpeechGenerateInput:
-    if not isinstance(payload, dict):
-        raise AiKitError(
-            KitErrorPayload(
-                kind=ErrorKind.VALIDATION,
-                message="Request body must be a SpeechGenerateInput object",
-            )
-        )
+    _check_body(payload, "a SpeechGenerateInput")
     input_data = dict(payload)
     if "text" not in input_data and isinstance(input_data.get("input"), str):
         input_data["text"] = input_data.get("input")
@@ -409,47 +349,13 @@ def _normalize_speech_input(payload: Any) -> SpeechGenerateInput:
     input_data.pop("response_format", None)
     if "responseFormat" not in input_data and isinstance(input_data.get("format"), str):
         input_data["responseFormat"] = input_data.get("format")
-    provider = input_data.get("provider")
-    if not isinstance(provider, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="provider is required and must be a string")
-        )
-    model = input_data.get("model")
-    if not isinstance(model, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="model is required and must be a string")
-        )
-    text = input_data.get("text")
-    if not isinstance(text, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="text is required and must be a string")
-        )
+    _check_required(input_data, _SPEECH_REQUIRED)
     return SpeechGenerateInput(**input_data)
 
 
 def _normalize_transcribe_input(payload: Any) -> TranscribeInput:
-    if not isinstance(payload, dict):
-        raise AiKitError(
-            KitErrorPayload(
-                kind=ErrorKind.VALIDATION,
-                message="Request body must be a TranscribeInput object",
-            )
-        )
-    provider = payload.get("provider")
-    model = payload.get("model")
-    audio = payload.get("audio")
-    if not isinstance(provider, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="provider is required and must be a string")
-        )
-    if not isinstance(model, str):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="model is required and must be a string")
-        )
-    if not isinstance(audio, dict):
-        raise AiKitError(
-            KitErrorPayload(kind=ErrorKind.VALIDATION, message="audio is required and must be an object")
-        )
+    _check_body(payload, "a TranscribeInput")
+    _check_required(payload, _TRANSCRIBE_REQUIRED)
     response_format = payload.get("responseFormat")
     if response_format is None:
         response_format = payload.get("response_format")
@@ -459,9 +365,9 @@ def _normalize_transcribe_input(payload: Any) -> TranscribeInput:
     if isinstance(timestamp_granularities, str):
         timestamp_granularities = [timestamp_granularities]
     return TranscribeInput(
-        provider=provider,
-        model=model,
-        audio=audio,
+        provider=payload["provider"],
+        model=payload["model"],
+        audio=payload["audio"],
         language=payload.get("language"),
         prompt=payload.get("prompt"),
         temperature=payload.get("temperature"),
@@ -471,16 +377,32 @@ def _normalize_transcribe_input(payload: Any) -> TranscribeInput:
     )
 
 
+# Larger JSON bodies (base64 images, audio, meshes) go out in slices of this
+# size so the server can flush as it writes instead of taking one multi-MB send.
+_BODY_CHUNK_SIZE = 64 * 1024
+
+
 async def _respond_json(send, status: int, payload: Any) -> None:
-    body = json.dumps(payload).encode("utf-8")
+    await _respond_body(send, status, to_json_bytes(payload))
+
+
+async def _respond_body(send, status: int, body: bytes) -> None:
     await send(
         {
             "type": "http.response.start",
             "status": status,
-            "headers": [(b"content-type", b"application/json")],
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+            ],
         }
     )
-    await send({"type": "http.response.body", "body": body})
+    if len(body) <= _BODY_CHUNK_SIZE:
+        await send({"type": "http.response.body", "body": body})
+        return
+    for start in range(0, len(body), _BODY_CHUNK_SIZE):
+        end = start + _BODY_CHUNK_SIZE
+        await send({"type": "http.response.body", "body": body[start:end], "more_body": end < len(body)})
 
 
 async def _respond_text(send, status: int, text: str) -> None:
@@ -508,12 +430,95 @@ async def _start_sse(send) -> None:
     )
 
 
+# Same bytes as _send_sse_event("chunk", as_json_dict(chunk)) for a plain text delta.
+_TEXT_DELTA_EVENT_PREFIX = b'event: chunk\ndata: {"type":"delta","textDelta":'
+
+
+_SSE_EVENT_PREFIXES = {name: b"event: " + name.encode("ascii") + b"\ndata: " for name in ("chunk", "done", "error")}
+
+
 async def _send_sse_event(send, event: str, data: Any, more_body: bool) -> None:
-    payload = f"event: {event}\n" + f"data: {json.dumps(data)}\n\n"
+    prefix = _SSE_EVENT_PREFIXES.get(event)
+    if prefix is None:
+        prefix = b"event: " + event.encode("utf-8") + b"\ndata: "
+    await _send_sse_body(send, b"".join((prefix, dumps_bytes(data), b"\n\n")), more_body)
+
+
+def _chunk_frame(chunk: Any) -> bytes:
+    if chunk.is_text_delta():
+        return _TEXT_DELTA_EVENT_PREFIX + dumps_bytes(chunk.textDelta) + b"}\n\n"
+    return _SSE_EVENT_PREFIXES["chunk"] + dumps_bytes(as_json_dict(chunk)) + b"\n\n"
+
+
+_STREAM_FLUSH_BYTES = 4096
+# Frames the pump may run ahead of the client before it blocks.
+_STREAM_MAX_PENDING = 64
+_STREAM_DONE = object()
+
+
+async def _send_coalesced_frames(send, chunks: Iterator[Any]) -> None:
+    """Send SSE frames for a blocking chunk iterator without stalling the loop.
+
+    The iterator runs on its own thread and hands encoded frames over a queue.
+    Frames already waiting when the loop picks one up go out in the same body
+    message (up to _STREAM_FLUSH_BYTES), so a burst of tokens costs one send
+    while a lone token is still sent immediately. The pump holds one credit per
+    unsent frame, so a slow client stalls the upstream read instead of growing
+    the queue; when sending stops, the pump wakes, stops and closes ``chunks``.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    credits = threading.Semaphore(_STREAM_MAX_PENDING)
+    stopped = threading.Event()
+
+    def pump() -> None:
+        item: Any = _STREAM_DONE
+        try:
+            for chunk in chunks:
+                credits.acquire()
+                if stopped.is_set():
+                    break
+                loop.call_soon_threadsafe(queue.put_nowait, _chunk_frame(chunk))
+        except Exception as exc:
+            item = exc
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+        if not stopped.is_set():
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+
+    threading.Thread(target=pump, name="ai-kit-sse", daemon=True).start()
+    try:
+        while True:
+            item = await queue.get()
+            parts: List[bytes] = []
+            size = 0
+            while isinstance(item, bytes):
+                parts.append(item)
+                size += len(item)
+                if size >= _STREAM_FLUSH_BYTES or queue.empty():
+                    item = None
+                    break
+                item = queue.get_nowait()
+            if parts:
+                await _send_sse_body(send, parts[0] if len(parts) == 1 else b"".join(parts))
+                credits.release(len(parts))
+            if item is _STREAM_DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+    finally:
+        stopped.set()
+        # Unblock a pump waiting on credits so it can see ``stopped``.
+        credits.release(_STREAM_MAX_PENDING)
+
+
+async def _send_sse_body(send, body: bytes, more_body: bool = True) -> None:
     await send(
         {
             "type": "http.response.body",
-            "body": payload.encode("utf-8"),
+            "body": body,
             "more_body": more_body,
         }
     )
@@ -522,17 +527,18 @@ async def _send_sse_event(send, event: str, data: Any, more_body: bool) -> None:
 async def _send_json_error(send, err: Exception) -> None:
     kit_err = to_kit_error(err)
     status = _map_status(kit_err)
-    payload = {"error": {"kind": kit_err.kind.value, "message": kit_err.message}}
+    payload = {"error": {"kind": kit_err.kind.value, "message": str(kit_err)}}
     await _respond_json(send, status, payload)
 
 
+_STATUS_BY_KIND: Dict[ErrorKind, int] = {
+    ErrorKind.VALIDATION: 400,
+    ErrorKind.UNSUPPORTED: 400,
+    ErrorKind.PROVIDER_AUTH: 401,
+    ErrorKind.PROVIDER_RATE_LIMIT: 429,
+    ErrorKind.PROVIDER_UNAVAILABLE: 503,
+}
+
+
 def _map_status(err: AiKitError) -> int:
-    if err.kind in (ErrorKind.VALIDATION, ErrorKind.UNSUPPORTED):
-        return 400
-    if err.kind == ErrorKind.PROVIDER_AUTH:
-        return 401
-    if err.kind == ErrorKind.PROVIDER_RATE_LIMIT:
-        return 429
-    if err.kind == ErrorKind.PROVIDER_UNAVAILABLE:
-        return 503
-    return 500
+    return _STATUS_BY_KIND.get(err.kind, 500)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, replace
-from typing import Callable, Dict
+from functools import lru_cache
+from itertools import cycle
+from typing import Callable, Dict, Tuple
 
 from .errors import ErrorKind, KitErrorPayload, AiKitError, to_kit_error
 from .entitlements import fingerprint_api_key
@@ -27,45 +31,43 @@ from .types import (
     TranscribeOutput,
     Provider,
 )
-from .providers import (
-    AnthropicAdapter,
-    AnthropicConfig,
-    GeminiAdapter,
-    GeminiConfig,
-    OpenAIAdapter,
-    OpenAIConfig,
-    XAIAdapter,
-    XAIConfig,
-    OllamaAdapter,
-    OllamaConfig,
-    BedrockAdapter,
-    BedrockConfig,
-    ReplicateAdapter,
-    ReplicateConfig,
-    FalAdapter,
-    FalConfig,
-)
+from . import providers as provider_adapters
 
 
 @dataclass
 class KitConfig:
     providers: Dict[Provider, object]
     registry_ttl_seconds: int = 1800
+    registry_cache_dir: str | None = None
     adapters: Dict[Provider, object] | None = None
     adapter_factory: Callable[[Provider, EntitlementContext | None], object] | None = None
 
 
 class _KeyPool:
-    def __init__(self, keys: list[str]) -> None:
-        self._keys = keys
-        self._index = 0
+    def __init__(self, provider: Provider, keys: list[str]) -> None:
+        # (provider, key) pairs are fixed, so each key's context (fingerprint
+        # included) is built once; next_context hands out copies.
+        contexts = tuple(
+            EntitlementContext(provider=provider, apiKey=key, apiKeyFingerprint=fingerprint_api_key(key))
+            for key in keys
+        )
+        self._single = contexts[0] if len(contexts) == 1 else None
+        self._cycle = cycle(contexts) if len(contexts) > 1 else None
+        # next() on a cycle is only atomic under the GIL; the lock keeps the
+        # rotation fair on free-threaded builds too.
+        self._lock = threading.Lock()
+
+    def next_context(self) -> EntitlementContext | None:
+        """Next key's entitlement context in round-robin order.
 
-    def next(self) -> str:
-        if not self._keys:
-            return ""
-        key = self._keys[self._index % len(self._keys)]
-        self._index = (self._index + 1) % len(self._keys)
-        return key
+        Each call gets its own copy, so a request that edits its context
+        (e.g. sets tenantId) can't leak into other requests on the same key.
+        """
+        if self._cycle is None:
+            return replace(self._single) if self._single is not None else None
+        with self._lock:
+            context = next(self._cycle)
+        return replace(context)
 
 
 class Kit:
@@ -86,15 +88,29 @@ class Kit:
         if config.adapters:
             self._adapters.update(config.adapters)
         self._external_adapter_factory = config.adapter_factory
+        self._base_snapshots = {
+            provider: _base_snapshot(provider, cfg)
+            for provider, cfg in self._providers.items()
+            if provider in _PROVIDER_ADAPTERS
+        }
+        # Adapters built for an entitlement's API key are reused across requests
+        # so each key keeps one adapter (and its HTTP connection pool). Keyed by
+        # key fingerprint, least recently used first; evicted adapters are closed.
+        self._entitled_adapters: OrderedDict[Tuple[Provider, str], object] = OrderedDict()
+        self._entitled_lock = threading.Lock()
         self._registry = ModelRegistry(
             self._adapters,
             ttl_seconds=config.registry_ttl_seconds,
             adapter_factory=self._adapter_factory,
+            disk_cache_dir=config.registry_cache_dir,
         )
 
     def list_models(self, providers=None, refresh=False, entitlement=None):
         return self._registry.list_models(providers, refresh, entitlement)
 
+    def list_models_json(self, providers=None, refresh=False, entitlement=None) -> bytes:
+        return self._registry.list_models_json(providers, refresh, entitlement)
+
     def list_model_records(self, providers=None, refresh=False, entitlement=None):
         return self._registry.list_model_records(providers, refresh, entitlement)
 
@@ -398,24 +414,11 @@ class Kit:
         return _attach_cost_stream(adapter.stream_generate(input), input.provider, input.model)
 
     def _build_adapters(self, providers: Dict[Provider, object]):
-        adapters = {}
-        if "openai" in providers:
-            adapters["openai"] = OpenAIAdapter(providers["openai"])
-        if "anthropic" in providers:
-            adapters["anthropic"] = AnthropicAdapter(providers["anthropic"])
-        if "google" in providers:
-            adapters["google"] = GeminiAdapter(providers["google"])
-        if "xai" in providers:
-            adapters["xai"] = XAIAdapter(providers["xai"])
-        if "bedrock" in providers:
-            adapters["bedrock"] = BedrockAdapter(providers["bedrock"])
-        if "ollama" in providers:
-            adapters["ollama"] = OllamaAdapter(providers["ollama"])
-        if "replicate" in providers:
-            adapters["replicate"] = ReplicateAdapter(providers["replicate"])
-        if "fal" in providers:
-            adapters["fal"] = FalAdapter(providers["fal"])
-        return adapters
+        return {
+            provider: _adapter_classes(provider)[1](providers[provider])
+            for provider in _PROVIDER_ADAPTERS
+            if provider in providers
+        }
 
     def _prepare_providers(self, providers: Dict[Provider, object]):
         key_pools: Dict[Provider, _KeyPool] = {}
@@ -424,7 +427,7 @@ class Kit:
             keys = self._collect_keys(cfg)
             if provider in ("ollama", "bedrock"):
                 if keys:
-                    key_pools[provider] = _KeyPool(keys)
+                    key_pools[provider] = _KeyPool(provider, keys)
                     normalized[provider] = self._with_api_key(cfg, keys[0])
                 else:
                     normalized[provider] = cfg
@@ -436,22 +439,16 @@ class Kit:
                         message=f"Provider {provider} api key is required",
                     )
                 )
-            key_pools[provider] = _KeyPool(keys)
+            key_pools[provider] = _KeyPool(provider, keys)
             normalized[provider] = self._with_api_key(cfg, keys[0])
         return normalized, key_pools
 
     def _collect_keys(self, cfg: object) -> list[str]:
         api_key = getattr(cfg, "api_key", "") or ""
         api_keys = getattr(cfg, "api_keys", None) or []
-        keys = []
-        seen = set()
-        for raw in [api_key, *api_keys]:
-            trimmed = raw.strip() if isinstance(raw, str) else ""
-            if not trimmed or trimmed in seen:
-                continue
-            seen.add(trimmed)
-            keys.append(trimmed)
-        return keys
+        # dict.fromkeys dedupes while keeping first-seen order.
+        trimmed = (raw.strip() for raw in (api_key, *api_keys) if isinstance(raw, str))
+        return list(dict.fromkeys(key for key in trimmed if key))
 
     def _with_api_key(self, cfg: object, api_key: str) -> object:
         if hasattr(cfg, "__dataclass_fields__"):
@@ -463,16 +460,7 @@ class Kit:
 
     def _entitlement_for_provider(self, provider: Provider) -> EntitlementContext | None:
         pool = self._key_pools.get(provider)
-        if not pool:
-            return None
-        api_key = pool.next()
-        if not api_key:
-            return None
-        return EntitlementContext(
-            provider=provider,
-            apiKey=api_key,
-            apiKeyFingerprint=fingerprint_api_key(api_key),
-        )
+        return pool.next_context() if pool else None
 
     def _adapter_factory(
         self, provider: Provider, entitlement: EntitlementContext | None
@@ -483,77 +471,41 @@ class Kit:
                 return adapter
         if not entitlement or not entitlement.apiKey:
             return self._adapters.get(provider)
-        base_config = self._providers.get(provider)
-        if base_config is None:
+        return self._entitled_adapter(provider, entitlement.apiKey)
+
+    def _entitled_adapter(self, provider: Provider, api_key: str):
+        # Fingerprint the key ourselves; a caller-supplied apiKeyFingerprint
+        # must not select an adapter built for a different key.
+        cache_key = (provider, fingerprint_api_key(api_key))
+        with self._entitled_lock:
+            adapter = self._entitled_adapters.get(cache_key)
+            if adapter is not None:
+                self._entitled_adapters.move_to_end(cache_key)
+                return adapter
+        built = self._build_entitled_adapter(provider, api_key)
+        if built is None:
             return None
-        if provider == "openai":
-            config = OpenAIConfig(
-                api_key=entitlement.apiKey,
-                base_url=getattr(base_config, "base_url", "https://api.openai.com"),
-                organization=getattr(base_config, "organization", None),
-                default_use_responses=getattr(base_config, "default_use_responses", True),
-                timeout=getattr(base_config, "timeout", None),
-            )
-            return OpenAIAdapter(config)
-        if provider == "anthropic":
-            config = AnthropicConfig(
-                api_key=entitlement.apiKey,
-                base_url=getattr(base_config, "base_url", "https://api.anthropic.com"),
-                version=getattr(base_config, "version", None) or "2023-06-01",
-                timeout=getattr(base_config, "timeout", None),
-            )
-            return AnthropicAdapter(config)
-        if provider == "google":
-            config = GeminiConfig(
-                api_key=entitlement.apiKey,
-                base_url=getattr(base_config, "base_url", "https://generativelanguage.googleapis.com"),
-                timeout=getattr(base_config, "timeout", None),
-            )
-            return GeminiAdapter(config)
-        if provider == "xai":
-            config = XAIConfig(
-                api_key=entitlement.apiKey,
-                base_url=getattr(base_config, "base_url", "https://api.x.ai"),
-                compatibility_mode=getattr(base_config, "compatibility_mode", "openai"),
-                speech_mode=getattr(base_config, "speech_mode", "realtime"),
-                timeout=getattr(base_config, "timeout", None),
-            )
-            return XAIAdapter(config)
-        if provider == "bedrock":
-            config = BedrockConfig(
-                region=getattr(base_config, "region", ""),
-                access_key_id=getattr(base_config, "access_key_id", ""),
-                secret_access_key=getattr(base_config, "secret_access_key", ""),
-                session_token=getattr(base_config, "session_token", None),
-                endpoint=getattr(base_config, "endpoint", ""),
-                runtime_endpoint=getattr(base_config, "runtime_endpoint", ""),
-                control_plane_service=getattr(base_config, "control_plane_service", "bedrock"),
-                runtime_service=getattr(base_config, "runtime_service", "bedrock-runtime"),
-                timeout=getattr(base_config, "timeout", None),
-            )
-            return BedrockAdapter(config)
-        if provider == "ollama":
-            config = OllamaConfig(
-                api_key=entitlement.apiKey,
-                base_url=getattr(base_config, "base_url", "http://localhost:11434"),
-                default_use_responses=getattr(base_config, "default_use_responses", False),
-                timeout=getattr(base_config, "timeout", None),
-            )
-            return OllamaAdapter(config)
-        if provider == "replicate":
-            config = ReplicateConfig(
-                api_key=entitlement.apiKey,
-                api_keys=getattr(base_config, "api_keys", None),
-            )
-            return ReplicateAdapter(config)
-        if provider == "fal":
-            config = FalConfig(
-                api_key=entitlement.apiKey,
-                api_keys=getattr(base_config, "api_keys", None),
-                timeout_s=getattr(base_config, "timeout_s", None),
-            )
-            return FalAdapter(config)
-        return None
+        with self._entitled_lock:
+            adapter = self._entitled_adapters.setdefault(cache_key, built)
+            discarded = None
+            if adapter is not built:
+                discarded = built
+            elif len(self._entitled_adapters) > _ENTITLED_ADAPTER_LIMIT:
+                discarded = self._entitled_adapters.popitem(last=False)[1]
+        if discarded is not None:
+            _close_adapter(discarded)
+        return adapter
+
+    def _build_entitled_adapter(self, provider: Provider, api_key: str):
+        spec = _PROVIDER_ADAPTERS.get(provider)
+        snapshot = self._base_snapshots.get(provider)
+        if spec is None or snapshot is None:
+            return None
+        config_cls, adapter_cls = _adapter_classes(provider)
+        takes_api_key = spec[2]
+        if takes_api_key:
+            return adapter_cls(config_cls(api_key=api_key, **snapshot))
+        return adapter_cls(config_cls(**snapshot))
 
     def _require_adapter(self, provider: Provider, entitlement: EntitlementContext | None = None):
         adapter = self._adapter_factory(provider, entitlement)
@@ -567,6 +519,118 @@ class Kit:
         return adapter
 
 
+# provider -> (config class name, adapter class name, takes api_key, base-config
+# fields copied into per-entitlement configs, with their fallbacks). Order is the
+# order configured adapters are registered in. Classes are named rather than
+# referenced so only configured providers' modules get imported.
+_PROVIDER_ADAPTERS = {
+    "openai": (
+        "OpenAIConfig",
+        "OpenAIAdapter",
+        True,
+        (
+            ("base_url", "https://api.openai.com"),
+            ("organization", None),
+            ("default_use_responses", True),
+            ("timeout", None),
+        ),
+    ),
+    "anthropic": (
+        "AnthropicConfig",
+        "AnthropicAdapter",
+        True,
+        (
+            ("base_url", "https://api.anthropic.com"),
+            ("version", "2023-06-01"),
+            ("timeout", None),
+        ),
+    ),
+    "google": (
+        "GeminiConfig",
+        "GeminiAdapter",
+        True,
+        (
+            ("base_url", "https://generativelanguage.googleapis.com"),
+            ("timeout", None),
+        ),
+    ),
+    "xai": (
+        "XAIConfig",
+        "XAIAdapter",
+        True,
+        (
+            ("base_url", "https://api.x.ai"),
+            ("compatibility_mode", "openai"),
+            ("speech_mode", "realtime"),
+            ("timeout", None),
+        ),
+    ),
+    "bedrock": (
+        "BedrockConfig",
+        "BedrockAdapter",
+        False,
+        (
+            ("region", ""),
+            ("access_key_id", ""),
+            ("secret_access_key", ""),
+            ("session_token", None),
+            ("endpoint", ""),
+            ("runtime_endpoint", ""),
+            ("control_plane_service", "bedrock"),
+            ("runtime_service", "bedrock-runtime"),
+            ("timeout", None),
+        ),
+    ),
+    "ollama": (
+        "OllamaConfig",
+        "OllamaAdapter",
+        True,
+        (
+            ("base_url", "http://localhost:11434"),
+            ("default_use_responses", False),
+            ("timeout", None),
+        ),
+    ),
+    "replicate": (
+        "ReplicateConfig",
+        "ReplicateAdapter",
+        True,
+        (("api_keys", None),),
+    ),
+    "fal": (
+        "FalConfig",
+        "FalAdapter",
+        True,
+        (("api_keys", None), ("timeout_s", None)),
+    ),
+}
+
+
+_ENTITLED_ADAPTER_LIMIT = 256
+
+
+@lru_cache(maxsize=None)
+def _adapter_classes(provider: Provider) -> Tuple[type, type]:
+    config_name, adapter_name = _PROVIDER_ADAPTERS[provider][:2]
+    return getattr(provider_adapters, config_name), getattr(provider_adapters, adapter_name)
+
+
+def _close_adapter(adapter: object) -> None:
+    # Closing the pool only drops idle connections; a request still running on
+    # this adapter finishes on its checked-out connection.
+    close = getattr(adapter, "close", None)
+    if close is not None:
+        close()
+
+
+def _base_snapshot(provider: Provider, base_config: object) -> Dict[str, object]:
+    fields = _PROVIDER_ADAPTERS[provider][3]
+    snapshot = {name: getattr(base_config, name, default) for name, default in fields}
+    if provider == "anthropic":
+        snapshot["version"] = snapshot["version"] or "2023-06-01"
+    return snapshot
+
+
 def _attach_cost(input: GenerateInput, output: GenerateOutput) -> GenerateOutput:
     cost = estimate_cost(input.provider, input.model, output.usage)
     if cost is None:
@@ -1,27 +1,41 @@
-from .openai import OpenAIAdapter, OpenAIConfig
-from .anthropic import AnthropicAdapter, AnthropicConfig
-from .gemini import GeminiAdapter, GeminiConfig
-from .xai import XAIAdapter, XAIConfig
-from .ollama import OllamaAdapter, OllamaConfig
-from .bedrock import BedrockAdapter, BedrockConfig
-from .replicate import ReplicateAdapter, ReplicateConfig
-from .fal import FalAdapter, FalConfig
+from __future__ import annotations
 
-__all__ = [
-    "OpenAIAdapter",
-    "OpenAIConfig",
-    "AnthropicAdapter",
-    "AnthropicConfig",
-    "GeminiAdapter",
-    "GeminiConfig",
-    "XAIAdapter",
-    "XAIConfig",
-    "OllamaAdapter",
-    "OllamaConfig",
-    "BedrockAdapter",
-    "BedrockConfig",
-    "ReplicateAdapter",
-    "ReplicateConfig",
-    "FalAdapter",
-    "FalConfig",
-]
+from importlib import import_module
+from typing import Any
+
+# Adapters are imported on first attribute access (PEP 562) so that using one
+# provider does not pull in every other provider's SDK and HTTP stack.
+_LAZY_EXPORTS = {
+    "OpenAIAdapter": ".openai",
+    "OpenAIConfig": ".openai",
+    "AsyncOpenAIAdapter": ".openai",
+    "AnthropicAdapter": ".anthropic",
+    "AnthropicConfig": ".anthropic",
+    "GeminiAdapter": ".gemini",
+    "GeminiConfig": ".gemini",
+    "XAIAdapter": ".xai",
+    "XAIConfig": ".xai",
+    "OllamaAdapter": ".ollama",
+    "OllamaConfig": ".ollama",
+    "BedrockAdapter": ".bedrock",
+    "BedrockConfig": ".bedrock",
+    "ReplicateAdapter": ".replicate",
+    "ReplicateConfig": ".replicate",
+    "FalAdapter": ".fal",
+    "FalConfig": ".fal",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional
 
 from ..errors import ErrorKind, KitErrorPayload, AiKitError
-from ..http import request_json, request_stream
-from ..sse import iter_sse_events
+from ..jsonlib import loads
+from ..http import create_session, request_json, request_stream
+from ..sse import iter_sse_response
 from ..types import (
     GenerateInput,
     GenerateOutput,
@@ -26,6 +27,8 @@ from ..types import (
 
 
 DEFAULT_VERSION = "2023-06-01"
+# Other events (ping, message_start, content_block_start, ...) are skipped unparsed.
+_CONSUMED_STREAM_EVENTS = frozenset(("content_block_delta", "message_stop"))
 
 
 @dataclass
@@ -42,10 +45,21 @@ class AnthropicAdapter:
         self.config = config
         self.provider = provider
         self.base_url = config.base_url.rstrip("/")
+        # Keep-alive pool shared by every call on this adapter.
+        self._session = create_session()
+        # Config is fixed per adapter instance; requests copies headers, never mutates them.
+        self._request_headers = {
+            "x-api-key": config.api_key,
+            "anthropic-version": config.version,
+            "content-type": "application/json",
+        }
+
+    def close(self) -> None:
+        self._session.close()
 
     def list_models(self) -> List[ModelMetadata]:
         url = f"{self.base_url}/v1/models"
-        payload = request_json("GET", url, self._headers(), timeout=self.config.timeout)
+        payload = request_json("GET", url, self._headers(), timeout=self.config.timeout, session=self._session)
         models: List[ModelMetadata] = []
         for model in payload.get("data", []) or []:
             model_id = model.get("id")
@@ -77,6 +91,7 @@ class AnthropicAdapter:
             self._headers(),
             json_body=_build_payload(input, stream=False),
             timeout=self.config.timeout,
+            session=self._session,
         )
         return _normalize_output(payload)
 
@@ -106,30 +121,29 @@ class AnthropicAdapter:
             self._headers(),
             json_body=_build_payload(input, stream=True),
             timeout=self.config.timeout,
+            session=self._session,
         )
-        for event in iter_sse_events(response.iter_lines(decode_unicode=True)):
+        for event in iter_sse_response(response):
+            event_type = event.get("event")
+            if event_type not in _CONSUMED_STREAM_EVENTS:
+                continue
             data = event.get("data")
             if not data or data == "[DONE]":
                 continue
             try:
-                payload = json.loads(data)
-            except json.JSONDecodeError:
+                payload = loads(data)
+            except ValueError:
                 continue
-            event_type = event.get("event")
             if event_type == "content_block_delta":
                 delta = payload.get("delta", {})
                 if delta.get("type") == "text_delta" and delta.get("text"):
-                    yield StreamChunk(type="delta", textDelta=delta.get("text"))
+                    yield StreamChunk("delta", delta.get("text"))
             elif event_type == "message_stop":
                 yield StreamChunk(type="message_end", finishReason="stop")
         response.close()
 
     def _headers(self) -> Dict[str, str]:
-        return {
-            "x-api-key": self.config.api_key,
-            "anthropic-version": self.config.version,
-            "content-type": "application/json",
-        }
+        return self._request_headers
 
 
 def _build_payload(input: GenerateInput, stream: bool) -> Dict[str, Any]:
@@ -149,43 +163,44 @@ def _build_payload(input: GenerateInput, stream: bool) -> Dict[str, Any]:
     return payload
 
 
+def _map_part(part: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    part_type = part.get("type")
+    if part_type == "text":
+        return {"type": "text", "text": part.get("text")}
+    if part_type == "image":
+        image = part.get("image") or {}
+        if image.get("base64"):
+            return {
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": image.get("mediaType"),
+                    "data": image.get("base64"),
+                },
+            }
+    return None
+
+
 def _map_messages(messages: Iterable[Message | Dict[str, Any]]) -> List[Dict[str, Any]]:
-    normalized = ensure_messages(messages)
-    output = []
-    for message in normalized:
-        parts = []
-        for part in message.get("content", []) or []:
-            if part.get("type") == "text":
-                parts.append({"type": "text", "text": part.get("text")})
-            elif part.get("type") == "image":
-                image = part.get("image") or {}
-                if image.get("base64"):
-                    parts.append(
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": image.get("mediaType"),
-                                "data": image.get("base64"),
-                            },
-                        }
-                    )
-        output.append({"role": message.get("role"), "content": parts})
-    return output
+    return ensure_messages(messages, transform=_map_message)
+
+
+def _map_message(message: Dict[str, Any], index: int) -> Dict[str, Any]:
+    return {
+        "role": message.get("role"),
+        "content": [mapped for mapped in map(_map_part, message.get("content", []) or []) if mapped is not None],
+    }
 
 
 def _map_tools(tools: List[ToolDefinition]) -> List[Dict[str, Any]]:
-    serialized = []
-    for tool in tools:
-        payload = as_json_dict(tool)
-        serialized.append(
-            {
-                "name": payload.get("name"),
-                "description": payload.get("description"),
-                "input_schema": payload.get("parameters"),
-            }
-        )
-    return serialized
+    return [
+        {
+            "name": payload.get("name"),
+            "description": payload.get("description"),
+            "input_schema": payload.get("parameters"),
+        }
+        for payload in map(as_json_dict, tools)
+    ]
 
 
 def _map_tool_choice(choice: ToolChoice) -> Dict[str, Any]:
@@ -196,12 +211,11 @@ def _map_tool_choice(choice: ToolChoice) -> Dict[str, Any]:
 
 
 def _normalize_output(payload: Dict[str, Any]) -> GenerateOutput:
-    text_parts = []
-    for part in payload.get("content", []) or []:
-        if part.get("type") == "text" and part.get("text"):
-            text_parts.append(part.get("text"))
+    text = "".join(
+        part["text"] for part in payload.get("content", []) or [] if part.get("type") == "text" and part.get("text")
+    )
     return GenerateOutput(
-        text="".join(text_parts) if text_parts else None,
+        text=text or None,
         finishReason=payload.get("stop_reason"),
         usage=_map_usage(payload.get("usage")),
         raw=payload,
@@ -218,8 +232,14 @@ def _map_usage(raw: Optional[Dict[str, Any]]) -> Optional[Usage]:
     )
 
 
+@lru_cache(maxsize=4096)
 def _derive_family(model_id: str) -> str:
     if not model_id:
         return ""
-    parts = model_id.split("-")
-    return "-".join(parts[:3]) if len(parts) >= 3 else model_id
+    # Prefix before the third "-", or the whole id when it has fewer separators.
+    end = -1
+    for _ in range(3):
+        end = model_id.find("-", end + 1)
+        if end < 0:
+            return model_id
+    return model_id[:end]
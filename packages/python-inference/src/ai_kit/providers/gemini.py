@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional
 
-from ..http import request_json, request_stream
+from ..jsonlib import loads
+from ..http import create_session, request_json, request_stream
 from ..errors import ErrorKind, KitErrorPayload, AiKitError
-from ..sse import iter_sse_events
+from ..sse import iter_sse_response
 from ..types import (
     GenerateInput,
     GenerateOutput,
@@ -20,6 +21,9 @@ from ..types import (
 )
 
 
+_HEADERS = {"content-type": "application/json"}
+
+
 @dataclass
 class GeminiConfig:
     api_key: str = ""
@@ -33,10 +37,18 @@ class GeminiAdapter:
         self.config = config
         self.provider = provider
         self.base_url = config.base_url.rstrip("/")
+        # Keep-alive pool shared by every call on this adapter.
+        self._session = create_session()
+        self._list_models_url = f"{self.base_url}/v1beta/models?key={config.api_key}"
+        self._model_url_prefix = f"{self.base_url}/v1beta/models/"
+        self._key_query = f"key={config.api_key}"
+
+    def close(self) -> None:
+        self._session.close()
 
     def list_models(self) -> List[ModelMetadata]:
-        url = f"{self.base_url}/v1beta/models?key={self.config.api_key}"
-        payload = request_json("GET", url, self._headers(), timeout=self.config.timeout)
+        url = self._list_models_url
+        payload = request_json("GET", url, self._headers(), timeout=self.config.timeout, session=self._session)
         models: List[ModelMetadata] = []
         for model in payload.get("models", []) or []:
             name = model.get("name")
@@ -64,25 +76,27 @@ class GeminiAdapter:
 
     def generate(self, input: GenerateInput) -> GenerateOutput:
         model_id = _normalize_model_id(input.model)
-        url = f"{self.base_url}/v1beta/models/{model_id}:generateContent?key={self.config.api_key}"
+        url = self._model_url_prefix + model_id + ":generateContent?" + self._key_query
         payload = request_json(
             "POST",
             url,
             self._headers(),
             json_body=_build_payload(input),
             timeout=self.config.timeout,
+            session=self._session,
         )
         return _normalize_output(payload)
 
     def generate_image(self, input: ImageGenerateInput) -> ImageGenerateOutput:
         model_id = _normalize_model_id(input.model)
-        url = f"{self.base_url}/v1beta/models/{model_id}:generateContent?key={self.config.api_key}"
+        url = self._model_url_prefix + model_id + ":generateContent?" + self._key_query
         payload = request_json(
             "POST",
             url,
             self._headers(),
             json_body=_build_image_payload(input),
             timeout=self.config.timeout,
+            session=self._session,
         )
         inline = _extract_inline_image(payload)
         if not inline or not inline.get("data"):
@@ -107,41 +121,34 @@ class GeminiAdapter:
 
     def stream_generate(self, input: GenerateInput) -> Iterable[StreamChunk]:
         model_id = _normalize_model_id(input.model)
-        url = f"{self.base_url}/v1beta/models/{model_id}:streamGenerateContent?alt=sse&key={self.config.api_key}"
+        url = self._model_url_prefix + model_id + ":streamGenerateContent?alt=sse&" + self._key_query
         response = request_stream(
             "POST",
             url,
             self._headers(),
             json_body=_build_payload(input),
             timeout=self.config.timeout,
+            session=self._session,
         )
-        for event in iter_sse_events(response.iter_lines(decode_unicode=True)):
+        for event in iter_sse_response(response):
             data = event.get("data")
             if not data or data == "[DONE]":
                 continue
             try:
-                payload = json.loads(data)
-            except json.JSONDecodeError:
+                payload = loads(data)
+            except ValueError:
                 continue
             text = _extract_text(payload)
             if text:
-                yield StreamChunk(type="delta", textDelta=text)
+                yield StreamChunk("delta", text)
         response.close()
 
     def _headers(self) -> Dict[str, str]:
-        return {"content-type": "application/json"}
+        return _HEADERS
 
 
 def _build_payload(input: GenerateInput) -> Dict[str, Any]:
-    messages = ensure_messages(input.messages)
-    contents = []
-    for message in messages:
-        parts = []
-        for part in message.get("content", []) or []:
-            if part.get("type") == "text":
-                parts.append({"text": part.get("text")})
-        if parts:
-            contents.append({"role": message.get("role"), "parts": parts})
+    contents = ensure_messages(input.messages, transform=_map_content)
     payload: Dict[str, Any] = {"contents": contents}
     generation_config: Dict[str, Any] = {}
     if input.temperature is not None:
@@ -155,6 +162,11 @@ def _build_payload(input: GenerateInput) -> Dict[str, Any]:
     return payload
 
 
+def _map_content(message: Dict[str, Any], index: int) -> Optional[Dict[str, Any]]:
+    parts = [{"text": part.get("text")} for part in message.get("content", []) or [] if part.get("type") == "text"]
+    return {"role": message.get("role"), "parts": parts} if parts else None
+
+
 def _build_image_payload(input: ImageGenerateInput) -> Dict[str, Any]:
     parts: List[Dict[str, Any]] = [{"text": input.prompt}]
     for image in input.inputImages or []:
@@ -178,13 +190,19 @@ def _normalize_output(payload: Dict[str, Any]) -> GenerateOutput:
 
 
 def _extract_text(payload: Dict[str, Any]) -> str:
-    candidates = payload.get("candidates", []) or []
+    candidates = payload.get("candidates")
     if not candidates:
         return ""
-    content = candidates[0].get("content", {}) or {}
-    parts = content.get("parts", []) or []
-    texts = [part.get("text", "") for part in parts if part.get("text")]
-    return "".join(texts)
+    content = candidates[0].get("content")
+    if not content:
+        return ""
+    parts = content.get("parts")
+    if not parts:
+        return ""
+    if len(parts) == 1:
+        # Streamed chunks almost always carry a single text part.
+        return parts[0].get("text") or ""
+    return "".join(part["text"] for part in parts if part.get("text"))
 
 
 def _extract_inline_image(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -199,12 +217,18 @@ def _extract_inline_image(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     return None
 
 
+@lru_cache(maxsize=256)
 def _normalize_model_id(model_id: str) -> str:
     if model_id.startswith("models/"):
         return model_id[len("models/"):]
     return model_id
 
 
+@lru_cache(maxsize=4096)
 def _derive_family(model_id: str) -> str:
-    parts = model_id.split("-")
-    return "-".join(parts[:2]) if len(parts) >= 2 else model_id
+    end = -1
+    for _ in range(2):
+        end = model_id.find("-", end + 1)
+        if end < 0:
+            return model_id
+    return model_id[:end]
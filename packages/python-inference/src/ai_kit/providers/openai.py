@@ -1,17 +1,27 @@
 from __future__ import annotations
 
 import base64
-import json
+import re
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.request import urlopen
 
-import requests
-
-from ..http import request_json, request_stream, request_multipart
+from ..http import (
+    create_session,
+    default_headers,
+    request_json,
+    request_json_async,
+    request_multipart,
+    request_stream,
+    request_stream_async,
+    shared_async_client,
+)
 from ..errors import ErrorKind, KitErrorPayload, AiKitError, classify_status
-from ..sse import iter_sse_events
+from ..jsonlib import dumps, loads
+from ..sse import aiter_sse_event_batches, iter_sse_response_batches
 from ..types import (
     AudioInput,
     GenerateInput,
@@ -80,10 +90,20 @@ class OpenAIAdapter:
             else:
                 base_url = "https://api.openai.com"
         self.base_url = base_url.rstrip("/")
+        self._session = create_session()
+        self._request_headers = default_headers(config.api_key or None, config.organization or None)
+        # Multipart uploads need requests to set their own Content-Type boundary.
+        self._upload_headers = {k: v for k, v in self._request_headers.items() if k != "Content-Type"}
+
+    def close(self) -> None:
+        self._session.close()
 
     def list_models(self) -> List[ModelMetadata]:
         url = f"{self.base_url}/v1/models"
-        payload = request_json("GET", url, self._headers(), timeout=self.config.timeout)
+        payload = request_json("GET", url, self._headers(), timeout=self.config.timeout, session=self._session)
+        return self._models_from_payload(payload)
+
+    def _models_from_payload(self, payload: Dict[str, Any]) -> List[ModelMetadata]:
         models: List[ModelMetadata] = []
         for model in payload.get("data", []):
             model_id = model.get("id")
@@ -114,6 +134,117 @@ class OpenAIAdapter:
             return self._generate_responses(input)
         return self._generate_chat(input)
 
+    def batch_generate(
+        self,
+        inputs: List[GenerateInput],
+        poll_interval_s: float = 30.0,
+        timeout_s: Optional[float] = None,
+    ) -> List[GenerateOutput]:
+        """Run ``inputs`` through the Batch API and block until the batch finishes.
+
+        This is an explicit, offline API: batches always target
+        /v1/chat/completions and may take up to the 24h completion window, so
+        never call it from an event loop. Outputs are in input order; a request
+        that failed inside the batch comes back with ``finishReason="error"``
+        and its result line (if any) in ``raw``.
+        """
+        batch_id = self.submit_batch(inputs)
+        return self.wait_for_batch(batch_id, poll_interval_s=poll_interval_s, timeout_s=timeout_s)
+
+    def submit_batch(self, inputs: List[GenerateInput]) -> str:
+        if not inputs:
+            raise AiKitError(
+                KitErrorPayload(
+                    kind=ErrorKind.VALIDATION,
+                    message="OpenAI batch requires at least one input",
+                    provider=self.provider,
+                )
+            )
+        lines = [
+            dumps(
+                {
+                    "custom_id": str(index),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": _build_chat_payload(item, stream=False),
+                }
+            )
+            for index, item in enumerate(inputs)
+        ]
+        uploaded = request_multipart(
+            "POST",
+            f"{self.base_url}/v1/files",
+            self._upload_headers,
+            data={"purpose": "batch"},
+            file_field=("file", ("batch.jsonl", "\n".join(lines).encode("utf-8"), "application/jsonl")),
+            timeout=self.config.timeout,
+            session=self._session,
+        )
+        batch = request_json(
+            "POST",
+            f"{self.base_url}/v1/batches",
+            self._headers(),
+            json_body={
+                "input_file_id": uploaded.get("id"),
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            },
+            timeout=self.config.timeout,
+            session=self._session,
+        )
+        return batch.get("id")
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval_s: float = 30.0,
+        timeout_s: Optional[float] = None,
+    ) -> List[GenerateOutput]:
+        url = f"{self.base_url}/v1/batches/{batch_id}"
+        start = time.time()
+        while True:
+            batch = request_json("GET", url, self._headers(), timeout=self.config.timeout, session=self._session)
+            status = batch.get("status")
+            if status == "completed":
+                break
+            if status in {"failed", "expired", "cancelled", "cancelling"}:
+                raise AiKitError(
+                    KitErrorPayload(
+                        kind=ErrorKind.UNKNOWN,
+                        message=f"OpenAI batch {batch_id} ended with status {status}",
+                        provider=self.provider,
+                    )
+                )
+            if timeout_s is not None and time.time() - start > timeout_s:
+                raise AiKitError(
+                    KitErrorPayload(
+                        kind=ErrorKind.TIMEOUT,
+                        message=f"Timed out waiting for OpenAI batch {batch_id} after {timeout_s} seconds",
+                        provider=self.provider,
+                    )
+                )
+            time.sleep(poll_interval_s)
+        results: Dict[int, GenerateOutput] = {}
+        for file_id in (batch.get("output_file_id"), batch.get("error_file_id")):
+            if not file_id:
+                continue
+            response = request_stream(
+                "GET",
+                f"{self.base_url}/v1/files/{file_id}/content",
+                self._headers(),
+                timeout=self.config.timeout,
+                session=self._session,
+            )
+            # Bulk download: large reads beat iter_lines' 512-byte default.
+            for line in response.iter_lines(chunk_size=65536):
+                if line:
+                    index, output = _batch_line_output(loads(line))
+                    results.setdefault(index, output)
+            response.close()
+        counts = batch.get("request_counts") or {}
+        total = counts.get("total") or len(results)
+        return [results.get(index) or GenerateOutput(finishReason="error") for index in range(total)]
+
     def generate_image(self, input: ImageGenerateInput) -> ImageGenerateOutput:
         if input.inputImages:
             if len(input.inputImages) > 1:
@@ -143,19 +274,9 @@ class OpenAIAdapter:
                 data=data,
                 file_field=("image", (filename, image_bytes, media_type)),
                 timeout=self.config.timeout,
+                session=self._session,
             )
-            data = payload.get("data", []) or []
-            image = data[0] if data else {}
-            b64 = image.get("b64_json")
-            if not b64:
-                raise AiKitError(
-                    KitErrorPayload(
-                        kind=ErrorKind.UNKNOWN,
-                        message="OpenAI image response missing base64 data",
-                        provider=self.provider,
-                    )
-                )
-            return ImageGenerateOutput(mime="image/png", data=b64, raw=payload)
+            return self._image_output(payload)
         url = f"{self.base_url}/v1/images"
         payload = request_json(
             "POST",
@@ -169,10 +290,16 @@ class OpenAIAdapter:
                 "n": 1,
             },
             timeout=self.config.timeout,
+            session=self._session,
         )
+        return self._image_output(payload)
+
+    def _image_output(self, payload: Dict[str, Any]) -> ImageGenerateOutput:
         data = payload.get("data", []) or []
         image = data[0] if data else {}
-        b64 = image.get("b64_json")
+        # Move the base64 body out of raw so callers that log or serialize raw
+        # don't carry a second copy of a multi-megabyte string.
+        b64 = image.pop("b64_json", None) if isinstance(image, dict) else None
         if not b64:
             raise AiKitError(
                 KitErrorPayload(
@@ -207,7 +334,7 @@ class OpenAIAdapter:
             payload["speed"] = input.speed
         if isinstance(input.parameters, dict):
             payload.update(input.parameters)
-        response = requests.post(
+        response = self._session.post(
             url,
             headers=self._headers(),
             json=payload,
@@ -254,6 +381,7 @@ class OpenAIAdapter:
             data=data,
             file_field=("file", (filename, audio_bytes, media_type)),
             timeout=self.config.timeout,
+            session=self._session,
             expect_json=response_format not in ("text", "srt", "vtt"),
         )
         if isinstance(payload, str):
@@ -273,6 +401,7 @@ class OpenAIAdapter:
             self._headers(),
             json_body=_build_responses_payload(input, stream=False),
             timeout=self.config.timeout,
+            session=self._session,
         )
         return _normalize_responses_output(payload)
 
@@ -284,6 +413,7 @@ class OpenAIAdapter:
             self._headers(),
             json_body=_build_chat_payload(input, stream=False),
             timeout=self.config.timeout,
+            session=self._session,
         )
         return _normalize_chat_output(payload)
 
@@ -295,35 +425,16 @@ class OpenAIAdapter:
             self._headers(),
             json_body=_build_responses_payload(input, stream=True),
             timeout=self.config.timeout,
+            session=self._session,
         )
-        for event in iter_sse_events(response.iter_lines(decode_unicode=True)):
-            data = event.get("data")
-            if not data or data == "[DONE]":
-                continue
-            try:
-                payload = json.loads(data)
-            except json.JSONDecodeError:
-                continue
-            event_type = event.get("event")
-            if event_type in ("response.output_text.delta", "response.refusal.delta"):
-                delta = payload.get("delta", {})
-                text = delta.get("text") if isinstance(delta, dict) else delta
-                if text:
-                    yield StreamChunk(type="delta", textDelta=text)
-            elif event_type == "response.completed":
-                usage = _map_responses_usage(payload.get("response", {}).get("usage"))
-                yield StreamChunk(type="message_end", usage=usage, finishReason=payload.get("response", {}).get("status"))
-            elif event_type == "response.error":
-                error = payload.get("error", {})
-                yield StreamChunk(
-                    type="error",
-                    error={
-                        "kind": "upstream_error",
-                        "message": error.get("message", "OpenAI streaming error"),
-                        "upstreamCode": error.get("code"),
-                    },
-                )
-                return
+        coalescer = _DeltaCoalescer()
+        for events in iter_sse_response_batches(response):
+            for event in events:
+                for chunk in _responses_event_chunks(event):
+                    yield from coalescer.push(chunk)
+                    if chunk.type == "error":
+                        return
+            yield from coalescer.flush()
         response.close()
 
     def _stream_chat(self, input: GenerateInput) -> Iterable[StreamChunk]:
@@ -334,127 +445,341 @@ class OpenAIAdapter:
             self._headers(),
             json_body=_build_chat_payload(input, stream=True),
             timeout=self.config.timeout,
+            session=self._session,
         )
-        for event in iter_sse_events(response.iter_lines(decode_unicode=True)):
-            data = event.get("data")
-            if not data or data == "[DONE]":
-                continue
-            try:
-                payload = json.loads(data)
-            except json.JSONDecodeError:
-                continue
-            for choice in payload.get("choices", []) or []:
-                delta = choice.get("delta", {})
-                content = delta.get("content")
-                if isinstance(content, list):
-                    for part in content:
-                        if isinstance(part, dict) and part.get("type") == "text" and part.get("text"):
-                            yield StreamChunk(type="delta", textDelta=part["text"])
-                elif isinstance(content, str):
-                    yield StreamChunk(type="delta", textDelta=content)
-                if choice.get("finish_reason"):
-                    usage = _map_chat_usage(payload.get("usage"))
-                    yield StreamChunk(type="message_end", usage=usage, finishReason=choice.get("finish_reason"))
+        coalescer = _DeltaCoalescer()
+        for events in iter_sse_response_batches(response):
+            for event in events:
+                for chunk in _chat_event_chunks(event):
+                    yield from coalescer.push(chunk)
+            yield from coalescer.flush()
         response.close()
 
     def _should_use_responses(self, input: GenerateInput) -> bool:
         return self.config.default_use_responses
 
     def _headers(self) -> Dict[str, str]:
-        headers = {"Content-Type": "application/json"}
-        if self.config.api_key:
-            headers["Authorization"] = f"Bearer {self.config.api_key}"
-        if self.config.organization:
-            headers["OpenAI-Organization"] = self.config.organization
-        return headers
+        return self._request_headers
+
+
+class AsyncOpenAIAdapter(OpenAIAdapter):
+    """OpenAIAdapter with awaitable list/generate/stream calls over a shared httpx.AsyncClient."""
+
+    def __init__(
+        self,
+        config: OpenAIConfig,
+        provider: Provider = "openai",
+        client: Any = None,
+        owns_client: bool = False,
+    ) -> None:
+        super().__init__(config, provider)
+        self._client = client
+        # A caller's client stays the caller's to close unless handed over.
+        self._owns_client = client is not None and owns_client
+
+    def _async_client(self) -> Any:
+        # Without an explicit client, share the process-wide pool with every
+        # other async adapter; aclose() then leaves it open for them.
+        return self._client if self._client is not None else shared_async_client()
+
+    async def aclose(self) -> None:
+        """Close what this adapter owns: its sync session and, with
+        ``owns_client=True``, the client it was given. Shared and
+        caller-managed clients are left open."""
+        if self._owns_client:
+            await self._client.aclose()
+            self._client = None
+            self._owns_client = False
+        self.close()
+
+    async def alist_models(self) -> List[ModelMetadata]:
+        url = f"{self.base_url}/v1/models"
+        payload = await request_json_async(
+            "GET", url, self._headers(), timeout=self.config.timeout, client=self._async_client()
+        )
+        return self._models_from_payload(payload)
+
+    async def agenerate(self, input: GenerateInput) -> GenerateOutput:
+        use_responses = self._should_use_responses(input)
+        if use_responses:
+            url = f"{self.base_url}/v1/responses"
+            json_body = _build_responses_payload(input, stream=False)
+        else:
+            url = f"{self.base_url}/v1/chat/completions"
+            json_body = _build_chat_payload(input, stream=False)
+        payload = await request_json_async(
+            "POST",
+            url,
+            self._headers(),
+            json_body=json_body,
+            timeout=self.config.timeout,
+            client=self._async_client(),
+        )
+        if use_responses:
+            return _normalize_responses_output(payload)
+        return _normalize_chat_output(payload)
+
+    async def astream_generate(self, input: GenerateInput) -> AsyncIterator[StreamChunk]:
+        use_responses = self._should_use_responses(input)
+        if use_responses:
+            url = f"{self.base_url}/v1/responses"
+            json_body = _build_responses_payload(input, stream=True)
+        else:
+            url = f"{self.base_url}/v1/chat/completions"
+            json_body = _build_chat_payload(input, stream=True)
+        response = await request_stream_async(
+            "POST",
+            url,
+            self._headers(),
+            json_body=json_body,
+            timeout=self.config.timeout,
+            client=self._async_client(),
+        )
+        coalescer = _DeltaCoalescer()
+        try:
+            async for events in aiter_sse_event_batches(response.aiter_bytes()):
+                for event in events:
+                    if not use_responses:
+                        for chunk in _chat_event_chunks(event):
+                            for out in coalescer.push(chunk):
+                                yield out
+                        continue
+                    for chunk in _responses_event_chunks(event):
+                        for out in coalescer.push(chunk):
+                            yield out
+                        if chunk.type == "error":
+                            return
+                for out in coalescer.flush():
+                    yield out
+        finally:
+            await response.aclose()
+
+
+class _DeltaCoalescer:
+    """Merges consecutive text deltas within one read batch into one chunk.
+
+    Callers flush at the end of every batch, so text never waits on the next
+    socket read; a non-delta chunk flushes the pending text ahead of itself.
+    """
+
+    __slots__ = ("_pending",)
+
+    def __init__(self) -> None:
+        self._pending: List[str] = []
+
+    def push(self, chunk: StreamChunk) -> Tuple[StreamChunk, ...]:
+        if chunk.type == "delta" and chunk.textDelta is not None:
+            self._pending.append(chunk.textDelta)
+            return ()
+        return self.flush() + (chunk,)
+
+    def flush(self) -> Tuple[StreamChunk, ...]:
+        if not self._pending:
+            return ()
+        text = self._pending[0] if len(self._pending) == 1 else "".join(self._pending)
+        self._pending = []
+        return (StreamChunk("delta", text),)
+
+
+# Text-delta frames dominate long streams; pull the one string field out with a
+# regex and only fall back to a full JSON decode for anything structural.
+_JSON_STRING = r'"((?:[^"\\]|\\.)*)"'
+_CHAT_CONTENT_RE = re.compile(r'"content"\s*:\s*' + _JSON_STRING)
+_RESPONSES_DELTA_RE = re.compile(r'"delta"\s*:\s*' + _JSON_STRING)
+_FINISH_REASON_RE = re.compile(r'"finish_reason"\s*:\s*"')
+_RESPONSES_TEXT_EVENTS = ("response.output_text.delta", "response.refusal.delta")
+
+
+def _single_string_field(pattern: re.Pattern[str], data: str) -> Optional[str]:
+    matches = pattern.findall(data)
+    if len(matches) != 1:
+        return None
+    raw = matches[0]
+    if "\\" not in raw:
+        return raw
+    try:
+        return loads(f'"{raw}"')
+    except ValueError:
+        # e.g. a lone surrogate escape orjson rejects; let the full decode decide.
+        return None
+
+
+def _decode_event_data(event: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    data = event.get("data")
+    if not data or data == "[DONE]":
+        return None
+    try:
+        return loads(data)
+    except ValueError:
+        return None
+
+
+def _responses_event_chunks(event: Dict[str, str]) -> Iterator[StreamChunk]:
+    event_type = event.get("event")
+    data = event.get("data")
+    if event_type in _RESPONSES_TEXT_EVENTS and data:
+        text = _single_string_field(_RESPONSES_DELTA_RE, data)
+        if text is not None:
+            if text:
+                yield StreamChunk("delta", text)
+            return
+    payload = _decode_event_data(event)
+    if payload is None:
+        return
+    if event_type in _RESPONSES_TEXT_EVENTS:
+        delta = payload.get("delta", {})
+        text = delta.get("text") if isinstance(delta, dict) else delta
+        if text:
+            yield StreamChunk("delta", text)
+    elif event_type == "response.completed":
+        usage = _map_responses_usage(payload.get("response", {}).get("usage"))
+        yield StreamChunk(type="message_end", usage=usage, finishReason=payload.get("response", {}).get("status"))
+    elif event_type == "response.error":
+        error = payload.get("error", {})
+        yield StreamChunk(
+            type="error",
+            error={
+                "kind": "upstream_error",
+                "message": error.get("message", "OpenAI streaming error"),
+                "upstreamCode": error.get("code"),
+            },
+        )
+
+
+def _chat_event_chunks(event: Dict[str, str]) -> Iterator[StreamChunk]:
+    data = event.get("data")
+    if data and '"tool_calls"' not in data and not _FINISH_REASON_RE.search(data):
+        text = _single_string_field(_CHAT_CONTENT_RE, data)
+        if text is not None:
+            yield StreamChunk("delta", text)
+            return
+    payload = _decode_event_data(event)
+    if payload is None:
+        return
+    for choice in payload.get("choices", []) or []:
+        delta = choice.get("delta", {})
+        content = delta.get("content")
+        if isinstance(content, list):
+            for part in content:
+                if isinstance(part, dict) and part.get("type") == "text" and part.get("text"):
+                    yield StreamChunk("delta", part["text"])
+        elif isinstance(content, str):
+            yield StreamChunk("delta", content)
+        if choice.get("finish_reason"):
+            usage = _map_chat_usage(payload.get("usage"))
+            yield StreamChunk(type="message_end", usage=usage, finishReason=choice.get("finish_reason"))
+
+
+def _batch_line_output(line: Dict[str, Any]) -> Tuple[int, GenerateOutput]:
+    index = int(line.get("custom_id"))
+    response = line.get("response") or {}
+    body = response.get("body")
+    if line.get("error") or not isinstance(body, dict) or (response.get("status_code") or 200) >= 400:
+        return index, GenerateOutput(finishReason="error", raw=line)
+    return index, _normalize_chat_output(body)
 
 
 def _build_responses_payload(input: GenerateInput, stream: bool) -> Dict[str, Any]:
     payload: Dict[str, Any] = {
         "model": input.model,
         "input": _map_messages_to_responses(input.messages),
-        "tools": _map_tools(input.tools),
-        "tool_choice": _map_tool_choice(input.toolChoice),
-        "temperature": input.temperature,
-        "top_p": input.topP,
-        "max_output_tokens": input.maxTokens,
-        "metadata": input.metadata,
-        "stream": stream,
     }
+    tools = _map_tools(input.tools)
+    if tools is not None:
+        payload["tools"] = tools
+    tool_choice = _map_tool_choice(input.toolChoice)
+    if tool_choice is not None:
+        payload["tool_choice"] = tool_choice
+    if input.temperature is not None:
+        payload["temperature"] = input.temperature
+    if input.topP is not None:
+        payload["top_p"] = input.topP
+    if input.maxTokens is not None:
+        payload["max_output_tokens"] = input.maxTokens
+    if input.metadata is not None:
+        payload["metadata"] = input.metadata
+    payload["stream"] = stream
     response_format = _map_response_format(input.responseFormat)
     if response_format is not None:
         payload["text"] = {"format": response_format}
-    return {k: v for k, v in payload.items() if v is not None}
+    return payload
 
 
 def _build_chat_payload(input: GenerateInput, stream: bool) -> Dict[str, Any]:
     payload: Dict[str, Any] = {
         "model": input.model,
         "messages": _map_messages_to_chat(input.messages),
-        "temperature": input.temperature,
-        "top_p": input.topP,
-        "max_tokens": input.maxTokens,
-        "stream": stream,
-        "tools": _map_tools(input.tools),
-        "tool_choice": _map_tool_choice(input.toolChoice),
     }
+    if input.temperature is not None:
+        payload["temperature"] = input.temperature
+    if input.topP is not None:
+        payload["top_p"] = input.topP
+    if input.maxTokens is not None:
+        payload["max_tokens"] = input.maxTokens
+    payload["stream"] = stream
+    tools = _map_tools(input.tools)
+    if tools is not None:
+        payload["tools"] = tools
+    tool_choice = _map_tool_choice(input.toolChoice)
+    if tool_choice is not None:
+        payload["tool_choice"] = tool_choice
     response_format = _map_response_format(input.responseFormat)
     if response_format is not None:
         payload["response_format"] = response_format
-    return {k: v for k, v in payload.items() if v is not None}
+    return payload
 
 
 def _map_messages_to_responses(messages: Iterable[Message | Dict[str, Any]]) -> List[Dict[str, Any]]:
-    normalized = ensure_messages(messages)
-    output: List[Dict[str, Any]] = []
-    for message in normalized:
-        parts = []
-        for part in message.get("content", []) or []:
-            if part.get("type") == "text":
-                parts.append({"type": "input_text", "text": part.get("text")})
-            elif part.get("type") == "image":
-                image = part.get("image") or {}
-                payload: Dict[str, Any] = {
-                    "type": "input_image",
-                    "media_type": image.get("mediaType"),
-                }
-                if image.get("url"):
-                    payload["image_url"] = image.get("url")
-                if image.get("base64"):
-                    payload["image_base64"] = image.get("base64")
-                parts.append(payload)
-        entry: Dict[str, Any] = {"role": message.get("role"), "content": parts}
-        if message.get("toolCallId"):
-            entry["tool_call_id"] = message.get("toolCallId")
-        if message.get("name"):
-            entry["name"] = message.get("name")
-        output.append(entry)
-    return output
+    return ensure_messages(messages, transform=_responses_message)
+
+
+def _responses_message(message: Dict[str, Any], index: int) -> Dict[str, Any]:
+    parts = []
+    for part in message.get("content", []) or []:
+        if part.get("type") == "text":
+            parts.append({"type": "input_text", "text": part.get("text")})
+        elif part.get("type") == "image":
+            image = part.get("image") or {}
+            payload: Dict[str, Any] = {
+                "type": "input_image",
+                "media_type": image.get("mediaType"),
+            }
+            if image.get("url"):
+                payload["image_url"] = image.get("url")
+            if image.get("base64"):
+                payload["image_base64"] = image.get("base64")
+            parts.append(payload)
+    entry: Dict[str, Any] = {"role": message.get("role"), "content": parts}
+    if message.get("toolCallId"):
+        entry["tool_call_id"] = message.get("toolCallId")
+    if message.get("name"):
+        entry["name"] = message.get("name")
+    return entry
 
 
 def _map_messages_to_chat(messages: Iterable[Message | Dict[str, Any]]) -> List[Dict[str, Any]]:
-    normalized = ensure_messages(messages)
-    output: List[Dict[str, Any]] = []
-    for message in normalized:
-        parts = []
-        for part in message.get("content", []) or []:
-            if part.get("type") == "text":
-                parts.append({"type": "text", "text": part.get("text")})
-            elif part.get("type") == "image":
-                image = part.get("image") or {}
-                image_payload: Dict[str, Any] = {}
-                if image.get("url"):
-                    image_payload["url"] = image.get("url")
-                if image.get("base64"):
-                    image_payload["b64_json"] = image.get("base64")
-                parts.append({"type": "image_url", "image_url": image_payload})
-        content: Any
-        if len(parts) == 1 and parts[0].get("type") == "text":
-            content = parts[0].get("text")
-        else:
-            content = parts
-        output.append({"role": message.get("role"), "content": content})
-    return output
+    return ensure_messages(messages, transform=_chat_message)
+
+
+def _chat_message(message: Dict[str, Any], index: int) -> Dict[str, Any]:
+    parts = []
+    for part in message.get("content", []) or []:
+        if part.get("type") == "text":
+            parts.append({"type": "text", "text": part.get("text")})
+        elif part.get("type") == "image":
+            image = part.get("image") or {}
+            image_payload: Dict[str, Any] = {}
+            if image.get("url"):
+                image_payload["url"] = image.get("url")
+            if image.get("base64"):
+                image_payload["b64_json"] = image.get("base64")
+            parts.append({"type": "image_url", "image_url": image_payload})
+    content: Any
+    if len(parts) == 1 and parts[0].get("type") == "text":
+        content = parts[0].get("text")
+    else:
+        content = parts
+    return {"role": message.get("role"), "content": content}
 
 
 def _map_tools(tools: Optional[List[ToolDefinition]]) -> Optional[List[Dict[str, Any]]]:
@@ -476,33 +801,44 @@ def _map_tools(tools: Optional[List[ToolDefinition]]) -> Optional[List[Dict[str,
     return serialized
 
 
+_AUTO_NONE = frozenset(("auto", "none"))
+_EMPTY_FUNCTION: Dict[str, Any] = {}
+
+
 def _map_tool_choice(choice: Optional[ToolChoice]) -> Optional[Any]:
     if not choice:
         return None
-    payload = as_json_dict(choice)
-    if payload.get("type") in ("auto", "none"):
-        return payload.get("type")
+    if isinstance(choice, dict):
+        kind, name = choice.get("type"), choice.get("name")
+    else:
+        kind, name = choice.type, choice.name
+    if kind in _AUTO_NONE:
+        return kind
     return {
         "type": "function",
-        "function": {"name": payload.get("name")},
+        "function": {"name": name},
     }
 
 
 def _map_response_format(format_obj: Optional[Any]) -> Optional[Dict[str, Any]]:
     if not format_obj:
         return None
-    payload = as_json_dict(format_obj)
-    if payload.get("type") == "json_schema" and payload.get("jsonSchema"):
-        schema = payload.get("jsonSchema")
-        return {
-            "type": "json_schema",
-            "json_schema": {
+    if isinstance(format_obj, dict):
+        kind, schema = format_obj.get("type"), format_obj.get("jsonSchema")
+    else:
+        kind, schema = getattr(format_obj, "type", None), getattr(format_obj, "jsonSchema", None)
+    if kind == "json_schema" and schema:
+        if isinstance(schema, dict):
+            strict = schema.get("strict")
+            json_schema = {
                 "name": schema.get("name"),
                 "schema": schema.get("schema"),
-                "strict": schema.get("strict", True),
-            },
-        }
-    return payload
+                "strict": True if strict is None else strict,
+            }
+        else:
+            json_schema = {"name": schema.name, "schema": schema.schema, "strict": schema.strict}
+        return {"type": "json_schema", "json_schema": json_schema}
+    return as_json_dict(format_obj)
 
 
 def _normalize_chat_output(payload: Dict[str, Any]) -> GenerateOutput:
@@ -510,15 +846,21 @@ def _normalize_chat_output(payload: Dict[str, Any]) -> GenerateOutput:
     choice = choices[0] if choices else {}
     message = choice.get("message", {}) or {}
     content = message.get("content")
-    text_parts: List[str] = []
-    if isinstance(content, list):
-        for part in content:
-            if isinstance(part, dict) and part.get("type") == "text":
-                text_parts.append(part.get("text", ""))
-    elif isinstance(content, str):
-        text_parts.append(content)
+    if isinstance(content, str):
+        text = content
+    elif isinstance(content, list):
+        text = (
+            "".join(
+                part.get("text") or ""
+                for part in content
+                if isinstance(part, dict) and part.get("type") == "text"
+            )
+            or None
+        )
+    else:
+        text = None
     return GenerateOutput(
-        text="".join(text_parts) if text_parts else None,
+        text=text,
         toolCalls=_map_tool_calls(message.get("tool_calls")),
         finishReason=choice.get("finish_reason"),
         usage=_map_chat_usage(payload.get("usage")),
@@ -531,16 +873,19 @@ def _normalize_responses_output(payload: Dict[str, Any]) -> GenerateOutput:
     tool_calls: List[ToolCall] = []
     for output in payload.get("output", []) or []:
         for content in output.get("content", []) or []:
-            if content.get("type") == "output_text" and content.get("text"):
-                text_parts.append(content.get("text"))
-            if content.get("type") == "refusal" and content.get("refusal"):
-                text_parts.append(content.get("refusal"))
-            if content.get("type") == "tool_call":
+            kind = content.get("type")
+            if kind == "output_text":
+                if content.get("text"):
+                    text_parts.append(content["text"])
+            elif kind == "refusal":
+                if content.get("refusal"):
+                    text_parts.append(content["refusal"])
+            elif kind == "tool_call":
                 tool_calls.append(
                     ToolCall(
                         id=content.get("id") or f"tool_{len(tool_calls)}",
                         name=content.get("name") or "",
-                        argumentsJson=json.dumps(content.get("arguments", {})),
+                        argumentsJson=dumps(content.get("arguments", {})),
                     )
                 )
     return GenerateOutput(
@@ -555,14 +900,16 @@ def _normalize_responses_output(payload: Dict[str, Any]) -> GenerateOutput:
 def _map_tool_calls(raw_calls: Optional[List[Dict[str, Any]]]) -> Optional[List[ToolCall]]:
     if not raw_calls:
         return None
-    return [
-        ToolCall(
-            id=call.get("id"),
-            name=call.get("function", {}).get("name", ""),
-            argumentsJson=call.get("function", {}).get("arguments", ""),
-        )
-        for call in raw_calls
-    ]
+    return [_map_tool_call(call) for call in raw_calls]
+
+
+def _map_tool_call(call: Dict[str, Any]) -> ToolCall:
+    function = call.get("function") or _EMPTY_FUNCTION
+    return ToolCall(
+        id=call.get("id"),
+        name=function.get("name", ""),
+        argumentsJson=function.get("arguments", ""),
+    )
 
 
 def _map_chat_usage(raw: Optional[Dict[str, Any]]) -> Optional[Usage]:
@@ -585,13 +932,16 @@ def _map_responses_usage(raw: Optional[Dict[str, Any]]) -> Optional[Usage]:
     )
 
 
+@lru_cache(maxsize=4096)
 def _derive_family(model_id: str) -> str:
     if not model_id:
         return ""
-    parts = model_id.split("-")
-    if len(parts) >= 2:
-        return "-".join(parts[:2])
-    return model_id
+    end = -1
+    for _ in range(2):
+        end = model_id.find("-", end + 1)
+        if end < 0:
+            return model_id
+    return model_id[:end]
 
 
 def _normalize_transcription_output(payload: Dict[str, Any]) -> TranscribeOutput:
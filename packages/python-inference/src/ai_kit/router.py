@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import List
+from operator import itemgetter
+from typing import Any, Callable, Dict, List
 
 from .types import ModelRecord, ModelResolutionRequest, ResolvedModel
 
@@ -20,49 +21,55 @@ def _filter_models(models: List[ModelRecord], request: ModelResolutionRequest) -
     constraints = request.constraints
     preferred = [entry.strip() for entry in (request.preferredModels or []) if entry.strip()]
     allow_preview = constraints.allowPreview if constraints else True
+    # First position of each preferred id; a model ranks by whichever of its
+    # id / providerModelId appears earliest.
+    preferred_rank: Dict[str, int] = {}
+    for idx, entry in enumerate(preferred):
+        preferred_rank.setdefault(entry, idx)
+    unranked = len(preferred) + 1
+
+    # Only the constraints this request sets are checked per model.
+    checks: List[Callable[[ModelRecord], Any]] = []
+    if constraints:
+        if constraints.requireTools:
+            checks.append(lambda model: model.features.tools)
+        if constraints.requireJson:
+            checks.append(lambda model: model.features.jsonMode or model.features.jsonSchema)
+        if constraints.requireVision:
+            checks.append(lambda model: model.modalities.vision)
+        if constraints.requireVideo:
+            checks.append(lambda model: getattr(model.modalities, "videoOut", None))
+        max_cost = constraints.maxCostUsd
+        if max_cost:
+            checks.append(lambda model: _within_cost(model, max_cost))
+    if allow_preview is False:
+        checks.append(lambda model: not (model.tags and "preview" in model.tags))
 
     def matches(model: ModelRecord) -> bool:
         if not model.availability.entitled:
             return False
-        if constraints:
-            if constraints.requireTools and not model.features.tools:
-                return False
-            if constraints.requireJson and not (
-                model.features.jsonMode or model.features.jsonSchema
-            ):
-                return False
-            if constraints.requireVision and not model.modalities.vision:
+        for check in checks:
+            if not check(model):
                 return False
-            if constraints.requireVideo and not getattr(model.modalities, "videoOut", None):
-                return False
-            if constraints.maxCostUsd and not _within_cost(model, constraints.maxCostUsd):
-                return False
-        if allow_preview is False and model.tags and "preview" in model.tags:
-            return False
-        if preferred and not _matches_preferred(model, preferred):
-            return False
         return True
 
-    candidates = [model for model in models if matches(model)]
-    candidates.sort(key=lambda m: (
-        _preferred_rank(m, preferred),
-        _price_score(m),
-        m.displayName or "",
-    ))
-    return candidates
-
-
-def _matches_preferred(model: ModelRecord, preferred: List[str]) -> bool:
-    return any(entry in (model.id, model.providerModelId) for entry in preferred)
-
-
-def _preferred_rank(model: ModelRecord, preferred: List[str]) -> int:
-    if not preferred:
-        return len(preferred) + 1
-    for idx, entry in enumerate(preferred):
-        if entry in (model.id, model.providerModelId):
-            return idx
-    return len(preferred) + 1
+    # Rank, price and name are computed once per surviving model and sorted as
+    # a tuple, rather than rescanning ``preferred`` from the sort key.
+    scored = []
+    for model in models:
+        if not matches(model):
+            continue
+        rank = unranked
+        if preferred_rank:
+            rank = min(
+                preferred_rank.get(model.id, unranked),
+                preferred_rank.get(model.providerModelId, unranked),
+            )
+            if rank == unranked:
+                continue
+        scored.append((rank, _price_score(model), model.displayName or "", model))
+    scored.sort(key=itemgetter(0, 1, 2))
+    return [entry[3] for entry in scored]
 
 
 def _within_cost(model: ModelRecord, max_cost: float) -> bool:
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from typing import Dict, Generator, Iterable, Optional
+from typing import Any, AsyncGenerator, AsyncIterable, Dict, Generator, Iterable, List, Optional
+
+# Field prefixes, compared against fixed-width slices rather than via startswith().
+_DATA = "data:"
+_EVENT = "event:"
+_DATA_BYTES = b"data:"
+_EVENT_BYTES = b"event:"
 
 
 def iter_sse_events(lines: Iterable[str]) -> Generator[Dict[str, str], None, None]:
@@ -10,19 +16,172 @@ def iter_sse_events(lines: Iterable[str]) -> Generator[Dict[str, str], None, Non
         line = raw.strip("\r\n")
         if line == "":
             if data_lines:
-                yield {
-                    "event": event_type or "message",
-                    "data": "\n".join(data_lines),
-                }
+                yield _text_event(event_type, data_lines)
+            event_type = None
+            data_lines = []
+            continue
+        if line[:5] == _DATA:
+            data_lines.append(line[5:].strip())
+        elif line[:6] == _EVENT:
+            event_type = line[6:].strip()
+    if data_lines:
+        yield _text_event(event_type, data_lines)
+
+
+def _text_event(event_type: Optional[str], data_lines: List[str]) -> Dict[str, str]:
+    return {
+        "event": event_type or "message",
+        "data": data_lines[0] if len(data_lines) == 1 else "\n".join(data_lines),
+    }
+
+
+def iter_sse_response(response: Any) -> Generator[Dict[str, str], None, None]:
+    """Parse the SSE body of a streaming ``requests`` response.
+
+    Prefer this over ``response.iter_lines()``. ``chunk_size=None`` hands over
+    whatever each socket read returned. A fixed size would block until that
+    many bytes arrived and stall token delivery.
+    """
+    return iter_sse_events_bytes(response.iter_content(chunk_size=None))
+
+
+def iter_sse_response_batches(
+    response: Any, max_batch: int = 32
+) -> Generator[List[Dict[str, str]], None, None]:
+    return iter_sse_event_batches(response.iter_content(chunk_size=None), max_batch)
+
+
+def iter_sse_event_batches(
+    chunks: Iterable[bytes], max_batch: int = 32
+) -> Generator[List[Dict[str, str]], None, None]:
+    """Like iter_sse_events_bytes, but yield lists of events.
+
+    A batch holds the events completed by one chunk (at most ``max_batch``), so
+    nothing waits on the next read while a fast stream pays one generator
+    round-trip per read instead of per event.
+    """
+    decoder = _SseByteDecoder()
+    for chunk in chunks:
+        if chunk:
+            yield from _split_batches(decoder.feed(chunk), max_batch)
+    yield from _split_batches(decoder.close(), max_batch)
+
+
+async def aiter_sse_event_batches(
+    chunks: AsyncIterable[bytes], max_batch: int = 32
+) -> AsyncGenerator[List[Dict[str, str]], None]:
+    decoder = _SseByteDecoder()
+    async for chunk in chunks:
+        if chunk:
+            for batch in _split_batches(decoder.feed(chunk), max_batch):
+                yield batch
+    for batch in _split_batches(decoder.close(), max_batch):
+        yield batch
+
+
+def _split_batches(events: List[Dict[str, str]], max_batch: int) -> List[List[Dict[str, str]]]:
+    if len(events) <= max_batch:
+        return [events] if events else []
+    return [events[start : start + max_batch] for start in range(0, len(events), max_batch)]
+
+
+def iter_sse_events_bytes(chunks: Iterable[bytes]) -> Generator[Dict[str, str], None, None]:
+    """Parse SSE straight from raw response chunks (e.g. ``iter_content(None)``).
+
+    Events are cut at blank lines in a byte buffer and only each event's joined
+    data is decoded, instead of decoding and stripping every line.
+    """
+    decoder = _SseByteDecoder()
+    for chunk in chunks:
+        if chunk:
+            yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+async def aiter_sse_events_bytes(chunks: AsyncIterable[bytes]) -> AsyncGenerator[Dict[str, str], None]:
+    decoder = _SseByteDecoder()
+    async for chunk in chunks:
+        if chunk:
+            for event in decoder.feed(chunk):
+                yield event
+    for event in decoder.close():
+        yield event
+
+
+class _SseByteDecoder:
+    __slots__ = ("buf", "held_cr")
+
+    def __init__(self) -> None:
+        self.buf = bytearray()
+        self.held_cr = False
+
+    def feed(self, chunk: bytes) -> List[Dict[str, str]]:
+        if self.held_cr:
+            chunk = b"\r" + chunk
+            self.held_cr = False
+        if b"\r" in chunk:
+            # A CRLF may straddle two chunks; keep a trailing CR for the next one.
+            if chunk.endswith(b"\r"):
+                chunk = chunk[:-1]
+                self.held_cr = True
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        buf = self.buf
+        buf += chunk
+        events: List[Dict[str, str]] = []
+        start = 0
+        while True:
+            end = buf.find(b"\n\n", start)
+            if end < 0:
+                break
+            event = _parse_sse_block(bytes(buf[start:end]))
+            if event is not None:
+                events.append(event)
+            start = end + 2
+        if start:
+            del buf[:start]
+        return events
+
+    def close(self) -> List[Dict[str, str]]:
+        buf = self.buf
+        if self.held_cr:
+            buf += b"\n"
+            self.held_cr = False
+        event = _parse_sse_block(bytes(buf)) if buf else None
+        buf.clear()
+        return [event] if event is not None else []
+
+
+def _parse_sse_block(block: bytes) -> Optional[Dict[str, str]]:
+    event_type = b""
+    data_lines: List[bytes] = []
+    for line in block.split(b"\n"):
+        if line[:5] == _DATA_BYTES:
+            data_lines.append(line[5:].strip())
+        elif line[:6] == _EVENT_BYTES:
+            event_type = line[6:].strip()
+    if not data_lines:
+        return None
+    data = data_lines[0] if len(data_lines) == 1 else b"\n".join(data_lines)
+    return {
+        "event": event_type.decode("utf-8") if event_type else "message",
+        "data": data.decode("utf-8"),
+    }
+
+
+async def aiter_sse_events(lines: AsyncIterable[str]) -> AsyncGenerator[Dict[str, str], None]:
+    event_type: Optional[str] = None
+    data_lines: list[str] = []
+    async for raw in lines:
+        line = raw.strip("\r\n")
+        if line == "":
+            if data_lines:
+                yield _text_event(event_type, data_lines)
             event_type = None
             data_lines = []
             continue
-        if line.startswith("event:"):
-            event_type = line.split(":", 1)[1].strip()
-        elif line.startswith("data:"):
-            data_lines.append(line.split(":", 1)[1].strip())
+        if line[:5] == _DATA:
+            data_lines.append(line[5:].strip())
+        elif line[:6] == _EVENT:
+            event_type = line[6:].strip()
     if data_lines:
-        yield {
-            "event": event_type or "message",
-            "data": "\n".join(data_lines),
-        }
+        yield _text_event(event_type, data_lines)
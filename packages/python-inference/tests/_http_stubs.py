@@ -0,0 +1,103 @@
+"""In-memory stand-ins for requests.Session and httpx.AsyncClient.
+
+Both accept exactly the keyword arguments the ai_kit.http helpers pass, so a
+call path that drifts from the real client signature fails here too.
+"""
+
+import json
+
+
+class StubResponse:
+    def __init__(self, body=b"", status_code=200, chunks=None, headers=None):
+        if not isinstance(body, (bytes, str)):
+            body = json.dumps(body)
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.status_code = status_code
+        self.content = body
+        self.text = body.decode("utf-8")
+        self.headers = headers or {}
+        self.chunks = list(chunks) if chunks is not None else [body]
+        self.closed = False
+
+    def iter_content(self, chunk_size=None):
+        return iter(self.chunks)
+
+    def iter_lines(self, chunk_size=512):
+        return iter(self.content.splitlines())
+
+    def close(self):
+        self.closed = True
+
+    async def aiter_bytes(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    async def aread(self):
+        return self.content
+
+    async def aclose(self):
+        self.closed = True
+
+
+class StubSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, headers=None, data=None, files=None, timeout=None, stream=False):
+        self.calls.append(
+            {
+                "method": method,
+                "url": url,
+                "headers": headers,
+                "data": data,
+                "files": files,
+                "timeout": timeout,
+                "stream": stream,
+            }
+        )
+        return self.responses.pop(0)
+
+    def close(self):
+        pass
+
+
+class StubAsyncClient:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+        self.closed = False
+
+    async def request(self, method, url, headers=None, content=None, timeout=None):
+        self.calls.append({"method": method, "url": url, "headers": headers, "content": content, "stream": False})
+        return self.responses.pop(0)
+
+    def build_request(self, method, url, headers=None, content=None, timeout=None):
+        return {"method": method, "url": url, "headers": headers, "content": content}
+
+    async def send(self, request, stream=False):
+        self.calls.append({**request, "stream": stream})
+        return self.responses.pop(0)
+
+    async def aclose(self):
+        self.closed = True
+
+
+def sse(*events):
+    """Encode (event, data) pairs, or bare data payloads, as one SSE body."""
+    frames = []
+    for item in events:
+        event, data = item if isinstance(item, tuple) else (None, item)
+        if not isinstance(data, str):
+            data = json.dumps(data)
+        frame = f"data: {data}\n\n"
+        if event:
+            frame = f"event: {event}\n" + frame
+        frames.append(frame)
+    return "".join(frames).encode("utf-8")
+
+
+def sent_json(call):
+    body = call.get("data")
+    return json.loads(body if body is not None else call["content"])
@@ -0,0 +1,117 @@
+import unittest
+
+from _http_stubs import StubResponse, StubSession, sent_json, sse
+from ai_kit.errors import AiKitError
+from ai_kit.providers.anthropic import AnthropicAdapter, AnthropicConfig
+from ai_kit.providers.gemini import GeminiAdapter, GeminiConfig
+from ai_kit.types import ContentPart, GenerateInput, ImageGenerateInput, Message
+
+
+def _input(provider, model):
+    return GenerateInput(
+        provider=provider,
+        model=model,
+        messages=[Message(role="user", content=[ContentPart(type="text", text="hi")])],
+    )
+
+
+def _anthropic(session):
+    adapter = AnthropicAdapter(AnthropicConfig(api_key="ak-test", base_url="https://anthropic.test"))
+    adapter._session = session
+    return adapter
+
+
+def _gemini(session):
+    adapter = GeminiAdapter(GeminiConfig(api_key="gk-test", base_url="https://gemini.test"))
+    adapter._session = session
+    return adapter
+
+
+class AnthropicAdapterTest(unittest.TestCase):
+    def test_list_models(self):
+        session = StubSession(StubResponse({"data": [{"id": "claude-test"}, {}]}))
+        models = _anthropic(session).list_models()
+        self.assertEqual([model.id for model in models], ["claude-test"])
+        (call,) = session.calls
+        self.assertEqual(call["url"], "https://anthropic.test/v1/models")
+        self.assertEqual(call["headers"]["x-api-key"], "ak-test")
+
+    def test_generate(self):
+        session = StubSession(
+            StubResponse({"content": [{"type": "text", "text": "hello"}], "stop_reason": "end_turn"})
+        )
+        output = _anthropic(session).generate(_input("anthropic", "claude-test"))
+        self.assertEqual(output.text, "hello")
+        (call,) = session.calls
+        self.assertEqual(call["url"], "https://anthropic.test/v1/messages")
+        body = sent_json(call)
+        self.assertEqual(body["messages"], [{"role": "user", "content": [{"type": "text", "text": "hi"}]}])
+        self.assertFalse(body["stream"])
+
+    def test_stream_generate_skips_unconsumed_events(self):
+        body = sse(
+            ("message_start", {"type": "message_start"}),
+            ("ping", {"type": "ping"}),
+            ("content_block_delta", {"delta": {"type": "text_delta", "text": "Hel"}}),
+            ("content_block_delta", {"delta": {"type": "input_json_delta", "partial_json": "{}"}}),
+            ("content_block_delta", {"delta": {"type": "text_delta", "text": "lo"}}),
+            ("message_stop", {"type": "message_stop"}),
+        )
+        response = StubResponse(body)
+        session = StubSession(response)
+        chunks = list(_anthropic(session).stream_generate(_input("anthropic", "claude-test")))
+        self.assertEqual(
+            [(chunk.type, chunk.textDelta) for chunk in chunks],
+            [("delta", "Hel"), ("delta", "lo"), ("message_end", None)],
+        )
+        self.assertTrue(session.calls[0]["stream"])
+        self.assertTrue(response.closed)
+
+
+class GeminiAdapterTest(unittest.TestCase):
+    def test_list_models(self):
+        session = StubSession(
+            StubResponse({"models": [{"name": "models/gemini-test", "displayName": "Gemini", "inputTokenLimit": 10}]})
+        )
+        (model,) = _gemini(session).list_models()
+        self.assertEqual((model.id, model.displayName, model.contextWindow), ("gemini-test", "Gemini", 10))
+        self.assertEqual(session.calls[0]["url"], "https://gemini.test/v1beta/models?key=gk-test")
+
+    def test_generate(self):
+        session = StubSession(StubResponse({"candidates": [{"content": {"parts": [{"text": "hel"}, {"text": "lo"}]}}]}))
+        output = _gemini(session).generate(_input("google", "models/gemini-test"))
+        self.assertEqual(output.text, "hello")
+        (call,) = session.calls
+        self.assertEqual(call["url"], "https://gemini.test/v1beta/models/gemini-test:generateContent?key=gk-test")
+        self.assertEqual(sent_json(call)["contents"], [{"role": "user", "parts": [{"text": "hi"}]}])
+
+    def test_stream_generate(self):
+        body = sse(
+            {"candidates": [{"content": {"parts": [{"text": "Hel"}]}}]},
+            {"candidates": [{"content": {"parts": [{"text": "lo"}]}}]},
+            {"candidates": [{"finishReason": "STOP"}]},
+        )
+        response = StubResponse(body)
+        session = StubSession(response)
+        chunks = list(_gemini(session).stream_generate(_input("google", "gemini-test")))
+        self.assertEqual([chunk.textDelta for chunk in chunks], ["Hel", "lo"])
+        self.assertEqual(
+            session.calls[0]["url"],
+            "https://gemini.test/v1beta/models/gemini-test:streamGenerateContent?alt=sse&key=gk-test",
+        )
+        self.assertTrue(response.closed)
+
+    def test_generate_image(self):
+        payload = {"candidates": [{"content": {"parts": [{"inlineData": {"mimeType": "image/jpeg", "data": "aW1n"}}]}}]}
+        session = StubSession(StubResponse(payload))
+        output = _gemini(session).generate_image(ImageGenerateInput(provider="google", model="gemini-image", prompt="cat"))
+        self.assertEqual((output.mime, output.data), ("image/jpeg", "aW1n"))
+
+    def test_generate_image_without_inline_data(self):
+        session = StubSession(StubResponse({"candidates": [{"content": {"parts": [{"text": "no"}]}}]}))
+        with self.assertRaises(AiKitError):
+            _gemini(session).generate_image(ImageGenerateInput(provider="google", model="gemini-image", prompt="cat"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import unittest
+
+from ai_kit.http_asgi import (
+    _STREAM_MAX_PENDING,
+    _chunk_frame,
+    _handle_stream,
+    _send_coalesced_frames,
+)
+from ai_kit.jsonlib import dumps_bytes
+from ai_kit.types import StreamChunk, Usage
+
+
+def _chunks(count):
+    for index in range(count):
+        yield StreamChunk("delta", f"tok{index} ")
+    yield StreamChunk(type="message_end", finishReason="stop", usage=Usage(outputTokens=count))
+
+
+class _Recorder:
+    def __init__(self):
+        self.messages = []
+
+    async def __call__(self, message):
+        self.messages.append(message)
+        # Let the pump thread run between sends so frames queue up.
+        await asyncio.sleep(0.001)
+
+    def body(self):
+        return b"".join(message.get("body", b"") for message in self.messages)
+
+
+class _Upstream:
+    """Chunk iterator that records how far it got and whether it was closed."""
+
+    def __init__(self, limit=None, fail_after=None):
+        self.limit = limit
+        self.fail_after = fail_after
+        self.produced = 0
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.fail_after is not None and self.produced == self.fail_after:
+            raise RuntimeError("upstream broke")
+        if self.limit is not None and self.produced == self.limit:
+            raise StopIteration
+        self.produced += 1
+        return StreamChunk("delta", f"t{self.produced}")
+
+    def close(self):
+        self.closed.set()
+
+
+class SendCoalescedFramesTest(unittest.TestCase):
+    def test_frames_arrive_in_order(self):
+        send = _Recorder()
+        asyncio.run(_send_coalesced_frames(send, _chunks(300)))
+        self.assertEqual(send.body(), b"".join(map(_chunk_frame, _chunks(300))))
+        self.assertTrue(all(message["more_body"] for message in send.messages))
+
+    def test_frames_before_an_error_are_flushed_first(self):
+        send = _Recorder()
+        upstream = _Upstream(fail_after=3)
+        with self.assertRaisesRegex(RuntimeError, "upstream broke"):
+            asyncio.run(_send_coalesced_frames(send, upstream))
+        self.assertEqual(send.body(), b"".join(_chunk_frame(StreamChunk("delta", f"t{n}")) for n in (1, 2, 3)))
+        self.assertTrue(upstream.closed.wait(1))
+
+    def test_client_disconnect_stops_and_closes_upstream(self):
+        upstream = _Upstream()
+
+        async def send(message):
+            raise OSError("client went away")
+
+        with self.assertRaises(OSError):
+            asyncio.run(_send_coalesced_frames(send, upstream))
+        self.assertTrue(upstream.closed.wait(1))
+        produced = upstream.produced
+        self.assertLessEqual(produced, _STREAM_MAX_PENDING + 1)
+
+    def test_slow_client_bounds_read_ahead(self):
+        upstream = _Upstream()
+
+        async def run():
+            stalled = asyncio.get_running_loop().create_future()
+
+            async def send(message):
+                await stalled
+
+            task = asyncio.ensure_future(_send_coalesced_frames(send, upstream))
+            await asyncio.sleep(0.2)
+            produced = upstream.produced
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            return produced
+
+        produced = asyncio.run(run())
+        self.assertLessEqual(produced, _STREAM_MAX_PENDING + 1)
+        self.assertTrue(upstream.closed.wait(1))
+
+
+class HandleStreamTest(unittest.TestCase):
+    def _run(self, stream):
+        class _Kit:
+            def stream_generate(self, input):
+                return stream
+
+        body = dumps_bytes({"provider": "openai", "model": "m", "messages": []})
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+
+        async def receive():
+            return messages.pop(0)
+
+        send = _Recorder()
+        asyncio.run(_handle_stream(_Kit(), {"type": "http"}, receive, send))
+        return send
+
+    def test_done_event_ends_stream(self):
+        send = self._run(_chunks(2))
+        self.assertEqual(send.messages[0]["status"], 200)
+        self.assertTrue(send.body().endswith(b'event: done\ndata: {"ok":true}\n\n'))
+        self.assertFalse(send.messages[-1]["more_body"])
+
+    def test_error_event_follows_flushed_frames(self):
+        send = self._run(_Upstream(fail_after=2))
+        body = send.body()
+        frames = b"".join(_chunk_frame(StreamChunk("delta", f"t{n}")) for n in (1, 2))
+        self.assertTrue(body.startswith(frames))
+        self.assertIn(b"event: error\n", body[len(frames) :])
+        self.assertFalse(send.messages[-1]["more_body"])
+
+
+if __name__ == "__main__":
+    unittest.main()
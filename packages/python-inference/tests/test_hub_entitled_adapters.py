@@ -0,0 +1,69 @@
+import unittest
+from unittest import mock
+
+from ai_kit import hub
+from ai_kit.entitlements import fingerprint_api_key
+from ai_kit.hub import Kit, KitConfig
+from ai_kit.providers.anthropic import AnthropicConfig
+from ai_kit.providers.openai import OpenAIConfig
+from ai_kit.types import EntitlementContext
+
+
+def _kit():
+    return Kit(
+        KitConfig(
+            providers={
+                "openai": OpenAIConfig(api_key="sk-base", base_url="https://api.test"),
+                "anthropic": AnthropicConfig(api_key="ak-base"),
+            }
+        )
+    )
+
+
+def _context(provider, api_key, fingerprint=None):
+    return EntitlementContext(provider=provider, apiKey=api_key, apiKeyFingerprint=fingerprint)
+
+
+class EntitledAdapterCacheTest(unittest.TestCase):
+    def test_reuses_one_adapter_per_provider_and_key(self):
+        kit = _kit()
+        first = kit._adapter_factory("openai", _context("openai", "sk-a"))
+        self.assertIs(kit._adapter_factory("openai", _context("openai", "sk-a")), first)
+        self.assertIsNot(kit._adapter_factory("openai", _context("openai", "sk-b")), first)
+        self.assertIsNot(kit._adapter_factory("anthropic", _context("anthropic", "sk-a")), first)
+        self.assertEqual(first.config.api_key, "sk-a")
+        self.assertEqual(first.base_url, "https://api.test")
+
+    def test_cache_is_keyed_by_fingerprint_not_raw_key(self):
+        kit = _kit()
+        kit._adapter_factory("openai", _context("openai", "sk-a"))
+        self.assertEqual(list(kit._entitled_adapters), [("openai", fingerprint_api_key("sk-a"))])
+
+    def test_supplied_fingerprint_cannot_select_another_keys_adapter(self):
+        kit = _kit()
+        victim = kit._adapter_factory("openai", _context("openai", "sk-a"))
+        forged = kit._adapter_factory("openai", _context("openai", "sk-b", fingerprint_api_key("sk-a")))
+        self.assertIsNot(forged, victim)
+        self.assertEqual(forged.config.api_key, "sk-b")
+
+    def test_evicts_least_recently_used_and_closes_it(self):
+        kit = _kit()
+        with mock.patch.object(hub, "_ENTITLED_ADAPTER_LIMIT", 2):
+            a = kit._adapter_factory("openai", _context("openai", "sk-a"))
+            b = kit._adapter_factory("openai", _context("openai", "sk-b"))
+            self.assertIs(kit._adapter_factory("openai", _context("openai", "sk-a")), a)
+            with mock.patch.object(b, "close") as close_b, mock.patch.object(a, "close") as close_a:
+                kit._adapter_factory("openai", _context("openai", "sk-c"))
+        close_b.assert_called_once_with()
+        close_a.assert_not_called()
+        self.assertEqual(len(kit._entitled_adapters), 2)
+        self.assertIsNot(kit._adapter_factory("openai", _context("openai", "sk-b")), b)
+
+    def test_unconfigured_provider_is_not_cached(self):
+        kit = _kit()
+        self.assertIsNone(kit._adapter_factory("google", _context("google", "gk-a")))
+        self.assertEqual(len(kit._entitled_adapters), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
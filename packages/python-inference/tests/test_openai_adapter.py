@@ -0,0 +1,250 @@
+import asyncio
+import base64
+import json
+import unittest
+
+from _http_stubs import StubAsyncClient, StubResponse, StubSession, sent_json, sse
+from ai_kit.providers.openai import AsyncOpenAIAdapter, OpenAIAdapter, OpenAIConfig
+from ai_kit.types import (
+    AudioInput,
+    ContentPart,
+    GenerateInput,
+    ImageGenerateInput,
+    ImageInput,
+    Message,
+    TranscribeInput,
+)
+
+
+def _input(**overrides):
+    fields = {
+        "provider": "openai",
+        "model": "gpt-test",
+        "messages": [Message(role="user", content=[ContentPart(type="text", text="hi")])],
+    }
+    fields.update(overrides)
+    return GenerateInput(**fields)
+
+
+def _adapter(session, use_responses=True):
+    adapter = OpenAIAdapter(
+        OpenAIConfig(api_key="sk-test", base_url="https://api.test", default_use_responses=use_responses, timeout=5)
+    )
+    adapter._session = session
+    return adapter
+
+
+_CHAT_COMPLETION = {
+    "choices": [{"message": {"role": "assistant", "content": "hello"}, "finish_reason": "stop"}],
+    "usage": {"prompt_tokens": 3, "completion_tokens": 1, "total_tokens": 4},
+}
+
+_CHAT_STREAM = [
+    {"choices": [{"delta": {"content": "Hel"}}]},
+    {"choices": [{"delta": {"content": "lo \"wörld\""}}]},
+    {"choices": [{"delta": {}, "finish_reason": "stop"}]},
+    "[DONE]",
+]
+
+_RESPONSES_STREAM = [
+    ("response.output_text.delta", {"type": "response.output_text.delta", "delta": "Hel"}),
+    ("response.output_text.delta", {"type": "response.output_text.delta", "delta": "lo"}),
+    ("response.completed", {"response": {"status": "completed", "usage": {"input_tokens": 3, "output_tokens": 1}}}),
+]
+
+
+class ListModelsTest(unittest.TestCase):
+    def test_maps_model_ids(self):
+        session = StubSession(StubResponse({"data": [{"id": "gpt-4o"}, {"object": "model"}]}))
+        models = _adapter(session).list_models()
+        self.assertEqual([model.id for model in models], ["gpt-4o"])
+        (call,) = session.calls
+        self.assertEqual((call["method"], call["url"]), ("GET", "https://api.test/v1/models"))
+        self.assertEqual(call["headers"]["Authorization"], "Bearer sk-test")
+
+
+class GenerateTest(unittest.TestCase):
+    def test_chat_completions(self):
+        session = StubSession(StubResponse(_CHAT_COMPLETION))
+        output = _adapter(session, use_responses=False).generate(_input(metadata={"batch": "true"}))
+        self.assertEqual(output.text, "hello")
+        self.assertEqual(output.finishReason, "stop")
+        (call,) = session.calls
+        self.assertEqual(call["url"], "https://api.test/v1/chat/completions")
+        self.assertEqual(call["headers"]["Content-Type"], "application/json")
+        body = sent_json(call)
+        self.assertEqual(body["model"], "gpt-test")
+        self.assertFalse(body["stream"])
+
+    def test_responses(self):
+        payload = {
+            "status": "completed",
+            "output": [{"type": "message", "content": [{"type": "output_text", "text": "hello"}]}],
+        }
+        session = StubSession(StubResponse(payload))
+        output = _adapter(session).generate(_input())
+        self.assertEqual(output.text, "hello")
+        (call,) = session.calls
+        self.assertEqual(call["url"], "https://api.test/v1/responses")
+        self.assertFalse(sent_json(call)["stream"])
+
+
+class StreamGenerateTest(unittest.TestCase):
+    def test_chat_stream_merges_deltas_per_read(self):
+        body = sse(*_CHAT_STREAM)
+        split = body.index(b"data:", 1)
+        response = StubResponse(chunks=[body[:split], body[split:]])
+        session = StubSession(response)
+        chunks = list(_adapter(session, use_responses=False).stream_generate(_input()))
+        self.assertEqual(
+            [(chunk.type, chunk.textDelta) for chunk in chunks],
+            [("delta", "Hel"), ("delta", 'lo "wörld"'), ("message_end", None)],
+        )
+        self.assertEqual(chunks[-1].finishReason, "stop")
+        self.assertTrue(session.calls[0]["stream"])
+        self.assertTrue(sent_json(session.calls[0])["stream"])
+        self.assertTrue(response.closed)
+
+    def test_responses_stream(self):
+        response = StubResponse(sse(*_RESPONSES_STREAM))
+        session = StubSession(response)
+        chunks = list(_adapter(session).stream_generate(_input()))
+        self.assertEqual([(chunk.type, chunk.textDelta) for chunk in chunks], [("delta", "Hello"), ("message_end", None)])
+        self.assertEqual(chunks[-1].usage.inputTokens, 3)
+        self.assertEqual(session.calls[0]["url"], "https://api.test/v1/responses")
+        self.assertTrue(response.closed)
+
+    def test_responses_stream_stops_at_error(self):
+        body = sse(
+            ("response.output_text.delta", {"delta": "partial"}),
+            ("response.error", {"error": {"message": "boom", "code": "server_error"}}),
+            ("response.output_text.delta", {"delta": "ignored"}),
+        )
+        chunks = list(_adapter(StubSession(StubResponse(body))).stream_generate(_input()))
+        self.assertEqual([chunk.type for chunk in chunks], ["delta", "error"])
+        self.assertEqual(chunks[0].textDelta, "partial")
+        self.assertEqual(chunks[1].error["message"], "boom")
+
+
+class BatchGenerateTest(unittest.TestCase):
+    def test_uploads_polls_and_orders_results(self):
+        result_lines = "\n".join(
+            json.dumps(line)
+            for line in (
+                {"custom_id": "1", "response": {"status_code": 200, "body": _CHAT_COMPLETION}},
+                {"custom_id": "0", "response": {"status_code": 500, "body": {"error": "x"}}},
+            )
+        )
+        session = StubSession(
+            StubResponse({"id": "file-in"}),
+            StubResponse({"id": "batch-1"}),
+            StubResponse({"status": "completed", "output_file_id": "file-out", "request_counts": {"total": 2}}),
+            StubResponse(result_lines),
+        )
+        outputs = _adapter(session).batch_generate([_input(), _input(model="gpt-other")], poll_interval_s=0)
+
+        self.assertEqual(outputs[0].finishReason, "error")
+        self.assertEqual(outputs[1].text, "hello")
+        upload, create, poll, download = session.calls
+        self.assertEqual(upload["url"], "https://api.test/v1/files")
+        self.assertNotIn("Content-Type", upload["headers"])
+        self.assertEqual(upload["data"], {"purpose": "batch"})
+        filename, content, media_type = upload["files"]["file"]
+        self.assertEqual([json.loads(line)["body"]["model"] for line in content.splitlines()], ["gpt-test", "gpt-other"])
+        self.assertEqual(sent_json(create)["input_file_id"], "file-in")
+        self.assertEqual(poll["url"], "https://api.test/v1/batches/batch-1")
+        self.assertEqual(download["url"], "https://api.test/v1/files/file-out/content")
+
+
+class GenerateImageTest(unittest.TestCase):
+    def test_generation(self):
+        session = StubSession(StubResponse({"data": [{"b64_json": "aW1n"}]}))
+        output = _adapter(session).generate_image(ImageGenerateInput(provider="openai", model="gpt-image-1", prompt="cat"))
+        self.assertEqual(output.data, "aW1n")
+        self.assertEqual(output.raw, {"data": [{}]})
+        (call,) = session.calls
+        self.assertEqual(call["url"], "https://api.test/v1/images")
+        self.assertEqual(sent_json(call)["size"], "1024x1024")
+
+    def test_edit_uploads_input_image(self):
+        session = StubSession(StubResponse({"data": [{"b64_json": "aW1n"}]}))
+        image = ImageInput(base64=base64.b64encode(b"png").decode(), mediaType="image/png")
+        output = _adapter(session).generate_image(
+            ImageGenerateInput(provider="openai", model="gpt-image-1", prompt="cat", inputImages=[image])
+        )
+        self.assertEqual(output.data, "aW1n")
+        (call,) = session.calls
+        self.assertEqual(call["url"], "https://api.test/v1/images/edits")
+        self.assertEqual(call["files"]["image"][1], b"png")
+
+
+class TranscribeTest(unittest.TestCase):
+    def test_multipart_upload(self):
+        session = StubSession(StubResponse({"text": "hello there", "language": "en"}))
+        audio = AudioInput(base64=base64.b64encode(b"wav").decode(), mediaType="audio/wav", fileName="a.wav")
+        output = _adapter(session).transcribe(
+            TranscribeInput(provider="openai", model="whisper-1", audio=audio, timestampGranularities="word")
+        )
+        self.assertEqual(output.text, "hello there")
+        (call,) = session.calls
+        self.assertEqual(call["url"], "https://api.test/v1/audio/transcriptions")
+        self.assertEqual(call["files"]["file"], ("a.wav", b"wav", "audio/wav"))
+        self.assertEqual(call["data"]["timestamp_granularities[]"], ["word"])
+
+    def test_text_format_returns_plain_text(self):
+        session = StubSession(StubResponse("plain words"))
+        audio = AudioInput(base64=base64.b64encode(b"wav").decode(), mediaType="audio/wav")
+        output = _adapter(session).transcribe(
+            TranscribeInput(provider="openai", model="whisper-1", audio=audio, responseFormat="text")
+        )
+        self.assertEqual(output.text, "plain words")
+
+
+class AsyncAdapterTest(unittest.TestCase):
+    def _adapter(self, client, use_responses=True):
+        config = OpenAIConfig(api_key="sk-test", base_url="https://api.test", default_use_responses=use_responses)
+        return AsyncOpenAIAdapter(config, client=client)
+
+    def test_alist_models(self):
+        client = StubAsyncClient(StubResponse({"data": [{"id": "gpt-4o"}]}))
+        models = asyncio.run(self._adapter(client).alist_models())
+        self.assertEqual([model.id for model in models], ["gpt-4o"])
+        self.assertEqual(client.calls[0]["url"], "https://api.test/v1/models")
+
+    def test_agenerate_chat(self):
+        client = StubAsyncClient(StubResponse(_CHAT_COMPLETION))
+        output = asyncio.run(self._adapter(client, use_responses=False).agenerate(_input()))
+        self.assertEqual(output.text, "hello")
+        (call,) = client.calls
+        self.assertEqual(call["url"], "https://api.test/v1/chat/completions")
+        self.assertFalse(sent_json(call)["stream"])
+
+    def test_astream_generate(self):
+        response = StubResponse(sse(*_RESPONSES_STREAM))
+        client = StubAsyncClient(response)
+
+        async def collect():
+            return [chunk async for chunk in self._adapter(client).astream_generate(_input())]
+
+        chunks = asyncio.run(collect())
+        self.assertEqual([(chunk.type, chunk.textDelta) for chunk in chunks], [("delta", "Hello"), ("message_end", None)])
+        self.assertTrue(client.calls[0]["stream"])
+        self.assertTrue(response.closed)
+
+    def test_aclose_leaves_a_callers_client_open(self):
+        client = StubAsyncClient()
+        adapter = self._adapter(client)
+        asyncio.run(adapter.aclose())
+        self.assertFalse(client.closed)
+        self.assertIs(adapter._async_client(), client)
+
+    def test_aclose_closes_an_owned_client(self):
+        client = StubAsyncClient()
+        config = OpenAIConfig(api_key="sk-test", base_url="https://api.test")
+        adapter = AsyncOpenAIAdapter(config, client=client, owns_client=True)
+        asyncio.run(adapter.aclose())
+        self.assertTrue(client.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import base64
+import unittest
+
+from ai_kit.providers.openai import OpenAIAdapter, OpenAIConfig
+from ai_kit.types import SpeechGenerateInput
+
+
+class _Response:
+    status_code = 200
+    headers = {"content-type": "audio/mpeg"}
+    content = b"mp3-bytes"
+    text = ""
+
+
+class _Session:
+    # Same keyword surface as requests.Session.post for the arguments the
+    # adapter passes, so an unexpected kwarg fails the call like it would live.
+    def __init__(self):
+        self.calls = []
+
+    def post(self, url, data=None, json=None, *, headers=None, timeout=None):
+        self.calls.append({"url": url, "json": json, "headers": headers, "timeout": timeout})
+        return _Response()
+
+
+class GenerateSpeechTest(unittest.TestCase):
+    def test_posts_payload_and_returns_base64_audio(self):
+        adapter = OpenAIAdapter(OpenAIConfig(api_key="sk-test", base_url="https://api.test", timeout=5))
+        session = _Session()
+        adapter._session = session
+
+        output = adapter.generate_speech(
+            SpeechGenerateInput(
+                provider="openai",
+                model="tts-1",
+                text="hello",
+                voice="alloy",
+                responseFormat="mp3",
+                speed=1.25,
+            )
+        )
+
+        self.assertEqual(output.mime, "audio/mpeg")
+        self.assertEqual(base64.b64decode(output.data), b"mp3-bytes")
+        (call,) = session.calls
+        self.assertEqual(call["url"], "https://api.test/v1/audio/speech")
+        self.assertEqual(
+            call["json"],
+            {"model": "tts-1", "input": "hello", "voice": "alloy", "response_format": "mp3", "speed": 1.25},
+        )
+        self.assertEqual(call["headers"]["Authorization"], "Bearer sk-test")
+        self.assertEqual(call["timeout"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
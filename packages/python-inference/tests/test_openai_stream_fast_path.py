@@ -0,0 +1,110 @@
+import json
+import unittest
+from unittest import mock
+
+from ai_kit.providers import openai
+from ai_kit.providers.openai import (
+    _CHAT_CONTENT_RE,
+    _RESPONSES_DELTA_RE,
+    _chat_event_chunks,
+    _responses_event_chunks,
+    _single_string_field,
+)
+
+_DELTA_EVENT = "response.output_text.delta"
+
+_TEXTS = [
+    "plain",
+    "",
+    'she said "hi"',
+    "back\\slash and \\n literal",
+    "line\nbreak\ttab",
+    "snow ☃ and emoji \U0001F600",
+    "</script>  ",
+]
+
+# Hand-written frames whose escaping differs from what json.dumps produces.
+_RAW_CHAT_FRAMES = [
+    r'{"choices":[{"delta":{"content":"😀 surrogate pair"}}]}',
+    r'{"choices":[{"delta":{"content":"é́ \/slash"}}]}',
+    r'{"choices":[{"delta":{"content" : "spaced \"quoted\""}}]}',
+    r'{"choices":[{"delta":{"content":"\ud83d lone surrogate"}}]}',
+    '{"choices":[{"delta":{"content":null}}]}',
+    '{"choices":[{"delta":{"role":"assistant","content":null,"tool_calls":[{"index":0,"id":"call_1",'
+    '"function":{"name":"lookup","arguments":"{\\"content\\": \\"x\\"}"}}]}}]}',
+    '{"choices":[{"delta":{"content":"first"},"logprobs":{"content":[{"token":"first"}]}}]}',
+    '{"choices":[{"delta":{"content":"a"}},{"index":1,"delta":{"content":"b"}}]}',
+    '{"choices":[{"delta":{"content":"done"},"finish_reason":"stop"}]}',
+    '{"choices":[{"delta":{"content":[{"type":"text","text":"list form"}]}}]}',
+]
+
+_RAW_RESPONSES_FRAMES = [
+    r'{"type":"response.output_text.delta","delta":"😀 pair"}',
+    r'{"type":"response.output_text.delta","delta":"say \"delta\": \"x\""}',
+    r'{"type":"response.output_text.delta","delta":"\ud83d lone"}',
+    '{"type":"response.output_text.delta","delta":"one","obfuscation":{"delta":"two"}}',
+    '{"type":"response.output_text.delta","delta":{"text":"nested"}}',
+    '{"type":"response.output_text.delta","delta":""}',
+]
+
+
+def _chat_frames():
+    frames = [json.dumps({"choices": [{"delta": {"content": text}}]}) for text in _TEXTS]
+    frames += [json.dumps({"choices": [{"delta": {"content": text}}]}, ensure_ascii=False) for text in _TEXTS]
+    return frames + _RAW_CHAT_FRAMES
+
+
+def _responses_frames():
+    frames = [json.dumps({"type": _DELTA_EVENT, "delta": text}) for text in _TEXTS]
+    frames += [json.dumps({"type": _DELTA_EVENT, "delta": text}, ensure_ascii=False) for text in _TEXTS]
+    return frames + _RAW_RESPONSES_FRAMES
+
+
+def _slow(chunks_for, event):
+    # The full-decode branch: what every frame produced before the regex fast path.
+    with mock.patch.object(openai, "_single_string_field", return_value=None):
+        return list(chunks_for(event))
+
+
+class SingleStringFieldTest(unittest.TestCase):
+    def test_matches_json_loads(self):
+        for data in _chat_frames():
+            with self.subTest(data=data):
+                value = _single_string_field(_CHAT_CONTENT_RE, data)
+                if value is not None:
+                    self.assertEqual(value, json.loads(data)["choices"][0]["delta"]["content"])
+        for data in _responses_frames():
+            with self.subTest(data=data):
+                value = _single_string_field(_RESPONSES_DELTA_RE, data)
+                if value is not None:
+                    self.assertEqual(value, json.loads(data)["delta"])
+
+    def test_plain_and_escaped_frames_take_the_fast_path(self):
+        for text in _TEXTS:
+            data = json.dumps({"choices": [{"delta": {"content": text}}]})
+            with self.subTest(text=text):
+                self.assertEqual(_single_string_field(_CHAT_CONTENT_RE, data), text)
+
+    def test_declines_ambiguous_frames(self):
+        self.assertIsNone(_single_string_field(_CHAT_CONTENT_RE, '{"choices":[{"delta":{"content":null}}]}'))
+        two = '{"choices":[{"delta":{"content":"a"}},{"index":1,"delta":{"content":"b"}}]}'
+        self.assertIsNone(_single_string_field(_CHAT_CONTENT_RE, two))
+        self.assertIsNone(_single_string_field(_CHAT_CONTENT_RE, r'{"content":"\ud83d"}'))
+
+
+class EventChunksMatchSlowPathTest(unittest.TestCase):
+    def test_chat(self):
+        for data in _chat_frames():
+            event = {"data": data}
+            with self.subTest(data=data):
+                self.assertEqual(list(_chat_event_chunks(event)), _slow(_chat_event_chunks, event))
+
+    def test_responses(self):
+        for data in _responses_frames():
+            event = {"event": _DELTA_EVENT, "data": data}
+            with self.subTest(data=data):
+                self.assertEqual(list(_responses_event_chunks(event)), _slow(_responses_event_chunks, event))
+
+
+if __name__ == "__main__":
+    unittest.main()
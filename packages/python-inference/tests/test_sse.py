@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+
+from ai_kit.sse import (
+    aiter_sse_event_batches,
+    iter_sse_event_batches,
+    iter_sse_events,
+    iter_sse_events_bytes,
+)
+
+
+def _splits(body):
+    """Every way of cutting ``body`` into two chunks, plus one byte per chunk."""
+    for index in range(len(body) + 1):
+        yield [body[:index], body[index:]]
+    yield [body[index : index + 1] for index in range(len(body))]
+
+
+def _reference(body):
+    # The line-based text parser the byte decoder replaced.
+    return list(iter_sse_events(body.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n").splitlines()))
+
+
+class SseByteDecoderTest(unittest.TestCase):
+    def assertDecodes(self, body, expected):
+        self.assertEqual(_reference(body), expected)
+        for chunks in _splits(body):
+            with self.subTest(chunks=chunks):
+                self.assertEqual(list(iter_sse_events_bytes(chunks)), expected)
+                batches = list(iter_sse_event_batches(chunks, max_batch=2))
+                self.assertTrue(all(1 <= len(batch) <= 2 for batch in batches))
+                self.assertEqual([event for batch in batches for event in batch], expected)
+
+    def test_crlf_split_across_chunks(self):
+        body = b"event: a\r\ndata: one\r\n\r\ndata: two\r\n\r\n"
+        self.assertDecodes(body, [{"event": "a", "data": "one"}, {"event": "message", "data": "two"}])
+
+    def test_bare_cr_line_endings(self):
+        self.assertDecodes(b"data: one\r\rdata: two\r\r", [{"event": "message", "data": "one"}, {"event": "message", "data": "two"}])
+
+    def test_multi_line_data(self):
+        body = b"event: note\ndata: first\ndata: second\n\ndata: {\"a\":1}\n\n"
+        self.assertDecodes(
+            body,
+            [{"event": "note", "data": "first\nsecond"}, {"event": "message", "data": '{"a":1}'}],
+        )
+
+    def test_data_without_space(self):
+        self.assertDecodes(b"event:x\ndata:{\"a\":1}\n\n", [{"event": "x", "data": '{"a":1}'}])
+
+    def test_trailing_event_without_blank_line(self):
+        self.assertDecodes(b"data: one\n\ndata: tail", [{"event": "message", "data": "one"}, {"event": "message", "data": "tail"}])
+        self.assertDecodes(b"data: tail\r", [{"event": "message", "data": "tail"}])
+
+    def test_multibyte_character_split_across_chunks(self):
+        body = "data: wörld ☃ \U0001F600\n\n".encode("utf-8")
+        self.assertDecodes(body, [{"event": "message", "data": "wörld ☃ \U0001F600"}])
+
+    def test_comments_and_events_without_data_are_skipped(self):
+        self.assertDecodes(b": keep-alive\n\nevent: ping\n\nid: 1\ndata: x\n\n", [{"event": "message", "data": "x"}])
+
+    def test_async_batches_match_sync(self):
+        body = "event: a\r\ndata: h€llo\r\n\r\ndata: [DONE]".encode("utf-8")
+
+        async def collect(chunks):
+            async def source():
+                for chunk in chunks:
+                    yield chunk
+
+            return [event async for batch in aiter_sse_event_batches(source()) for event in batch]
+
+        expected = [{"event": "a", "data": "h€llo"}, {"event": "message", "data": "[DONE]"}]
+        for chunks in _splits(body):
+            with self.subTest(chunks=chunks):
+                self.assertEqual(asyncio.run(collect(chunks)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 
 
 def resolve_device(preferred: object | None = None):
@@ -10,9 +11,19 @@ def resolve_device(preferred: object | None = None):
         raise RuntimeError("torch is required for local model runners") from exc
     if isinstance(preferred, torch.device):
         return preferred
-    if _env_bool("AI_KIT_LOCAL_DISABLE_GPU", "INFERENCE_KIT_LOCAL_DISABLE_GPU", False):
-        return torch.device("cpu")
+    disable_gpu = _env_bool("AI_KIT_LOCAL_DISABLE_GPU", "INFERENCE_KIT_LOCAL_DISABLE_GPU", False)
     raw = str(preferred or _env_value("AI_KIT_LOCAL_DEVICE", "INFERENCE_KIT_LOCAL_DEVICE")).strip().lower()
+    return _resolve_cached(raw, disable_gpu)
+
+
+@lru_cache(maxsize=8)
+def _resolve_cached(raw: str, disable_gpu: bool):
+    # Env vars are re-read per call; only the backend probes below, which query
+    # the driver, are memoized.
+    import torch
+
+    if disable_gpu:
+        return torch.device("cpu")
     if raw and raw != "auto":
         return torch.device(raw)
     if torch.backends.mps.is_available():
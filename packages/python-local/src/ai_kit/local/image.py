@@ -29,5 +29,10 @@ def normalize_depth(depth: np.ndarray) -> np.ndarray:
     max_val = float(depth.max())
     if max_val - min_val < 1e-6:
         return np.zeros_like(depth, dtype=np.uint8)
-    scaled = (depth - min_val) / (max_val - min_val)
-    return (scaled * 255).clip(0, 255).astype(np.uint8)
+    # Same arithmetic as ((depth - min) / range * 255).clip(...), but the one
+    # scratch array from the subtraction is reused for every later step.
+    scaled = depth - min_val
+    scaled /= max_val - min_val
+    scaled *= 255
+    np.clip(scaled, 0, 255, out=scaled)
+    return scaled.astype(np.uint8)
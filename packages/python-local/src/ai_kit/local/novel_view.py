@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import inspect
-import os
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union
 
 from PIL import Image
 
+from .pipelines import _trust_remote_code
+
+# PIL image, or a (1, 3, H, W) tensor in [-1, 1] from NovelViewPipeline.preprocess.
+NovelViewImage = Union[Image.Image, Any]
+
 
 @dataclass(frozen=True)
 class NovelViewParams:
@@ -16,13 +20,32 @@ class NovelViewParams:
 
 
 class NovelViewPipeline:
-    def __init__(self, pipe, device_str: str) -> None:
+    def __init__(self, pipe, device_str: str, kind: str | None = None) -> None:
         self._pipe = pipe
         self._device_str = device_str
+        self._kind = kind
+        self._build_batch_kwargs = _BATCH_CALL_KWARGS_BUILDERS.get(kind or "")
+
+    def preprocess(self, image: Image.Image, size: Tuple[int, int] | None = None):
+        """Convert an image once into a device-resident (1, 3, H, W) tensor in [-1, 1].
+
+        The result can be passed to generate()/generate_batch() repeatedly to skip
+        per-call PIL decoding and host-to-device copies.
+        """
+        import numpy as np
+        import torch
+
+        rgb = image.convert("RGB")
+        if size is not None and rgb.size != tuple(size):
+            rgb = rgb.resize(tuple(size), Image.LANCZOS)
+        array = np.array(rgb, dtype=np.uint8)
+        dtype = getattr(self._pipe, "dtype", None) or torch.float32
+        tensor = torch.from_numpy(array).permute(2, 0, 1).unsqueeze(0)
+        return tensor.to(self._device_str, dtype=dtype).div_(127.5).sub_(1.0)
 
     def generate(
         self,
-        image: Image.Image,
+        image: NovelViewImage,
         *,
         azimuth_deg: float,
         elevation_deg: float,
@@ -31,6 +54,77 @@ class NovelViewPipeline:
         guidance_scale: float,
         width: int | None = None,
         height: int | None = None,
+    ) -> Image.Image:
+        return self.generate_batch(
+            image,
+            poses=[(azimuth_deg, elevation_deg)],
+            seed=seed,
+            steps=steps,
+            guidance_scale=guidance_scale,
+            width=width,
+            height=height,
+        )[0]
+
+    def generate_batch(
+        self,
+        image: NovelViewImage,
+        *,
+        poses: Sequence[Tuple[float, float]],
+        seed: int,
+        steps: int,
+        guidance_scale: float,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> List[Image.Image]:
+        """Render one view per (azimuth_deg, elevation_deg) pose.
+
+        Pipelines with a known batched signature render every pose in a single
+        denoising loop; others fall back to one pipeline call per pose.
+        """
+        import torch
+
+        if not poses:
+            return []
+        if self._build_batch_kwargs is None:
+            return [
+                self._generate_single(
+                    image,
+                    azimuth_deg=azimuth_deg,
+                    elevation_deg=elevation_deg,
+                    seed=seed,
+                    steps=steps,
+                    guidance_scale=guidance_scale,
+                    width=width,
+                    height=height,
+                )
+                for azimuth_deg, elevation_deg in poses
+            ]
+        generator = torch.Generator(device="cpu").manual_seed(int(seed))
+        call_kwargs = self._build_batch_kwargs(
+            image=image,
+            poses=poses,
+            steps=steps,
+            guidance_scale=guidance_scale,
+            generator=generator,
+            width=width,
+            height=height,
+        )
+        images = _result_images(self._pipe(**call_kwargs))
+        if len(images) < len(poses):
+            raise RuntimeError("Novel-view pipeline returned fewer images than requested poses")
+        return images[: len(poses)]
+
+    def _generate_single(
+        self,
+        image: NovelViewImage,
+        *,
+        azimuth_deg: float,
+        elevation_deg: float,
+        seed: int,
+        steps: int,
+        guidance_scale: float,
+        width: int | None,
+        height: int | None,
     ) -> Image.Image:
         import torch
 
@@ -47,15 +141,18 @@ class NovelViewPipeline:
             height=height,
             device_str=self._device_str,
         )
-        result = self._pipe(**call_kwargs)
-        images = getattr(result, "images", None)
-        if isinstance(images, list) and images:
-            return images[0]
-        if isinstance(result, list) and result:
-            return result[0]
-        if isinstance(result, Image.Image):
-            return result
-        raise RuntimeError("Novel-view pipeline returned no images")
+        return _result_images(self._pipe(**call_kwargs))[0]
+
+
+def _result_images(result: Any) -> List[Image.Image]:
+    images = getattr(result, "images", None)
+    if isinstance(images, list) and images:
+        return images
+    if isinstance(result, list) and result:
+        return result
+    if isinstance(result, Image.Image):
+        return [result]
+    raise RuntimeError("Novel-view pipeline returned no images")
 
 
 def get_novel_view_pipeline(model: str, device_str: str) -> NovelViewPipeline:
@@ -64,19 +161,12 @@ def get_novel_view_pipeline(model: str, device_str: str) -> NovelViewPipeline:
 
     device = torch.device(device_str)
     dtype = torch.float16 if device.type in {"cuda", "mps"} else torch.float32
-    trust_remote_code = _env_value(
-        "AI_KIT_TRUST_REMOTE_CODE",
-        "INFERENCE_KIT_TRUST_REMOTE_CODE",
-    ).strip().lower() in {
-        "1",
-        "true",
-        "yes",
-        "y",
-    }
+    trust_remote_code = _trust_remote_code()
 
     snapshot_dir = Path(snapshot_download(model))
     zero123_pipeline = snapshot_dir / "clip_camera_projection" / "zero123.py"
     if zero123_pipeline.exists():
+        kind = "zero123"
         _ensure_torch_xpu_stub(torch)
         from diffusers import DiffusionPipeline
 
@@ -89,6 +179,7 @@ def get_novel_view_pipeline(model: str, device_str: str) -> NovelViewPipeline:
             use_safetensors=True,
         )
     else:
+        kind = "zero1to3"
         _ensure_torch_xpu_stub(torch)
         from .zero1to3_pipeline import Zero1to3StableDiffusionPipeline
 
@@ -109,13 +200,13 @@ def get_novel_view_pipeline(model: str, device_str: str) -> NovelViewPipeline:
         pipe.enable_vae_tiling()
     if hasattr(pipe, "set_progress_bar_config"):
         pipe.set_progress_bar_config(disable=True)
-    return NovelViewPipeline(pipe, device_str)
+    return NovelViewPipeline(pipe, device_str, kind=kind)
 
 
 def _build_call_kwargs(
     pipe: Any,
     *,
-    image: Image.Image,
+    image: NovelViewImage,
     azimuth_deg: float,
     elevation_deg: float,
     steps: int,
@@ -179,11 +270,44 @@ def _build_call_kwargs(
     return kwargs
 
 
-def _env_value(primary: str, legacy: str) -> str:
-    value = os.getenv(primary, "")
-    if value:
-        return value
-    return os.getenv(legacy, "")
+def _build_zero1to3_batch_kwargs(
+    *,
+    image: NovelViewImage,
+    poses: Sequence[Tuple[float, float]],
+    steps: int,
+    guidance_scale: float,
+    generator: Any,
+    width: int | None,
+    height: int | None,
+) -> Dict[str, Any]:
+    # Matches Zero1to3StableDiffusionPipeline.__call__; keep in sync with zero1to3_pipeline.py.
+    # The pipeline repeats pose embeddings num_images_per_prompt times, so a pose batch
+    # is expressed as a repeated image batch with one image per prompt.
+    if isinstance(image, Image.Image):
+        images: Any = [image] * len(poses)
+    else:
+        batch = image.unsqueeze(0) if image.ndim == 3 else image
+        images = batch.expand(len(poses), -1, -1, -1)
+    kwargs: Dict[str, Any] = {
+        "input_imgs": images,
+        "prompt_imgs": images,
+        "poses": [[float(elevation_deg), float(azimuth_deg), 0.0] for azimuth_deg, elevation_deg in poses],
+        "num_inference_steps": int(steps),
+        "guidance_scale": float(guidance_scale),
+        "generator": generator,
+        "output_type": "pil",
+        "num_images_per_prompt": 1,
+    }
+    if width is not None:
+        kwargs["width"] = int(width)
+    if height is not None:
+        kwargs["height"] = int(height)
+    return kwargs
+
+
+_BATCH_CALL_KWARGS_BUILDERS = {
+    "zero1to3": _build_zero1to3_batch_kwargs,
+}
 
 
 def _ensure_torch_xpu_stub(torch_module) -> None:
@@ -19,16 +19,7 @@ def _get_pipeline_cached(task: str, model: str, device_str: str):
 
     from transformers import pipeline as hf_pipeline
 
-    trust_remote_code = _env_value(
-        "AI_KIT_TRUST_REMOTE_CODE",
-        "INFERENCE_KIT_TRUST_REMOTE_CODE",
-    ).strip().lower() in {
-        "1",
-        "true",
-        "yes",
-        "y",
-    }
-    pipe = hf_pipeline(task, model=model, trust_remote_code=trust_remote_code)
+    pipe = hf_pipeline(task, model=model, trust_remote_code=_trust_remote_code())
     _move_pipeline_to_device(pipe, device_str)
     return pipe
 
@@ -43,6 +34,19 @@ def _move_pipeline_to_device(pipe, device_str: str) -> None:
         pipe.device = device
 
 
+@lru_cache(maxsize=None)
+def _trust_remote_code() -> bool:
+    return _env_value(
+        "AI_KIT_TRUST_REMOTE_CODE",
+        "INFERENCE_KIT_TRUST_REMOTE_CODE",
+    ).strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "y",
+    }
+
+
 def _env_value(primary: str, legacy: str) -> str:
     value = os.getenv(primary, "")
     if value:
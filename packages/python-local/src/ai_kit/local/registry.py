@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LocalModelSpec:
     task: str
     id: str
@@ -26,6 +27,9 @@ class LocalModelRegistry:
         default: bool = False,
         replace: bool = False,
     ) -> LocalModelSpec:
+        task = sys.intern(task)
+        model_id = sys.intern(model_id)
+        hf_repo = sys.intern(hf_repo)
         task_models = self._models.setdefault(task, {})
         if model_id in task_models and not replace:
             raise ValueError(f"Model '{model_id}' already registered for task '{task}'")
@@ -35,6 +39,14 @@ class LocalModelRegistry:
             self._defaults[task] = model_id
         return spec
 
+    def register_many(
+        self, specs: Iterable[LocalModelSpec], *, replace: bool = False
+    ) -> List[LocalModelSpec]:
+        return [
+            self.register(spec.task, spec.id, spec.hf_repo, default=spec.default, replace=replace)
+            for spec in specs
+        ]
+
     def resolve(self, task: str, model_id: Optional[str]) -> LocalModelSpec:
         task_models = self._models.get(task, {})
         if model_id:
@@ -1,4 +1,5 @@
 from importlib import import_module
+from importlib.util import find_spec
 from pkgutil import extend_path
 
 from .allowlists import list_task_models, list_transcribe_models
@@ -95,14 +96,40 @@ def _optional(module_path: str, names: list[str]) -> None:
             __all__.append(name)
 
 
+_lazy_exports: dict[str, str] = {}
+
+
+def _lazy(module_path: str, names: list[str]) -> None:
+    # Like _optional, but defers the import until one of the names is accessed.
+    try:
+        spec = find_spec(module_path, __name__)
+    except Exception:
+        return
+    if spec is None:
+        return
+    for name in names:
+        _lazy_exports[name] = module_path
+        __all__.append(name)
+
+
+def __getattr__(name: str):
+    module_path = _lazy_exports.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
 _optional(".hub", ["Kit", "KitConfig"])
 _optional(".router", ["ModelRouter"])
 _optional(".kit_cache", ["get_cached_kit", "list_provider_models"])
-_optional(
+_lazy(
     ".providers",
     [
         "OpenAIAdapter",
         "OpenAIConfig",
+        "AsyncOpenAIAdapter",
         "AnthropicAdapter",
         "AnthropicConfig",
         "GeminiAdapter",
@@ -119,7 +146,7 @@ _optional(
         "FalConfig",
     ],
 )
-_optional(".http_asgi", ["create_asgi_app"])
+_optional(".http_asgi", ["create_asgi_app", "serve"])
 _optional(
     ".testing",
     [
@@ -16,7 +16,7 @@ class ErrorKind(str, Enum):
     TIMEOUT = "timeout"
 
 
-@dataclass
+@dataclass(slots=True)
 class KitErrorPayload:
     kind: ErrorKind
     message: str
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
-import json
-from dataclasses import replace
+import sys
+import threading
+import time
+from dataclasses import fields, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
+from .jsonlib import loads
 from .types import CostBreakdown, ModelCapabilities, ModelMetadata, Provider, TokenPrices, Usage
 
 _scraped_cache: Optional[List[Dict[str, Any]]] = None
+# provider -> exact id -> entry, and provider -> prefix trie over entry ids.
+_scraped_index: Optional[Tuple[Dict[str, Dict[str, "_CuratedEntry"]], Dict[str, "_PrefixTrie"]]] = None
+# (path, mtime_ns) of every catalog file behind _scraped_cache, and when they were last checked.
+_scraped_stamp: Tuple[Tuple[str, int], ...] = ()
+_scraped_checked_at = 0.0
+_scraped_lock = threading.Lock()
+_SCRAPED_RECHECK_SECONDS = 30.0
 
 
 def _shared_models_dir() -> Path:
@@ -19,10 +30,15 @@ def _local_models_dir() -> Path:
     return Path(__file__).with_name("models")
 
 
-def _load_scraped_from_dir(base_dir: Path) -> List[Dict[str, Any]]:
+def _read_json_file(path: Path) -> Any:
+    # Raw bytes straight to orjson, skipping the str decode.
+    return loads(path.read_bytes())
+
+
+def _scraped_sources(base_dir: Path) -> List[Tuple[str, Path]]:
     if not base_dir.exists() or not base_dir.is_dir():
         return []
-    models: List[Dict[str, Any]] = []
+    sources: List[Tuple[str, Path]] = []
     for item in base_dir.iterdir():
         if item.is_dir():
             path = item / "scraped_models.json"
@@ -34,31 +50,196 @@ def _load_scraped_from_dir(base_dir: Path) -> List[Dict[str, Any]]:
             continue
         if not path.exists():
             continue
-        try:
-            raw = path.read_text(encoding="utf-8")
-            data = json.loads(raw)
-        except Exception:
-            continue
-        if not isinstance(data, list):
-            continue
-        for entry in data:
-            if not isinstance(entry, dict):
-                continue
-            if "provider" not in entry:
-                entry = {**entry, "provider": provider}
-            models.append(entry)
+        sources.append((provider, path))
+    return sources
+
+
+def _load_scraped_file(source: Tuple[str, Path]) -> List[Dict[str, Any]]:
+    provider, path = source
+    try:
+        data = _read_json_file(path)
+    except Exception:
+        return []
+    if not isinstance(data, list):
+        return []
+    models = [entry for entry in data if isinstance(entry, dict)]
+    # Entries were just decoded and are not shared yet, so tag them in place.
+    for entry in models:
+        entry.setdefault("provider", provider)
     return models
 
 
+def _load_scraped_sources(sources: List[Tuple[str, Path]]) -> List[Dict[str, Any]]:
+    return [entry for source in sources for entry in _load_scraped_file(source)]
+
+
+def _sources_stamp(sources: List[Tuple[str, Path]]) -> Tuple[Tuple[str, int], ...]:
+    stamp = []
+    for _, path in sources:
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            mtime = -1
+        stamp.append((str(path), mtime))
+    return tuple(stamp)
+
+
 def load_scraped_models() -> List[Dict[str, Any]]:
-    global _scraped_cache
-    if _scraped_cache is not None:
+    """Scraped catalog rows, reparsed only when the catalog files change.
+
+    The source files are re-listed and stat'ed at most once per
+    _SCRAPED_RECHECK_SECONDS; in between, the cached rows are returned as is.
+    """
+    global _scraped_cache, _scraped_index, _scraped_stamp, _scraped_checked_at
+    cache = _scraped_cache
+    if cache is not None and time.monotonic() - _scraped_checked_at < _SCRAPED_RECHECK_SECONDS:
+        return cache
+    with _scraped_lock:
+        if _scraped_cache is not None and time.monotonic() - _scraped_checked_at < _SCRAPED_RECHECK_SECONDS:
+            return _scraped_cache
+        sources: List[Tuple[str, Path]] = []
+        for base_dir in (_shared_models_dir(), _local_models_dir()):
+            sources.extend(_scraped_sources(base_dir))
+        stamp = _sources_stamp(sources)
+        _scraped_checked_at = time.monotonic()
+        if _scraped_cache is not None and stamp == _scraped_stamp:
+            return _scraped_cache
+        _scraped_cache = _load_scraped_sources(sources)
+        _scraped_stamp = stamp
+        _scraped_index = None
+        _find_curated_entry.cache_clear()
         return _scraped_cache
-    models: List[Dict[str, Any]] = []
-    for base_dir in (_shared_models_dir(), _local_models_dir()):
-        models.extend(_load_scraped_from_dir(base_dir))
-    _scraped_cache = models
-    return _scraped_cache
+
+
+_CAPABILITY_FIELDS = tuple(field.name for field in fields(ModelCapabilities))
+_METADATA_FIELDS = tuple(field.name for field in fields(ModelMetadata))
+
+
+class _CuratedEntry(NamedTuple):
+    """Scraped catalog entry with its metadata overrides parsed once at load time."""
+
+    id: str
+    provider: str
+    # ModelMetadata fields the catalog fully determines, applied over each discovered model.
+    overrides: Dict[str, Any]
+    # Known capability keys present in the catalog, coerced to bool.
+    capabilities: Optional[Dict[str, bool]]
+    tokenPrices: Optional[TokenPrices]
+    # Raw tokenPrices dict; missing keys fall back to the discovered model's prices.
+    tokenPriceOverrides: Optional[Dict[str, Any]]
+    # USD per million tokens with missing rates as 0.0; both zero means estimate_cost bails out.
+    inputRate: float
+    outputRate: float
+    audioPerMinute: Optional[float]
+    raw: Dict[str, Any]
+
+
+def _parse_curated_entry(provider: str, entry_id: str, raw: Dict[str, Any]) -> _CuratedEntry:
+    overrides: Dict[str, Any] = {}
+    for key in ("displayName", "family"):
+        if raw.get(key):
+            overrides[key] = raw[key]
+    if isinstance(raw.get("contextWindow"), int):
+        overrides["contextWindow"] = raw["contextWindow"]
+    if isinstance(raw.get("videoPrices"), dict):
+        overrides["videoPrices"] = raw["videoPrices"]
+    for key in ("deprecated", "inPreview"):
+        if key in raw:
+            overrides[key] = bool(raw[key])
+    caps = raw.get("capabilities")
+    prices = raw.get("tokenPrices")
+    capabilities = (
+        {key: bool(caps[key]) for key in _CAPABILITY_FIELDS if key in caps} if isinstance(caps, dict) else None
+    )
+    token_prices = (
+        TokenPrices(input=prices.get("input"), output=prices.get("output")) if isinstance(prices, dict) else None
+    )
+    price_overrides = prices if isinstance(prices, dict) else None
+    # When the catalog spells out every field, nothing is left to merge from the
+    # discovered model: build the instance once and share it like any override.
+    if capabilities is not None and len(capabilities) == len(_CAPABILITY_FIELDS):
+        overrides["capabilities"] = ModelCapabilities(**capabilities)
+        capabilities = None
+    if price_overrides is not None and "input" in price_overrides and "output" in price_overrides:
+        overrides["tokenPrices"] = token_prices
+        price_overrides = None
+    return _CuratedEntry(
+        id=entry_id,
+        provider=provider,
+        overrides=overrides,
+        capabilities=capabilities,
+        tokenPrices=token_prices,
+        tokenPriceOverrides=price_overrides,
+        inputRate=(prices.get("input") or 0.0) if isinstance(prices, dict) else 0.0,
+        outputRate=(prices.get("output") or 0.0) if isinstance(prices, dict) else 0.0,
+        audioPerMinute=_audio_price_per_minute(raw),
+        raw=raw,
+    )
+
+
+class _PrefixTrie:
+    """Character trie resolving the longest catalog id that prefixes a model id."""
+
+    __slots__ = ("children", "entry")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _PrefixTrie] = {}
+        self.entry: Optional[_CuratedEntry] = None
+
+    def insert(self, key: str, entry: _CuratedEntry) -> None:
+        node = self
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _PrefixTrie()
+            node = child
+        # First catalog entry wins for duplicate ids, as with the exact-id index.
+        if node.entry is None:
+            node.entry = entry
+
+    def longest_prefix(self, key: str) -> Optional[_CuratedEntry]:
+        node = self
+        best = node.entry
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                break
+            if node.entry is not None:
+                best = node.entry
+        return best
+
+
+def _curated_index() -> Tuple[Dict[str, Dict[str, _CuratedEntry]], Dict[str, _PrefixTrie]]:
+    load_scraped_models()
+    index = _scraped_index
+    if index is not None:
+        return index
+    with _scraped_lock:
+        # Re-check under the lock so concurrent first lookups build the index once.
+        if _scraped_index is None:
+            _publish_curated_index(_scraped_cache or [])
+        return _scraped_index
+
+
+def _publish_curated_index(models: List[Dict[str, Any]]) -> None:
+    global _scraped_index
+    by_id: Dict[str, Dict[str, _CuratedEntry]] = {}
+    by_prefix: Dict[str, _PrefixTrie] = {}
+    for raw in models:
+        provider = raw.get("provider")
+        entry_id = raw.get("id") or ""
+        if not isinstance(provider, str) or not isinstance(entry_id, str):
+            continue
+        # A handful of provider names label every row; share one string object for each.
+        provider = raw["provider"] = sys.intern(provider)
+        entry = _parse_curated_entry(provider, entry_id, raw)
+        by_id.setdefault(provider, {}).setdefault(entry_id, entry)
+        trie = by_prefix.get(provider)
+        if trie is None:
+            trie = by_prefix[provider] = _PrefixTrie()
+        trie.insert(entry_id, entry)
+    # Fully built before this single assignment, so lock-free readers never see a partial index.
+    _scraped_index = (by_id, by_prefix)
 
 
 def load_curated_models() -> List[Dict[str, Any]]:
@@ -66,6 +247,17 @@ def load_curated_models() -> List[Dict[str, Any]]:
     return load_scraped_models()
 
 
+def _clear_pricing_caches() -> None:
+    global _scraped_cache, _scraped_index, _scraped_stamp, _scraped_checked_at
+    _scraped_cache = None
+    _scraped_index = None
+    _scraped_stamp = ()
+    _scraped_checked_at = 0.0
+    _normalize_model_id.cache_clear()
+    _find_curated_entry.cache_clear()
+
+
+@lru_cache(maxsize=2048)
 def _normalize_model_id(provider: Provider, model_id: str) -> str:
     prefix = f"{provider}/"
     if model_id.startswith(prefix):
@@ -73,73 +265,95 @@ def _normalize_model_id(provider: Provider, model_id: str) -> str:
     return model_id
 
 
-def find_curated_model(provider: Provider, model_id: str) -> Optional[Dict[str, Any]]:
+def _lookup_curated_entry(provider: Provider, model_id: str) -> Optional[_CuratedEntry]:
+    # Memoized lookups never touch the catalog, so give it a chance to notice
+    # file changes (and clear the memo) first; this is a clock read between rechecks.
+    load_scraped_models()
+    return _find_curated_entry(provider, model_id)
+
+
+@lru_cache(maxsize=2048)
+def _find_curated_entry(provider: Provider, model_id: str) -> Optional[_CuratedEntry]:
     normalized = _normalize_model_id(provider, model_id)
-    best: Optional[Dict[str, Any]] = None
-    for entry in load_scraped_models():
-        if entry.get("provider") != provider:
-            continue
-        entry_id = entry.get("id") or ""
-        if entry_id == normalized:
-            return entry
-        if normalized.startswith(entry_id) and (not best or len(entry_id) > len(best.get("id") or "")):
-            best = entry
-    return best
+    by_id, by_prefix = _curated_index()
+    entry = by_id.get(provider, {}).get(normalized)
+    if entry is not None:
+        return entry
+    trie = by_prefix.get(provider)
+    return trie.longest_prefix(normalized) if trie is not None else None
+
+
+def find_curated_model(provider: Provider, model_id: str) -> Optional[Dict[str, Any]]:
+    entry = _lookup_curated_entry(provider, model_id)
+    return entry.raw if entry is not None else None
 
 
 def apply_curated_metadata(model: ModelMetadata) -> ModelMetadata:
-    curated = find_curated_model(model.provider, model.id)
-    if not curated:
+    return _apply_curated_entry(model, _lookup_curated_entry(model.provider, model.id))
+
+
+def apply_curated_metadata_batch(models: Iterable[ModelMetadata]) -> List[ModelMetadata]:
+    # One lookup per distinct (provider, id) per refresh; large catalogs would
+    # otherwise churn the shared _find_curated_entry LRU.
+    resolved: Dict[Tuple[str, str], Optional[_CuratedEntry]] = {}
+    updated: List[ModelMetadata] = []
+    for model in models:
+        key = (model.provider, model.id)
+        if key in resolved:
+            curated = resolved[key]
+        else:
+            curated = resolved[key] = _find_curated_entry.__wrapped__(model.provider, model.id)
+        updated.append(_apply_curated_entry(model, curated))
+    return updated
+
+
+def _apply_curated_entry(model: ModelMetadata, curated: Optional[_CuratedEntry]) -> ModelMetadata:
+    if curated is None:
         return model
-    capabilities = model.capabilities
-    curated_caps = curated.get("capabilities")
-    if isinstance(curated_caps, dict):
-        capabilities = ModelCapabilities(
-            text=bool(curated_caps.get("text", capabilities.text)),
-            vision=bool(curated_caps.get("vision", capabilities.vision)),
-            image=bool(curated_caps.get("image", getattr(capabilities, "image", False))),
-            tool_use=bool(curated_caps.get("tool_use", capabilities.tool_use)),
-            structured_output=bool(curated_caps.get("structured_output", capabilities.structured_output)),
-            reasoning=bool(curated_caps.get("reasoning", capabilities.reasoning)),
-            audio_in=bool(curated_caps.get("audio_in", getattr(capabilities, "audio_in", False))),
-            audio_out=bool(curated_caps.get("audio_out", getattr(capabilities, "audio_out", False))),
-            video=bool(curated_caps.get("video", getattr(capabilities, "video", False))),
-            video_in=bool(curated_caps.get("video_in", getattr(capabilities, "video_in", False))),
+    updates = {"deprecated": bool(model.deprecated), "inPreview": bool(model.inPreview), **curated.overrides}
+    caps = curated.capabilities
+    if caps is not None:
+        capabilities = model.capabilities
+        updates["capabilities"] = ModelCapabilities(
+            **{key: caps[key] if key in caps else bool(getattr(capabilities, key)) for key in _CAPABILITY_FIELDS}
         )
-    token_prices = model.tokenPrices
-    curated_prices = curated.get("tokenPrices")
-    if isinstance(curated_prices, dict):
-        token_prices = TokenPrices(
-            input=curated_prices.get("input", token_prices.input if token_prices else None),
-            output=curated_prices.get("output", token_prices.output if token_prices else None),
+    price_overrides = curated.tokenPriceOverrides
+    if price_overrides is not None:
+        token_prices = model.tokenPrices
+        updates["tokenPrices"] = TokenPrices(
+            input=price_overrides.get("input", token_prices.input if token_prices else None),
+            output=price_overrides.get("output", token_prices.output if token_prices else None),
         )
-    video_prices = curated.get("videoPrices")
-    if not isinstance(video_prices, dict):
-        video_prices = model.videoPrices
-    context_window = curated.get("contextWindow")
-    if not isinstance(context_window, int):
-        context_window = model.contextWindow
-    return replace(
-        model,
-        displayName=curated.get("displayName") or model.displayName,
-        family=curated.get("family") or model.family,
-        capabilities=capabilities,
-        contextWindow=context_window,
-        tokenPrices=token_prices,
-        videoPrices=video_prices,
-        deprecated=bool(curated.get("deprecated", model.deprecated)),
-        inPreview=bool(curated.get("inPreview", model.inPreview)),
-    )
+    for name, value in updates.items():
+        if getattr(model, name) != value:
+            break
+    else:
+        # Discovered model already matches the catalog (the steady state): keep it.
+        return model
+    # Prebuilt override objects live in the process-wide index and are mutable;
+    # each model gets its own copy.
+    shared = curated.overrides
+    if "capabilities" in shared:
+        updates["capabilities"] = replace(shared["capabilities"])
+    if "tokenPrices" in shared:
+        updates["tokenPrices"] = replace(shared["tokenPrices"])
+    if "videoPrices" in shared:
+        updates["videoPrices"] = dict(shared["videoPrices"])
+    # ModelMetadata has no __post_init__ or validation, so fill the slots directly
+    # instead of paying for dataclasses.replace re-running __init__ per model.
+    updated = object.__new__(type(model))
+    for name in _METADATA_FIELDS:
+        setattr(updated, name, updates[name] if name in updates else getattr(model, name))
+    return updated
 
 
 def lookup_token_prices(provider: Provider, model_id: str) -> Optional[TokenPrices]:
-    curated = find_curated_model(provider, model_id)
-    if not curated:
+    curated = _lookup_curated_entry(provider, model_id)
+    if curated is None or curated.tokenPrices is None:
         return None
-    prices = curated.get("tokenPrices")
-    if not isinstance(prices, dict):
-        return None
-    return TokenPrices(input=prices.get("input"), output=prices.get("output"))
+    # Copy so callers can't mutate the memoized catalog entry.
+    return replace(curated.tokenPrices)
+
 
 def _coerce_float(value: Any) -> Optional[float]:
     if isinstance(value, (int, float)):
@@ -152,13 +366,23 @@ def _coerce_float(value: Any) -> Optional[float]:
     return None
 
 
+_AUDIO_PRICE_KEYS = ("audioPrices", "transcribePrices", "audio_prices")
+_PER_MINUTE_KEYS = ("perMinute", "per_minute", "perMinuteUsd")
+_PER_SECOND_KEYS = ("perSecond", "per_second", "perSecondUsd")
+
+
+def _first_truthy(raw: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    return next((value for value in map(raw.get, keys) if value), None)
+
+
 def _audio_price_per_minute(curated: Dict[str, Any]) -> Optional[float]:
-    raw = curated.get("audioPrices") or curated.get("transcribePrices") or curated.get("audio_prices")
+    # Evaluated once per catalog entry in _parse_curated_entry.
+    raw = _first_truthy(curated, _AUDIO_PRICE_KEYS)
     if isinstance(raw, dict):
-        per_minute = _coerce_float(raw.get("perMinute") or raw.get("per_minute") or raw.get("perMinuteUsd"))
+        per_minute = _coerce_float(_first_truthy(raw, _PER_MINUTE_KEYS))
         if per_minute is not None:
             return per_minute
-        per_second = _coerce_float(raw.get("perSecond") or raw.get("per_second") or raw.get("perSecondUsd"))
+        per_second = _coerce_float(_first_truthy(raw, _PER_SECOND_KEYS))
         if per_second is not None:
             return per_second * 60.0
         return None
@@ -170,22 +394,19 @@ def estimate_cost(provider: Provider, model_id: str, usage: Optional[Usage]) ->
         return None
     if usage.inputTokens is None and usage.outputTokens is None:
         return None
-    pricing = lookup_token_prices(provider, model_id)
-    if pricing is None:
+    curated = _lookup_curated_entry(provider, model_id)
+    if curated is None or not (curated.inputRate or curated.outputRate):
         return None
-    input_rate = pricing.input or 0.0
-    output_rate = pricing.output or 0.0
-    if input_rate == 0 and output_rate == 0:
-        return None
-    input_tokens = usage.inputTokens or 0
-    output_tokens = usage.outputTokens or 0
-    input_cost = input_tokens * input_rate / 1_000_000
-    output_cost = output_tokens * output_rate / 1_000_000
+    # Rates are per million tokens, so tokens * rate is already in micro-USD;
+    # quantize to whole micro-USD once (half up, like Math.round in the Node kit)
+    # and derive every field from the integers.
+    input_micros = int((usage.inputTokens or 0) * curated.inputRate + 0.5)
+    output_micros = int((usage.outputTokens or 0) * curated.outputRate + 0.5)
     return CostBreakdown(
-        input_cost_usd=round(input_cost, 6),
-        output_cost_usd=round(output_cost, 6),
-        total_cost_usd=round(input_cost + output_cost, 6),
-        pricing_per_million=pricing,
+        input_cost_usd=input_micros / 1_000_000,
+        output_cost_usd=output_micros / 1_000_000,
+        total_cost_usd=(input_micros + output_micros) / 1_000_000,
+        pricing_per_million=replace(curated.tokenPrices) if curated.tokenPrices is not None else None,
     )
 
 
@@ -202,10 +423,10 @@ def estimate_transcribe_cost(
         return None
     if duration_value <= 0:
         return None
-    curated = find_curated_model(provider, model_id)
-    if not curated:
+    curated = _lookup_curated_entry(provider, model_id)
+    if curated is None:
         return None
-    rate_per_minute = _audio_price_per_minute(curated)
+    rate_per_minute = curated.audioPerMinute
     if rate_per_minute is None or rate_per_minute <= 0:
         return None
     total = round((duration_value / 60.0) * rate_per_minute, 6)
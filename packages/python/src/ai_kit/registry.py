@@ -1,15 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
-from typing import Dict, Iterable, List, Optional, Tuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from .entitlements import fingerprint_api_key
 from .errors import ErrorKind, KitErrorPayload, AiKitError
-from .pricing import apply_curated_metadata
+from .jsonlib import dumps, loads
+from .pricing import apply_curated_metadata_batch
 from .types import (
     EntitlementContext,
     ModelAvailability,
+    ModelCapabilities,
     ModelFeatures,
     ModelLimits,
     ModelMetadata,
@@ -17,8 +27,14 @@ from .types import (
     ModelPricing,
     ModelRecord,
     Provider,
+    TokenPrices,
+    to_json_bytes,
 )
 
+_MAX_FETCH_WORKERS = 8
+_LEARNED_SWEEP_EVERY = 256
+_MODELS_JSON_MAX_KEYS = 64
+
 
 @dataclass
 class CacheEntry:
@@ -34,13 +50,23 @@ class ModelRegistry:
         ttl_seconds: int = 1800,
         learned_ttl_seconds: int = 1200,
         adapter_factory=None,
+        disk_cache_dir: Optional[str] = None,
+        disk_cache_ttl_seconds: int = 86400,
     ) -> None:
         self._adapters = adapters
         self._adapter_factory = adapter_factory
         self._ttl_seconds = ttl_seconds
         self._learned_ttl_seconds = learned_ttl_seconds
+        cache_dir = disk_cache_dir or os.getenv("AI_KIT_MODEL_CACHE_DIR")
+        self._disk_cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self._disk_cache_ttl_seconds = disk_cache_ttl_seconds
+        # Copy-on-write: readers use whatever dict is currently published without
+        # locking; writers build a new dict under _write_lock and rebind it.
         self._cache: Dict[str, CacheEntry] = {}
         self._learned: Dict[str, Tuple[float, str]] = {}
+        self._learn_writes = 0
+        self._models_json: Dict[tuple, Tuple[Tuple[CacheEntry, ...], bytes]] = {}
+        self._write_lock = threading.Lock()
 
     def list_models(
         self,
@@ -54,6 +80,46 @@ class ModelRegistry:
             models.extend(entry.data)
         return sorted(models, key=lambda m: (m.provider, m.displayName))
 
+    def list_models_json(
+        self,
+        providers: Optional[List[Provider]] = None,
+        refresh: bool = False,
+        entitlement: Optional[EntitlementContext] = None,
+    ) -> bytes:
+        """list_models() serialized to JSON bytes.
+
+        The bytes are reused until one of the underlying cache entries is
+        replaced (refresh, TTL expiry, a different key), so repeated polls skip
+        both the sort and the serialization.
+        """
+        entries = self._entries_for_providers(providers, refresh, entitlement)
+        key = (tuple(entries), entitlement.apiKeyFingerprint if entitlement else None)
+        snapshot = tuple(entries.values())
+        cached = self._models_json.get(key)
+        if cached is not None and len(cached[0]) == len(snapshot):
+            if all(old is new for old, new in zip(cached[0], snapshot)):
+                return cached[1]
+        models = [model for entry in snapshot for model in entry.data]
+        body = to_json_bytes(sorted(models, key=lambda m: (m.provider, m.displayName)))
+        with self._write_lock:
+            memo = {} if len(self._models_json) >= _MODELS_JSON_MAX_KEYS else dict(self._models_json)
+            memo[key] = (snapshot, body)
+            self._models_json = memo
+        return body
+
+    async def alist_models(
+        self,
+        providers: Optional[List[Provider]] = None,
+        refresh: bool = False,
+        entitlement: Optional[EntitlementContext] = None,
+    ) -> List[ModelMetadata]:
+        resolved = self._require_providers(providers, entitlement)
+        entries = await asyncio.gather(
+            *(self._afor_provider(provider, refresh, entitlement) for provider in resolved)
+        )
+        models = [model for entry in entries for model in entry.data]
+        return sorted(models, key=lambda m: (m.provider, m.displayName))
+
     def list_model_records(
         self,
         providers: Optional[List[Provider]] = None,
@@ -62,11 +128,10 @@ class ModelRegistry:
     ) -> List[ModelRecord]:
         entries = self._entries_for_providers(providers, refresh, entitlement)
         records: List[ModelRecord] = []
+        to_record = self._to_record
         for provider, entry in entries.items():
-            for model in entry.data:
-                records.append(
-                    self._to_record(model, provider, entry.fetched_at, entitlement)
-                )
+            last_verified_at = _to_iso(entry.fetched_at)
+            records.extend(to_record(model, provider, last_verified_at, entitlement) for model in entry.data)
         return sorted(records, key=lambda r: (r.provider, r.displayName or ""))
 
     def learn_model_unavailable(
@@ -80,10 +145,15 @@ class ModelRegistry:
         if not reason:
             return
         key = self._learned_key(provider, entitlement, model_id)
-        self._learned[key] = (
-            _now_timestamp() + self._learned_ttl_seconds,
-            reason,
-        )
+        now = _now_timestamp()
+        with self._write_lock:
+            learned = {**self._learned, key: (now + self._learned_ttl_seconds, reason)}
+            self._learn_writes += 1
+            if self._learn_writes % _LEARNED_SWEEP_EVERY == 0:
+                # Entries are only expired when looked up again; drop the ones
+                # for models nobody asks about any more.
+                learned = {k: v for k, v in learned.items() if v[0] >= now}
+            self._learned = learned
 
     def _entries_for_providers(
         self,
@@ -91,6 +161,34 @@ class ModelRegistry:
         refresh: bool,
         entitlement: Optional[EntitlementContext],
     ) -> Dict[Provider, CacheEntry]:
+        resolved = self._require_providers(providers, entitlement)
+        cached: Dict[Provider, CacheEntry] = {}
+        misses: List[Tuple[Provider, str]] = []
+        now = _now_timestamp()
+        for provider in resolved:
+            key = self._cache_key(provider, entitlement)
+            entry = None if refresh else self._fresh_entry(key, now)
+            if entry:
+                cached[provider] = entry
+            else:
+                misses.append((provider, key))
+        if len(misses) > 1:
+            # Each miss is a blocking list_models round trip to a different provider.
+            with ThreadPoolExecutor(max_workers=min(len(misses), _MAX_FETCH_WORKERS)) as pool:
+                fetched = list(pool.map(lambda miss: self._fetch_or_fallback(miss[0], entitlement, miss[1]), misses))
+        else:
+            fetched = [self._fetch_or_fallback(provider, entitlement, key) for provider, key in misses]
+        fetched_by_provider = {provider: entry for (provider, _), entry in zip(misses, fetched)}
+        return {
+            provider: cached[provider] if provider in cached else fetched_by_provider[provider]
+            for provider in resolved
+        }
+
+    def _require_providers(
+        self,
+        providers: Optional[List[Provider]],
+        entitlement: Optional[EntitlementContext],
+    ) -> List[Provider]:
         resolved = self._resolve_providers(providers, entitlement)
         if not resolved:
             raise AiKitError(
@@ -99,10 +197,7 @@ class ModelRegistry:
                     message="No providers configured",
                 )
             )
-        results: Dict[Provider, CacheEntry] = {}
-        for provider in resolved:
-            results[provider] = self._for_provider(provider, refresh, entitlement)
-        return results
+        return resolved
 
     def _resolve_providers(
         self,
@@ -115,7 +210,22 @@ class ModelRegistry:
             return [entitlement.provider]
         return list(self._adapters.keys())
 
-    def _for_provider(
+    def _fetch_or_fallback(
+        self,
+        provider: Provider,
+        entitlement: Optional[EntitlementContext],
+        key: str,
+    ) -> CacheEntry:
+        # Callers have already checked the fresh cache for this key.
+        try:
+            return self._fetch_and_cache(provider, entitlement, key)
+        except Exception as err:
+            fallback = self._fallback_entry(key)
+            if fallback:
+                return fallback
+            raise err
+
+    async def _afor_provider(
         self,
         provider: Provider,
         refresh: bool,
@@ -123,24 +233,44 @@ class ModelRegistry:
     ) -> CacheEntry:
         key = self._cache_key(provider, entitlement)
         if not refresh:
+            now = _now_timestamp()
             cached = self._cache.get(key)
-            if cached and cached.expires_at > _now_timestamp():
+            if cached and cached.expires_at > now:
+                return cached
+            cached = await self._off_loop(self._fresh_entry, key, now)
+            if cached:
                 return cached
         try:
-            entry = self._fetch_and_cache(provider, entitlement, key)
-            return entry
+            adapter = self._require_adapter(provider, entitlement)
+            alist_models = getattr(adapter, "alist_models", None)
+            if alist_models is not None:
+                models = await alist_models()
+            else:
+                # Sync adapters run in worker threads so providers still overlap.
+                models = await asyncio.to_thread(adapter.list_models)
+            return await self._off_loop(self._store, key, models)
         except Exception as err:
-            cached = self._cache.get(key)
-            if cached and cached.expires_at > _now_timestamp():
-                return cached
+            fallback = await self._off_loop(self._fallback_entry, key)
+            if fallback:
+                return fallback
             raise err
 
+    async def _off_loop(self, func: Callable[..., Any], *args: Any) -> Any:
+        # Only the disk cache blocks; without one, stay on the event loop.
+        if self._disk_cache_dir is None:
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
     def _fetch_and_cache(
         self,
         provider: Provider,
         entitlement: Optional[EntitlementContext],
         key: str,
     ) -> CacheEntry:
+        adapter = self._require_adapter(provider, entitlement)
+        return self._store(key, adapter.list_models())
+
+    def _require_adapter(self, provider: Provider, entitlement: Optional[EntitlementContext]):
         adapter = self._adapter_for(provider, entitlement)
         if not adapter:
             raise AiKitError(
@@ -149,36 +279,105 @@ class ModelRegistry:
                     message=f"Provider {provider} is not configured",
                 )
             )
-        models = adapter.list_models()
-        models = [apply_curated_metadata(model) for model in models]
+        return adapter
+
+    def _store(self, key: str, models: List[ModelMetadata]) -> CacheEntry:
+        models = apply_curated_metadata_batch(models)
         now = _now_timestamp()
         entry = CacheEntry(
             data=models,
             fetched_at=now,
             expires_at=now + self._ttl_seconds,
         )
-        self._cache[key] = entry
+        self._publish(key, entry)
+        self._write_disk_entry(key, entry)
         return entry
 
+    def _fresh_entry(self, key: str, now: float) -> Optional[CacheEntry]:
+        cached = self._cache.get(key)
+        if cached and cached.expires_at > now:
+            return cached
+        disk_entry = self._read_disk_entry(key)
+        if disk_entry is None or disk_entry.fetched_at + self._disk_cache_ttl_seconds <= now:
+            return None
+        disk_entry.expires_at = min(disk_entry.fetched_at + self._disk_cache_ttl_seconds, now + self._ttl_seconds)
+        self._publish(key, disk_entry)
+        return disk_entry
+
+    def _publish(self, key: str, entry: CacheEntry) -> None:
+        with self._write_lock:
+            replaced = self._cache.get(key)
+            self._cache = {**self._cache, key: entry}
+            if replaced is not None and self._models_json:
+                # Bodies serialized from the replaced entry can never be served again.
+                self._models_json = {
+                    memo_key: memo
+                    for memo_key, memo in self._models_json.items()
+                    if not any(old is replaced for old in memo[0])
+                }
+
+    def _fallback_entry(self, key: str) -> Optional[CacheEntry]:
+        # Stale-while-revalidate: an unexpired memory entry first, then the disk
+        # snapshot regardless of age, so a failed refresh still lists models.
+        cached = self._cache.get(key)
+        if cached and cached.expires_at > _now_timestamp():
+            return cached
+        return self._read_disk_entry(key)
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        if self._disk_cache_dir is None:
+            return None
+        # Name files from the digest alone; the key embeds caller-supplied strings.
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return self._disk_cache_dir / f"models_{digest}.json"
+
+    def _read_disk_entry(self, key: str) -> Optional[CacheEntry]:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            payload = loads(path.read_bytes())
+            fetched_at = float(payload["fetched_at"])
+            models = [_metadata_from_dict(item) for item in payload["models"]]
+        except Exception:
+            return None
+        return CacheEntry(data=models, fetched_at=fetched_at, expires_at=fetched_at)
+
+    def _write_disk_entry(self, key: str, entry: CacheEntry) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        temp_name: Optional[str] = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            body = dumps({"fetched_at": entry.fetched_at, "models": [asdict(model) for model in entry.data]})
+            with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, delete=False) as handle:
+                temp_name = handle.name
+                handle.write(body)
+            os.replace(temp_name, path)
+        except Exception:
+            if temp_name is not None:
+                try:
+                    os.unlink(temp_name)
+                except OSError:
+                    pass
+
     def _adapter_for(self, provider: Provider, entitlement: Optional[EntitlementContext]):
         if self._adapter_factory:
             return self._adapter_factory(provider, entitlement)
         return self._adapters.get(provider)
 
     def _cache_key(self, provider: Provider, entitlement: Optional[EntitlementContext]) -> str:
-        fingerprint = "default"
-        if entitlement:
-            fingerprint = entitlement.apiKeyFingerprint or fingerprint_api_key(entitlement.apiKey) or "default"
-        return "|".join(
-            [
-                provider,
-                fingerprint,
-                (entitlement.accountId if entitlement else "") or "",
-                (entitlement.region if entitlement else "") or "",
-                (entitlement.environment if entitlement else "") or "",
-                (entitlement.tenantId if entitlement else "") or "",
-                (entitlement.userId if entitlement else "") or "",
-            ]
+        if not entitlement:
+            return _join_cache_key(provider, "default", "", "", "", "", "")
+        return _join_cache_key(
+            provider,
+            entitlement.apiKeyFingerprint or fingerprint_api_key(entitlement.apiKey) or "default",
+            entitlement.accountId or "",
+            entitlement.region or "",
+            entitlement.environment or "",
+            entitlement.tenantId or "",
+            entitlement.userId or "",
         )
 
     def _learned_key(
@@ -201,7 +400,11 @@ class ModelRegistry:
             return None
         expires_at, reason = entry
         if expires_at < _now_timestamp():
-            self._learned.pop(key, None)
+            with self._write_lock:
+                if key in self._learned:
+                    learned = dict(self._learned)
+                    del learned[key]
+                    self._learned = learned
             return None
         return reason
 
@@ -209,68 +412,84 @@ class ModelRegistry:
         self,
         model: ModelMetadata,
         provider: Provider,
-        fetched_at: float,
+        last_verified_at: str,
         entitlement: Optional[EntitlementContext],
     ) -> ModelRecord:
-        modalities = ModelModalities(
-            text=model.capabilities.text,
-            vision=model.capabilities.vision,
-            audioIn=getattr(model.capabilities, "audio_in", None),
-            audioOut=getattr(model.capabilities, "audio_out", None),
-            imageOut=getattr(model.capabilities, "image", None),
-            videoIn=getattr(model.capabilities, "video_in", None),
-            videoOut=getattr(model.capabilities, "video", None),
-        )
-        features = ModelFeatures(
-            tools=model.capabilities.tool_use,
-            jsonMode=model.capabilities.structured_output,
-            jsonSchema=model.capabilities.structured_output,
-            streaming=True,
-        )
-        limits = (
-            ModelLimits(contextTokens=model.contextWindow)
-            if model.contextWindow
-            else None
-        )
-        pricing = (
-            ModelPricing(
-                currency="USD",
-                inputPer1M=model.tokenPrices.input if model.tokenPrices else None,
-                outputPer1M=model.tokenPrices.output if model.tokenPrices else None,
-                source="config",
-            )
-            if model.tokenPrices
-            else None
-        )
+        caps = model.capabilities
+        structured_output = caps.structured_output
+        token_prices = model.tokenPrices
         tags = []
         if model.inPreview:
             tags.append("preview")
         if model.deprecated:
             tags.append("deprecated")
-        availability = ModelAvailability(
-            entitled=True,
-            confidence="listed",
-            lastVerifiedAt=_to_iso(fetched_at),
-        )
-        learned_reason = self._learned_status(provider, entitlement, model.id)
+        learned_reason = self._learned_status(provider, entitlement, model.id) if self._learned else None
         if learned_reason:
-            availability.entitled = False
-            availability.confidence = "learned"
-            availability.reason = learned_reason
+            availability = ModelAvailability(
+                entitled=False,
+                lastVerifiedAt=last_verified_at,
+                confidence="learned",
+                reason=learned_reason,
+            )
+        else:
+            availability = ModelAvailability(entitled=True, lastVerifiedAt=last_verified_at, confidence="listed")
         return ModelRecord(
             id=f"{provider}:{model.id}",
             provider=provider,
             providerModelId=model.id,
             displayName=model.displayName,
-            modalities=modalities,
-            features=features,
-            limits=limits,
+            modalities=ModelModalities(
+                text=caps.text,
+                vision=caps.vision,
+                audioIn=getattr(caps, "audio_in", None),
+                audioOut=getattr(caps, "audio_out", None),
+                imageOut=getattr(caps, "image", None),
+                videoIn=getattr(caps, "video_in", None),
+                videoOut=getattr(caps, "video", None),
+            ),
+            features=ModelFeatures(
+                tools=caps.tool_use,
+                jsonMode=structured_output,
+                jsonSchema=structured_output,
+                streaming=True,
+            ),
+            limits=ModelLimits(contextTokens=model.contextWindow) if model.contextWindow else None,
             tags=tags or None,
-            pricing=pricing,
+            pricing=(
+                ModelPricing(
+                    currency="USD",
+                    inputPer1M=token_prices.input,
+                    outputPer1M=token_prices.output,
+                    source="config",
+                )
+                if token_prices
+                else None
+            ),
             availability=availability,
         )
 
 
+@lru_cache(maxsize=1024)
+def _join_cache_key(
+    provider: str,
+    fingerprint: str,
+    account_id: str,
+    region: str,
+    environment: str,
+    tenant_id: str,
+    user_id: str,
+) -> str:
+    return "|".join((provider, fingerprint, account_id, region, environment, tenant_id, user_id))
+
+
+def _metadata_from_dict(raw: Dict[str, object]) -> ModelMetadata:
+    data = dict(raw)
+    data["capabilities"] = ModelCapabilities(**data["capabilities"])
+    if data.get("tokenPrices") is not None:
+        data["tokenPrices"] = TokenPrices(**data["tokenPrices"])
+    return ModelMetadata(**data)
+
+
 def _now_timestamp() -> float:
     return datetime.now(tz=timezone.utc).timestamp()
 
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from typing import Any, Callable, Dict, Iterable, List, Optional
 
+from .jsonlib import dumps_bytes
+
 
 Provider = str
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelCapabilities:
     text: bool
     vision: bool
@@ -21,13 +23,13 @@ class ModelCapabilities:
     video_in: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenPrices:
     input: Optional[float] = None
     output: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelMetadata:
     id: str
     displayName: str
@@ -42,7 +44,7 @@ class ModelMetadata:
     inputs: Optional[List[Dict[str, Any]]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EntitlementContext:
     provider: Optional[Provider] = None
     apiKey: Optional[str] = None
@@ -54,7 +56,7 @@ class EntitlementContext:
     userId: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelModalities:
     text: bool
     vision: Optional[bool] = None
@@ -65,7 +67,7 @@ class ModelModalities:
     videoOut: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelFeatures:
     tools: Optional[bool] = None
     jsonMode: Optional[bool] = None
@@ -74,13 +76,13 @@ class ModelFeatures:
     batch: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelLimits:
     contextTokens: Optional[int] = None
     maxOutputTokens: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelPricing:
     currency: str = "USD"
     inputPer1M: Optional[float] = None
@@ -91,7 +93,7 @@ class ModelPricing:
     source: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelAvailability:
     entitled: bool
     lastVerifiedAt: Optional[str] = None
@@ -99,7 +101,7 @@ class ModelAvailability:
     reason: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelRecord:
     id: str
     provider: Provider
@@ -113,7 +115,7 @@ class ModelRecord:
     availability: ModelAvailability
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelConstraints:
     requireTools: Optional[bool] = None
     requireJson: Optional[bool] = None
@@ -124,33 +126,33 @@ class ModelConstraints:
     allowPreview: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelResolutionRequest:
     constraints: Optional[ModelConstraints] = None
     preferredModels: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedModel:
     primary: ModelRecord
     fallback: Optional[List[ModelRecord]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentPart:
     type: str
     text: Optional[str] = None
     image: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageInput:
     url: Optional[str] = None
     base64: Optional[str] = None
     mediaType: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioInput:
     url: Optional[str] = None
     base64: Optional[str] = None
@@ -159,7 +161,7 @@ class AudioInput:
     path: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     role: str
     content: List[ContentPart]
@@ -167,33 +169,33 @@ class Message:
     name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolDefinition:
     name: str
     description: Optional[str] = None
     parameters: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolChoice:
     type: str
     name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JsonSchemaFormat:
     name: str
     schema: Dict[str, Any]
     strict: Optional[bool] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseFormat:
     type: str
     jsonSchema: Optional[JsonSchemaFormat] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerateInput:
     provider: Provider
     model: str
@@ -208,7 +210,7 @@ class GenerateInput:
     metadata: Optional[Dict[str, str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageGenerateInput:
     provider: Provider
     model: str
@@ -218,7 +220,7 @@ class ImageGenerateInput:
     parameters: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageGenerateOutput:
     mime: str
     data: str
@@ -226,7 +228,7 @@ class ImageGenerateOutput:
     raw: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MeshGenerateInput:
     provider: Provider
     model: str
@@ -235,14 +237,14 @@ class MeshGenerateInput:
     format: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MeshGenerateOutput:
     data: str
     format: Optional[str] = None
     raw: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LipsyncGenerateInput:
     provider: Provider
     model: str
@@ -256,14 +258,14 @@ class LipsyncGenerateInput:
     parameters: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LipsyncGenerateOutput:
     mime: str
     data: str
     raw: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeechGenerateInput:
     provider: Provider
     model: str
@@ -276,14 +278,14 @@ class SpeechGenerateInput:
     metadata: Optional[Dict[str, str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeechGenerateOutput:
     mime: str
     data: str
     raw: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoGenerateInput:
     provider: Provider
     model: str
@@ -299,7 +301,7 @@ class VideoGenerateInput:
     parameters: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoGenerateOutput:
     mime: str
     data: str
@@ -307,13 +309,13 @@ class VideoGenerateOutput:
     raw: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceAgentAudioConfig:
     input: Optional[Dict[str, Any]] = None
     output: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceAgentInput:
     provider: Provider
     model: str
@@ -330,7 +332,7 @@ class VoiceAgentInput:
     toolHandler: Optional[Callable[["ToolCall"], Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceAgentOutput:
     transcript: Optional[str] = None
     audio: Optional[SpeechGenerateOutput] = None
@@ -338,21 +340,21 @@ class VoiceAgentOutput:
     raw: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptSegment:
     start: float
     end: float
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptWord:
     start: float
     end: float
     word: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscribeInput:
     provider: Provider
     model: str
@@ -365,7 +367,7 @@ class TranscribeInput:
     metadata: Optional[Dict[str, str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscribeOutput:
     text: Optional[str] = None
     language: Optional[str] = None
@@ -376,21 +378,21 @@ class TranscribeOutput:
     cost: Optional[CostBreakdown] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     id: str
     name: str
     argumentsJson: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Usage:
     inputTokens: Optional[int] = None
     outputTokens: Optional[int] = None
     totalTokens: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CostBreakdown:
     input_cost_usd: Optional[float] = None
     output_cost_usd: Optional[float] = None
@@ -398,7 +400,7 @@ class CostBreakdown:
     pricing_per_million: Optional[TokenPrices] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerateOutput:
     text: Optional[str] = None
     toolCalls: Optional[List[ToolCall]] = None
@@ -408,8 +410,10 @@ class GenerateOutput:
     raw: Optional[Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamChunk:
+    # Stream hot paths build text deltas positionally, StreamChunk("delta", text),
+    # which skips keyword binding in __init__; keep these two fields first.
     type: str
     textDelta: Optional[str] = None
     call: Optional[ToolCall] = None
@@ -419,23 +423,148 @@ class StreamChunk:
     cost: Optional[CostBreakdown] = None
     error: Optional[Dict[str, Any]] = None
 
+    def is_text_delta(self) -> bool:
+        """True for a plain text delta, the bulk of any stream, which callers can
+        forward as just ``textDelta`` without serializing the whole chunk."""
+        return (
+            self.type == "delta"
+            and self.textDelta is not None
+            and self.call is None
+            and self.delta is None
+            and self.usage is None
+            and self.finishReason is None
+            and self.cost is None
+            and self.error is None
+        )
+
+
+_JSON_SCALARS = frozenset((str, int, float, bool))
+_TO_JSON_CACHE: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+_COMPILING: set[type] = set()
+
 
 def as_json_dict(obj: Any) -> Any:
-    if hasattr(obj, "__dataclass_fields__"):
-        data = asdict(obj)
-        return {k: v for k, v in data.items() if v is not None}
-    if isinstance(obj, list):
+    # Dataclass fields that are None are dropped, at any depth; so are None
+    # values of a plain dict passed in directly. Free-form dict/Any field values
+    # (tool parameters, JSON schemas, metadata, raw) are copied as-is, nulls
+    # included. Dataclasses go through a serializer generated once per class
+    # (see _compile_to_json) rather than asdict's deep copy.
+    cls = obj.__class__
+    if cls in _JSON_SCALARS:
+        return obj
+    to_json = _TO_JSON_CACHE.get(cls)
+    if to_json is None and hasattr(cls, "__dataclass_fields__"):
+        to_json = _TO_JSON_CACHE[cls] = _compile_to_json(cls)
+    if to_json is not None:
+        return to_json(obj)
+    if cls is list or isinstance(obj, (list, tuple)):
         return [as_json_dict(item) for item in obj]
-    if isinstance(obj, dict):
+    if cls is dict or isinstance(obj, dict):
         return {k: as_json_dict(v) for k, v in obj.items() if v is not None}
     return obj
 
 
-def ensure_messages(messages: Iterable[Message | Dict[str, Any]]) -> List[Dict[str, Any]]:
-    normalized = []
-    for msg in messages:
-        if isinstance(msg, Message):
-            normalized.append(as_json_dict(msg))
-        else:
-            normalized.append(msg)
-    return normalized
+def _plain(obj: Any) -> Any:
+    # Value of a non-dataclass field: copy containers without filtering None,
+    # still serializing any dataclasses found inside.
+    cls = obj.__class__
+    if cls in _JSON_SCALARS:
+        return obj
+    to_json = _TO_JSON_CACHE.get(cls)
+    if to_json is None and hasattr(cls, "__dataclass_fields__"):
+        to_json = _TO_JSON_CACHE[cls] = _compile_to_json(cls)
+    if to_json is not None:
+        return to_json(obj)
+    if isinstance(obj, (list, tuple)):
+        return [_plain(item) for item in obj]
+    if isinstance(obj, dict):
+        return {k: _plain(v) for k, v in obj.items()}
+    return obj
+
+
+# Annotations (strings under postponed evaluation) whose values are stored as-is.
+_SCALAR_ANNOTATIONS = frozenset(
+    name
+    for base in ("str", "int", "float", "bool", "Provider")
+    for name in (base, f"Optional[{base}]")
+)
+
+
+def _compile_to_json(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    # Scalar-typed fields skip the class check and the recursive call entirely,
+    # and fields typed as another dataclass (or a list of one) call that class's
+    # serializer directly; anything else, or a value of an unexpected class,
+    # goes through _plain. Helpers are bound as defaults so the body only
+    # touches fast locals.
+    namespace: Dict[str, Any] = {"_JSON_SCALARS": _JSON_SCALARS, "_plain": _plain}
+    params = ["obj", "_scalars=_JSON_SCALARS", "_walk=_plain"]
+    body = ["    out = {}"]
+    _COMPILING.add(cls)
+    try:
+        for index, field in enumerate(fields(cls)):
+            body.append(f"    value = obj.{field.name}")
+            body.append("    if value is not None:")
+            target = f"        out[{field.name!r}]"
+            annotation = field.type if isinstance(field.type, str) else ""
+            if annotation in _SCALAR_ANNOTATIONS:
+                body.append(f"{target} = value")
+                continue
+            nested, is_list = _dataclass_annotation(annotation)
+            if nested is None or nested in _COMPILING:
+                body.append(f"{target} = value if value.__class__ in _scalars else _walk(value)")
+                continue
+            to_json = _TO_JSON_CACHE.get(nested)
+            if to_json is None:
+                to_json = _TO_JSON_CACHE[nested] = _compile_to_json(nested)
+            namespace[f"_cls_{index}"] = nested
+            namespace[f"_to_json_{index}"] = to_json
+            params += [f"_cls_{index}=_cls_{index}", f"_to_json_{index}=_to_json_{index}"]
+            item = "item" if is_list else "value"
+            convert = f"_to_json_{index}({item}) if {item}.__class__ is _cls_{index} else _walk({item})"
+            if is_list:
+                convert = f"[{convert} for item in value] if value.__class__ is list else _walk(value)"
+            body.append(f"{target} = {convert}")
+    finally:
+        _COMPILING.discard(cls)
+    body.append("    return out")
+    exec("\n".join([f"def to_json({', '.join(params)}):", *body]), namespace)
+    return namespace["to_json"]
+
+
+def _dataclass_annotation(annotation: str) -> tuple[Optional[type], bool]:
+    # Recognizes "X", "List[X]" and their Optional[...] forms for dataclasses
+    # defined in this module.
+    if annotation.startswith("Optional[") and annotation.endswith("]"):
+        annotation = annotation[9:-1]
+    is_list = annotation.startswith("List[") and annotation.endswith("]")
+    if is_list:
+        annotation = annotation[5:-1]
+    candidate = globals().get(annotation)
+    if isinstance(candidate, type) and hasattr(candidate, "__dataclass_fields__"):
+        return candidate, is_list
+    return None, False
+
+
+def to_json_bytes(obj: Any) -> bytes:
+    return dumps_bytes(as_json_dict(obj))
+
+
+def ensure_messages(
+    messages: Iterable[Message | Dict[str, Any]],
+    *,
+    transform: Optional[Callable[[Dict[str, Any], int], Optional[Dict[str, Any]]]] = None,
+) -> List[Dict[str, Any]]:
+    """Normalize messages to plain dicts.
+
+    With ``transform``, each normalized message and its index go straight to the
+    callback and its result is collected instead (``None`` drops the message), so
+    adapters build their provider payload in the same pass.
+    """
+    if transform is None:
+        return [as_json_dict(msg) if isinstance(msg, Message) else msg for msg in messages]
+    output: List[Dict[str, Any]] = []
+    for index, msg in enumerate(messages):
+        mapped = transform(as_json_dict(msg) if isinstance(msg, Message) else msg, index)
+        if mapped is not None:
+            output.append(mapped)
+    return output
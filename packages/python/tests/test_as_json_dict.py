@@ -0,0 +1,56 @@
+import unittest
+
+from ai_kit.types import (
+    ContentPart,
+    GenerateInput,
+    JsonSchemaFormat,
+    Message,
+    ResponseFormat,
+    ToolDefinition,
+    as_json_dict,
+)
+
+
+class AsJsonDictTest(unittest.TestCase):
+    def test_keeps_nulls_inside_tool_parameters(self):
+        parameters = {
+            "type": "object",
+            "properties": {"a": {"type": ["string", "null"], "default": None, "const": None}},
+        }
+        tool = ToolDefinition(name="lookup", description=None, parameters=parameters)
+
+        self.assertEqual(as_json_dict(tool), {"name": "lookup", "parameters": parameters})
+
+    def test_keeps_nulls_inside_json_schema_and_metadata(self):
+        schema = {"type": "object", "examples": [None, {"x": None}]}
+        payload = as_json_dict(
+            GenerateInput(
+                provider="openai",
+                model="m",
+                messages=[],
+                metadata={"trace": None},
+                responseFormat=ResponseFormat(type="json_schema", jsonSchema=JsonSchemaFormat(name="s", schema=schema)),
+            )
+        )
+
+        self.assertEqual(payload["metadata"], {"trace": None})
+        self.assertEqual(payload["responseFormat"], {"type": "json_schema", "jsonSchema": {"name": "s", "schema": schema}})
+
+    def test_drops_none_dataclass_fields_at_any_depth(self):
+        message = Message(role="user", content=[ContentPart(type="text", text="hi")])
+
+        self.assertEqual(as_json_dict(message), {"role": "user", "content": [{"type": "text", "text": "hi"}]})
+
+    def test_copies_free_form_values(self):
+        parameters = {"properties": {}}
+        out = as_json_dict(ToolDefinition(name="t", parameters=parameters))
+        out["parameters"]["properties"]["x"] = 1
+
+        self.assertEqual(parameters, {"properties": {}})
+
+    def test_top_level_dict_drops_none(self):
+        self.assertEqual(as_json_dict({"a": None, "b": {"c": None, "d": 1}}), {"b": {"d": 1}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import asyncio
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from ai_kit.registry import ModelRegistry
+from ai_kit.types import EntitlementContext, ModelCapabilities, ModelMetadata
+
+
+def _model(model_id):
+    return ModelMetadata(
+        id=model_id,
+        displayName=model_id,
+        provider="openai",
+        capabilities=ModelCapabilities(
+            text=True, vision=False, image=False, tool_use=True, structured_output=False, reasoning=False
+        ),
+        family="test",
+        contextWindow=1234,
+    )
+
+
+class _Adapter:
+    def __init__(self, models=None):
+        self.models = models
+        self.calls = 0
+
+    def list_models(self):
+        self.calls += 1
+        if self.models is None:
+            raise RuntimeError("upstream down")
+        return list(self.models)
+
+
+class RegistryDiskCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._dir.name)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _registry(self, adapter, **options):
+        return ModelRegistry({"openai": adapter}, disk_cache_dir=str(self.cache_dir), **options)
+
+    def test_round_trip_serves_fresh_disk_entry_without_fetching(self):
+        models = [_model("zz-test-a"), _model("zz-test-b")]
+        self._registry(_Adapter(models)).list_models()
+
+        adapter = _Adapter(None)
+        self.assertEqual(self._registry(adapter).list_models(), models)
+        self.assertEqual(adapter.calls, 0)
+
+        adapter = _Adapter(None)
+        self.assertEqual(asyncio.run(self._registry(adapter).alist_models()), models)
+        self.assertEqual(adapter.calls, 0)
+
+    def test_stale_disk_entry_is_the_fallback_when_fetch_fails(self):
+        models = [_model("zz-test-a")]
+        self._registry(_Adapter(models)).list_models()
+        (path,) = self.cache_dir.iterdir()
+        payload = json.loads(path.read_text())
+        payload["fetched_at"] = time.time() - 10 * 86400
+        path.write_text(json.dumps(payload))
+
+        adapter = _Adapter(None)
+        self.assertEqual(self._registry(adapter).list_models(), models)
+        self.assertEqual(adapter.calls, 1)
+        self.assertEqual(asyncio.run(self._registry(_Adapter(None)).alist_models()), models)
+
+        with self.assertRaisesRegex(RuntimeError, "upstream down"):
+            self._registry(_Adapter(None), disk_cache_ttl_seconds=0).list_models(
+                entitlement=EntitlementContext(provider="openai", apiKey="sk-other")
+            )
+
+    def test_file_name_ignores_key_contents(self):
+        adapter = _Adapter([_model("zz-test-a")])
+        registry = ModelRegistry(
+            {},
+            adapter_factory=lambda provider, entitlement: adapter,
+            disk_cache_dir=str(self.cache_dir),
+        )
+        registry.list_models(entitlement=EntitlementContext(provider="../../escape", apiKey="sk-test"))
+        (path,) = self.cache_dir.iterdir()
+        self.assertEqual(path.parent, self.cache_dir)
+        self.assertRegex(path.name, r"^models_[0-9a-f]{32}\.json$")
+
+    def test_failed_replace_leaves_no_temp_file(self):
+        registry = self._registry(_Adapter([_model("zz-test-a")]))
+        with mock.patch("ai_kit.registry.os.replace", side_effect=OSError("read-only")):
+            registry.list_models()
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()